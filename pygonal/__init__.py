@@ -24,18 +24,17 @@
 
 __all__ = ('TransformNotInvertibleError', 'set_epsilon',
     'Vec2', 'Point', 'Vec2Array', 'Seq2',
-    'Line', 'Ray', 'LineSegment',
-    'Affine', 'BoundingBox', 'Polygon')
+    'Line', 'Ray', 'LineSegment', 'Polyline',
+    'Affine', 'BoundingBox', 'BoxArray', 'Circle', 'Polygon',
+    'PolygonCollection', 'PolygonWithHoles', 'MultiPolygon',
+    'KDTree', 'PropertyCache', 'GridVec2Array', 'GridPolygon')
+
+import importlib
+import sys
 
 __versioninfo__ = (0, 1, 0)
 __version__ = '.'.join(str(n) for n in __versioninfo__)
 
-from pygonal.vector import Vec2, Vec2Array, Seq2
-from pygonal.transform import Affine
-from pygonal.line import Line, Ray, LineSegment
-from pygonal.box import BoundingBox
-from pygonal.polygon import Polygon
-
 class TransformNotInvertibleError(Exception):
     """The transform could not be inverted"""
 
@@ -43,10 +42,51 @@ def _set_epsilon(e): pass
 
 __implementation__ = 'Python'
 
-Point = Vec2
-"""``Point`` is an alias for ``Vec2``.
-Use ``Point`` where desired for clarity in your code.
-"""
+# Public names are resolved lazily from their submodules on first access,
+# so that e.g. ``from pygonal import Vec2`` does not pay for importing the
+# polygon, index and I/O code. ``Point`` is an alias for ``Vec2``; use it
+# where desired for clarity in your code.
+_lazy_names = {
+    'Vec2': ('pygonal.vector', 'Vec2'),
+    'Point': ('pygonal.vector', 'Vec2'),
+    'Vec2Array': ('pygonal.vector', 'Vec2Array'),
+    'Seq2': ('pygonal.vector', 'Seq2'),
+    'Affine': ('pygonal.transform', 'Affine'),
+    'Line': ('pygonal.line', 'Line'),
+    'Ray': ('pygonal.line', 'Ray'),
+    'LineSegment': ('pygonal.line', 'LineSegment'),
+    'Polyline': ('pygonal.polyline', 'Polyline'),
+    'BoundingBox': ('pygonal.box', 'BoundingBox'),
+    'BoxArray': ('pygonal.box', 'BoxArray'),
+    'Circle': ('pygonal.circle', 'Circle'),
+    'Polygon': ('pygonal.polygon', 'Polygon'),
+    'PolygonCollection': ('pygonal.collection', 'PolygonCollection'),
+    'PolygonWithHoles': ('pygonal.multipolygon', 'PolygonWithHoles'),
+    'MultiPolygon': ('pygonal.multipolygon', 'MultiPolygon'),
+    'KDTree': ('pygonal.kdtree', 'KDTree'),
+    'PropertyCache': ('pygonal.cache', 'PropertyCache'),
+    'GridVec2Array': ('pygonal.grid', 'GridVec2Array'),
+    'GridPolygon': ('pygonal.grid', 'GridPolygon'),
+}
+
+def __getattr__(name):
+    try:
+        module_name, attr = _lazy_names[name]
+    except KeyError:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ is not supported, import everything up front
+    for _name in _lazy_names:
+        __getattr__(_name)
+    del _name
 
 def set_epsilon(epsilon):
     """Set the global absolute error value and rounding limit for approximate
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+import asyncio
+import pygonal
+from pygonal.parallel import prewarm
+from pygonal.polygon import _adaptive_quick_hull
+
+# Awaitable variants of the expensive operations for use in asyncio
+# applications. Work on large inputs is done in chunks: without an
+# executor, the chunks run in the event loop thread and control is yielded
+# to other tasks between them; with an executor, the chunks are run there
+# and the event loop is never blocked by them.
+
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def _chunks(points, chunk_size):
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if isinstance(points, pygonal.Seq2):
+        points = points._vectors
+    elif not isinstance(points, (list, tuple)):
+        points = list(points)
+    return [points[i:i + chunk_size]
+        for i in range(0, len(points), chunk_size)]
+
+async def contains_points(shape, points, chunk_size=DEFAULT_CHUNK_SIZE,
+    executor=None):
+    """Return a list of bools indicating which of the specified points
+    are contained in a shape, processing the points in chunks.
+
+    :param shape: A shape with a ``contains_points()`` method, e.g. a
+        :class:`~pygonal.Polygon`.
+    :param points: Sequence of point vectors, e.g. a
+        :class:`~pygonal.Vec2Array`.
+    :param chunk_size: The number of points tested at a time.
+    :type chunk_size: int
+    :param executor: An optional :class:`concurrent.futures.Executor` to
+        run the chunks in. Otherwise they run in the event loop, yielding
+        between chunks.
+    :rtype: list of bool
+    """
+    chunks = _chunks(points, chunk_size)
+    mask = []
+    if not chunks:
+        return mask
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, prewarm, shape, chunks[0][0])
+        results = await asyncio.gather(*[
+            loop.run_in_executor(executor, shape.contains_points, chunk)
+            for chunk in chunks])
+        for result in results:
+            mask.extend(result)
+    else:
+        prewarm(shape, chunks[0][0])
+        for chunk in chunks:
+            await asyncio.sleep(0)
+            mask.extend(shape.contains_points(chunk))
+    return mask
+
+async def convex_hull(points, chunk_size=DEFAULT_CHUNK_SIZE, executor=None):
+    """Return a new polygon that is the convex hull of the supplied
+    sequence of points, see :meth:`pygonal.Polygon.convex_hull`.
+
+    The hull is computed incrementally: each chunk of points is combined
+    with the hull of the points before it. With an executor, the hulls of
+    the chunks are computed concurrently and then combined.
+
+    :param points: A sequence of points.
+    :param chunk_size: The number of points processed at a time.
+    :type chunk_size: int
+    :param executor: An optional :class:`concurrent.futures.Executor` to
+        run the chunks in.
+    :rtype: :class:`~pygonal.Polygon`
+    """
+    if isinstance(points, pygonal.Polygon):
+        if points.is_convex_known and points.is_convex:
+            return points.__copy__()
+    chunks = _chunks(points, chunk_size)
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        hulls = await asyncio.gather(*[
+            loop.run_in_executor(executor, _adaptive_quick_hull, chunk)
+            for chunk in chunks])
+        hull_points = []
+        for hull in hulls:
+            hull_points.extend(hull)
+        hull = await loop.run_in_executor(
+            executor, _adaptive_quick_hull, hull_points)
+    else:
+        hull = []
+        for chunk in chunks:
+            await asyncio.sleep(0)
+            hull = _adaptive_quick_hull(hull + list(chunk))
+    return pygonal.Polygon(hull, is_convex=True)
+
+async def is_convex(polygon, executor=None):
+    """Return True if the polygon is convex, classifying the polygon in
+    an executor if this is not known yet. See
+    :attr:`pygonal.Polygon.is_convex`.
+
+    :type polygon: :class:`~pygonal.Polygon`
+    :param executor: The :class:`concurrent.futures.Executor` used, or
+        None for the event loop's default executor.
+    :rtype: bool
+    """
+    if not polygon.is_convex_known:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, polygon._classify)
+    return polygon.is_convex
+
+async def is_simple(polygon, executor=None):
+    """Return True if the polygon is simple, checking the polygon for
+    self-intersections in an executor if this is not known yet. See
+    :attr:`pygonal.Polygon.is_simple`.
+
+    :type polygon: :class:`~pygonal.Polygon`
+    :param executor: The :class:`concurrent.futures.Executor` used, or
+        None for the event loop's default executor.
+    :rtype: bool
+    """
+    if not polygon.is_simple_known:
+        await is_convex(polygon, executor)
+        if not polygon.is_simple_known:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(executor, polygon._check_is_simple)
+    return polygon.is_simple
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
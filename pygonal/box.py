@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from __future__ import division
+import struct
+from array import array
 import pygonal
 from pygonal.util import cached_property
 '''
@@ -123,16 +125,18 @@ class BoundingBox(object):
         except StopIteration:
             raise ValueError(
                 "BoundingBox.from_shapes(): requires at least one shape")
-        min_x, min_y = shape.bounding_box.min_point
-        max_x, max_y = shape.bounding_box.max_point
+        bbox = shape.bounding_box
+        min_x, min_y = bbox.min_point
+        max_x, max_y = bbox.max_point
 
         for shape in shapes:
-            x, y = shape.bounding_box.min_point
+            bbox = shape.bounding_box
+            x, y = bbox.min_point
             if x < min_x:
                 min_x = x
             if y < min_y:
                 min_y = y
-            x, y = shape.bounding_box.max_point
+            x, y = bbox.max_point
             if x > max_x:
                 max_x = x
             if y > max_y:
@@ -188,8 +192,41 @@ class BoundingBox(object):
         :rtype: bool
         """
         x, y = point
-        return (self._min.x <= x < self._max.x
-            and self._min.y < y <= self._max.y)
+        min_x, min_y = self._min
+        max_x, max_y = self._max
+        return min_x <= x < max_x and min_y < y <= max_y
+
+    def contains_points(self, points):
+        """Return a list of bools indicating which of the specified
+        points are contained in the box. See :meth:`contains_point`.
+
+        :param points: Iterable of point vectors, e.g. a
+            :class:`~pygonal.Vec2Array`.
+        :rtype: list of bool
+        """
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        min_x, min_y = self._min
+        max_x, max_y = self._max
+        return [min_x <= x < max_x and min_y < y <= max_y
+            for x, y in points]
+
+    def filter(self, points):
+        """Iterate over the specified points that are contained in the
+        box. See :meth:`contains_point`. Points are consumed lazily, so
+        this can be used on streams of points of any length.
+
+        :param points: Iterable of point vectors, e.g. a
+            :class:`~pygonal.Vec2Array`.
+        """
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        min_x, min_y = self._min
+        max_x, max_y = self._max
+        for point in points:
+            x, y = point
+            if min_x <= x < max_x and min_y < y <= max_y:
+                yield point
 
     def fit(self, shape):
         """Create a new shape by translating and scaling shape so that
@@ -260,5 +297,296 @@ class BoundingBox(object):
     __rmul__ = __mul__
 
 
+class BoxArray(object):
+    """Sequence of axis-aligned boxes for batch operations.
+
+    The box corners are stored in four flat arrays of floats rather than
+    as individual :class:`BoundingBox` objects, which keeps large
+    collections of boxes compact and the batch operations below free of
+    per-box attribute lookups.
+
+    :param shapes: Iterable of :class:`BoundingBox` objects, or any
+        shapes with a ``bounding_box`` attribute.
+    :param typecode: The array typecode of the corner coordinates, ``'d'``
+        for double precision or ``'f'`` for single precision, which halves
+        the memory used. In single precision, the boxes are rounded
+        outward, so that each stored box encloses the original box.
+    :type typecode: str
+    """
+
+    def __init__(self, shapes=(), typecode='d'):
+        min_xs = array('d')
+        min_ys = array('d')
+        max_xs = array('d')
+        max_ys = array('d')
+        for shape in shapes:
+            bbox = shape.bounding_box
+            min_x, min_y = bbox._min
+            max_x, max_y = bbox._max
+            min_xs.append(min_x)
+            min_ys.append(min_y)
+            max_xs.append(max_x)
+            max_ys.append(max_y)
+        self._set_arrays(min_xs, min_ys, max_xs, max_ys, typecode)
+
+    @classmethod
+    def from_arrays(cls, min_x, min_y, max_x, max_y, typecode='d'):
+        """Create a box array from sequences of corner coordinates. The
+        i-th box spans from ``(min_x[i], min_y[i])`` to
+        ``(max_x[i], max_y[i])``.
+
+        :param typecode: ``'d'`` or ``'f'``, see :class:`BoxArray`.
+        :type typecode: str
+        """
+        if not len(min_x) == len(min_y) == len(max_x) == len(max_y):
+            raise ValueError(
+                "BoxArray.from_arrays(): sequences must have equal length")
+        self = cls.__new__(cls)
+        self._set_arrays(min_x, min_y, max_x, max_y, typecode)
+        return self
+
+    def _set_arrays(self, min_x, min_y, max_x, max_y, typecode):
+        if typecode == 'd':
+            self._min_x = array('d', min_x)
+            self._min_y = array('d', min_y)
+            self._max_x = array('d', max_x)
+            self._max_y = array('d', max_y)
+        elif typecode == 'f':
+            self._min_x = _float32_outward(min_x, True)
+            self._min_y = _float32_outward(min_y, True)
+            self._max_x = _float32_outward(max_x, False)
+            self._max_y = _float32_outward(max_y, False)
+        else:
+            raise ValueError("BoxArray(): typecode must be 'd' or 'f', not %r"
+                % (typecode,))
+
+    @property
+    def typecode(self):
+        """The typecode of the coordinate arrays, ``'d'`` for double
+        precision or ``'f'`` for single precision.
+        """
+        return self._min_x.typecode
+
+    def __len__(self):
+        return len(self._min_x)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.from_arrays(self._min_x[index], self._min_y[index],
+                self._max_x[index], self._max_y[index], self.typecode)
+        box = BoundingBox.__new__(BoundingBox)
+        box._min = pygonal.Vec2(self._min_x[index], self._min_y[index])
+        box._max = pygonal.Vec2(self._max_x[index], self._max_y[index])
+        return box
+
+    def __iter__(self):
+        for i in range(len(self._min_x)):
+            yield self[i]
+
+    def __eq__(self, other):
+        return (self.__class__ is other.__class__
+            and self._min_x == other._min_x and self._min_y == other._min_y
+            and self._max_x == other._max_x and self._max_y == other._max_y)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        raise TypeError("unhashable type: %s" % self.__class__.__name__)
+
+    def __repr__(self):
+        return "BoxArray([%s])" % ', '.join(repr(box) for box in self)
+
+    __str__ = __repr__
+
+    @property
+    def bounding_box(self):
+        """The bounding box enclosing all boxes in the array."""
+        if not len(self._min_x):
+            raise ValueError("BoxArray.bounding_box: array is empty")
+        return BoundingBox([(min(self._min_x), min(self._min_y)),
+            (max(self._max_x), max(self._max_y))])
+
+    def areas(self):
+        """Return the areas of the boxes.
+
+        :rtype: array of float
+        """
+        return array('d', [(x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in zip(
+            self._min_x, self._min_y, self._max_x, self._max_y)])
+
+    def _check_length(self, other, operation):
+        if len(other) != len(self._min_x):
+            raise ValueError("BoxArray.%s(): expected %d items, got %d"
+                % (operation, len(self._min_x), len(other)))
+
+    def contains_point(self, point):
+        """Return a list of bools indicating which of the boxes contain
+        the specified point. Uses the same boundary rules as
+        :meth:`BoundingBox.contains_point`.
+
+        :param point: A point vector.
+        :type point: :class:`~pygonal.Vec2`
+        :rtype: list of bool
+        """
+        x, y = point
+        return [x0 <= x < x1 and y0 < y <= y1 for x0, y0, x1, y1 in zip(
+            self._min_x, self._min_y, self._max_x, self._max_y)]
+
+    def contains_points(self, points):
+        """Return a list of bools indicating whether each box contains
+        the point at the same position in ``points``.
+
+        :param points: Sequence of points, one for each box.
+        :rtype: list of bool
+        """
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        self._check_length(points, 'contains_points')
+        return [x0 <= x < x1 and y0 < y <= y1
+            for x0, y0, x1, y1, (x, y) in zip(self._min_x, self._min_y,
+                self._max_x, self._max_y, points)]
+
+    def intersects(self, other):
+        """Return a list of bools indicating which boxes overlap another.
+        Boxes that only touch at their edges are considered to overlap.
+
+        :param other: If a single box, each box in the array is tested
+            against it. If a :class:`BoxArray` of the same length, the
+            boxes are tested pairwise.
+        :rtype: list of bool
+        """
+        if isinstance(other, BoxArray):
+            self._check_length(other, 'intersects')
+            return [ax0 <= bx1 and bx0 <= ax1 and ay0 <= by1 and by0 <= ay1
+                for ax0, ay0, ax1, ay1, bx0, by0, bx1, by1 in zip(
+                    self._min_x, self._min_y, self._max_x, self._max_y,
+                    other._min_x, other._min_y, other._max_x, other._max_y)]
+        bbox = other.bounding_box
+        bx0, by0 = bbox._min
+        bx1, by1 = bbox._max
+        return [ax0 <= bx1 and bx0 <= ax1 and ay0 <= by1 and by0 <= ay1
+            for ax0, ay0, ax1, ay1 in zip(
+                self._min_x, self._min_y, self._max_x, self._max_y)]
+
+    def _pairwise(self, other, operation):
+        if isinstance(other, BoxArray):
+            self._check_length(other, operation)
+            return other._min_x, other._min_y, other._max_x, other._max_y
+        bbox = other.bounding_box
+        count = len(self._min_x)
+        return ([bbox._min.x] * count, [bbox._min.y] * count,
+            [bbox._max.x] * count, [bbox._max.y] * count)
+
+    def union(self, other):
+        """Return the boxes enclosing each box and another box.
+
+        :param other: A single box, or a :class:`BoxArray` of the same
+            length to combine pairwise.
+        :rtype: BoxArray
+        """
+        bx0, by0, bx1, by1 = self._pairwise(other, 'union')
+        return self.from_arrays(
+            list(map(min, self._min_x, bx0)), list(map(min, self._min_y, by0)),
+            list(map(max, self._max_x, bx1)), list(map(max, self._max_y, by1)),
+            self.typecode)
+
+    def intersection(self, other):
+        """Return the overlapping regions of each box and another box.
+        Where the boxes do not overlap, the result is clamped to an empty
+        box of zero area, use :meth:`intersects` to tell these apart.
+
+        :param other: A single box, or a :class:`BoxArray` of the same
+            length to intersect pairwise.
+        :rtype: BoxArray
+        """
+        bx0, by0, bx1, by1 = self._pairwise(other, 'intersection')
+        min_x = list(map(max, self._min_x, bx0))
+        min_y = list(map(max, self._min_y, by0))
+        max_x = list(map(max, min_x, map(min, self._max_x, bx1)))
+        max_y = list(map(max, min_y, map(min, self._max_y, by1)))
+        return self.from_arrays(min_x, min_y, max_x, max_y, self.typecode)
+
+    def overlapping_pairs(self, other=None):
+        """Find all pairs of overlapping boxes using sweep and prune.
+
+        The boxes are sorted by their minimum x coordinate and swept from
+        left to right, keeping only the boxes whose x extent still covers
+        the sweep position. Runtime complexity is O(n log n + k) for k
+        overlapping pairs, provided that few boxes share the same x range.
+        Boxes that only touch at their edges are considered to overlap.
+
+        :param other: If omitted, the pairs ``(i, j)`` with ``i < j`` of
+            overlapping boxes within this array are returned. If another
+            :class:`BoxArray`, the pairs ``(i, j)`` of box ``i`` in this
+            array overlapping box ``j`` in the other are returned.
+        :rtype: sorted list of tuples
+        """
+        if other is None:
+            sources = [self]
+        else:
+            sources = [self, other]
+        events = []
+        for tag, boxes in enumerate(sources):
+            events.extend(zip(boxes._min_x, [tag] * len(boxes),
+                range(len(boxes))))
+        events.sort()
+        active = [[] for boxes in sources]
+        pairs = []
+        add = pairs.append
+        for x, tag, i in events:
+            boxes = sources[tag]
+            y0 = boxes._min_y[i]
+            y1 = boxes._max_y[i]
+            # Test against the opposite source for joins, or against the
+            # same source for self-overlap
+            other_tag = len(sources) - 1 - tag
+            others = sources[other_tag]
+            max_x = others._max_x
+            min_y = others._min_y
+            max_y = others._max_y
+            still_active = [j for j in active[other_tag] if max_x[j] >= x]
+            active[other_tag] = still_active
+            for j in still_active:
+                if min_y[j] <= y1 and y0 <= max_y[j]:
+                    if tag == other_tag:
+                        add((j, i) if j < i else (i, j))
+                    elif tag:
+                        add((j, i))
+                    else:
+                        add((i, j))
+            active[tag].append(i)
+        pairs.sort()
+        return pairs
+
+
+def _float32_outward(values, down):
+    """Return the values in an array('f'), each rounded down or up to the
+    nearest single precision float.
+    """
+    result = array('f', values)
+    if isinstance(values, array) and values.typecode == 'f':
+        return result
+    for i, value in enumerate(values):
+        stored = result[i]
+        if stored > value if down else stored < value:
+            result[i] = _next_float32(stored, down)
+    return result
+
+def _next_float32(value, down):
+    """Return the adjacent single precision float below or above a value
+    representable in single precision.
+    """
+    if not value:
+        bits = 0x80000001 if down else 1
+    else:
+        bits = struct.unpack('<I', struct.pack('<f', value))[0]
+        if (value > 0.0) != down:
+            bits += 1 # away from zero
+        else:
+            bits -= 1
+    return struct.unpack('<f', struct.pack('<I', bits))[0]
+
+
 # vim: ai ts=4 sts=4 et sw=4 tw=78
 
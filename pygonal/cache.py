@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+import threading
+from collections import OrderedDict
+
+
+class PropertyCache(object):
+    """Size-bounded, thread-safe least-recently-used cache of derived
+    polygon properties, keyed by the polygon fingerprint.
+
+    A cache is enabled for all polygons by assigning it to
+    :attr:`Polygon.property_cache <pygonal.Polygon.property_cache>`::
+
+        Polygon.property_cache = PropertyCache(maxsize=10000)
+
+    Polygons then store their derived properties in the cache when they
+    are computed, and new polygons with the same vertices are initialized
+    from the cache on construction.
+
+    :param maxsize: The maximum number of polygons cached. When the cache
+        is full, the least recently used entry is discarded.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("PropertyCache(): maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Return the properties cached for key, or None if there are
+        none. Updates the hit and miss counters.
+
+        :rtype: dict
+        """
+        with self._lock:
+            entries = self._entries
+            props = entries.pop(key, None)
+            if props is None:
+                self.misses += 1
+                return None
+            entries[key] = props
+            self.hits += 1
+            return props.copy()
+
+    def put(self, key, props):
+        """Add properties for key to the cache, merging them with any
+        properties already cached for it.
+
+        :type props: dict
+        """
+        with self._lock:
+            entries = self._entries
+            cached = entries.pop(key, None)
+            if cached is not None:
+                cached.update(props)
+                props = cached
+            else:
+                props = dict(props)
+            entries[key] = props
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries from the cache and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __repr__(self):
+        return "PropertyCache(maxsize=%r) <%d entries, %d hits, %d misses>" % (
+            self.maxsize, len(self._entries), self.hits, self.misses)
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
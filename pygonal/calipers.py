@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+import pygonal
+
+# Rotating calipers algorithms on convex hulls. All functions accept either
+# a polygon or a sequence of points. The convex hull is computed first using
+# Polygon.convex_hull(), which returns a copy without further work if the
+# polygon is already known to be convex. Collinear points are handled
+# separately, since their hull has no area. After that, each function runs
+# in O(h) time, where h is the number of hull vertices.
+
+
+def _hull(points):
+    """Return the vertices of the convex hull of points as a list
+    in counter-clockwise order without repeated vertices.
+
+    If all points lie on one line, the hull has zero area and only its
+    two extreme points along that line are returned.
+    """
+    unique = []
+    seen = set()
+    for p in points:
+        p = pygonal.Vec2(*p)
+        if p not in seen:
+            seen.add(p)
+            unique.append(p)
+    if not unique:
+        raise ValueError("Expected at least one point")
+    if len(unique) < 3:
+        return unique
+    # Measure against the point furthest from an arbitrary first point,
+    # so that the direction is not skewed by two nearby points
+    first = unique[0]
+    direction = max((p - first for p in unique), key=lambda d: d.length2)
+    tolerance = pygonal.EPSILON * direction.length
+    if all(abs(direction.cross(p - first)) < tolerance for p in unique):
+        key = direction.dot
+        return [min(unique, key=key), max(unique, key=key)]
+    if isinstance(points, pygonal.Polygon):
+        hull = pygonal.Polygon.convex_hull(points)._ccw_vertices()
+        return [v for i, v in enumerate(hull) if v != hull[i - 1]]
+    return pygonal.Polygon.convex_hull(unique)._ccw_vertices()
+
+
+def diameter(points):
+    """Return the diameter of a set of points, i.e. the largest distance
+    between any two of them, as a tuple ``(distance, a, b)`` where ``a``
+    and ``b`` are the two points furthest apart.
+
+    :param points: A polygon or sequence of points.
+    :rtype: tuple
+    """
+    hull = _hull(points)
+    count = len(hull)
+    if count == 1:
+        return 0.0, hull[0], hull[0]
+    best = -1.0
+    k = 1
+    for i in range(count):
+        a = hull[i]
+        b = hull[(i + 1) % count]
+        ex, ey = b - a
+        # Advance k to the vertex antipodal to the edge a->b
+        while True:
+            c = hull[k]
+            d = hull[(k + 1) % count]
+            if ex * (d[1] - c[1]) - ey * (d[0] - c[0]) > 0.0:
+                k = (k + 1) % count
+            else:
+                break
+        for p in (a, b):
+            for q in (hull[k], hull[(k + 1) % count]):
+                dist = p.distance_to(q)
+                if dist > best:
+                    best = dist
+                    pair = (p, q)
+    return best, pair[0], pair[1]
+
+
+def width(points):
+    """Return the width of a set of points, i.e. the smallest distance
+    between two parallel lines enclosing them, as a tuple
+    ``(distance, normal)`` where ``normal`` is the unit vector
+    perpendicular to the enclosing lines.
+
+    :param points: A polygon or sequence of points.
+    :rtype: tuple
+    """
+    hull = _hull(points)
+    count = len(hull)
+    if count < 3:
+        if count == 1:
+            return 0.0, pygonal.Vec2(0, 1)
+        return 0.0, (hull[1] - hull[0]).perpendicular().normalized()
+    best = None
+    k = 1
+    for i in range(count):
+        a = hull[i]
+        edge = hull[(i + 1) % count] - a
+        normal = edge.perpendicular().normalized()
+        if normal.is_null:
+            continue
+        k = _advance(hull, k, normal)
+        dist = normal.dot(hull[k] - a)
+        if best is None or dist < best:
+            best = dist
+            best_normal = normal
+    return best, best_normal
+
+
+def _advance(hull, index, direction):
+    """Advance the index along the hull while the vertices extend
+    further in the given direction.
+    """
+    count = len(hull)
+    dx, dy = direction
+    x, y = hull[index]
+    extent = dx * x + dy * y
+    for _ in range(count):
+        x, y = hull[(index + 1) % count]
+        next_extent = dx * x + dy * y
+        if next_extent < extent:
+            break
+        index = (index + 1) % count
+        extent = next_extent
+    return index
+
+
+def _min_rect(points, measure):
+    """Return the enclosing rectangle of points aligned with one of
+    the hull edges that minimizes ``measure(width, height)``.
+    """
+    hull = _hull(points)
+    count = len(hull)
+    if count < 3:
+        if count == 1:
+            return pygonal.BoundingBox(hull), pygonal.Affine.identity()
+        angle = (hull[1] - hull[0]).angle
+        transform = pygonal.Affine.rotation(angle)
+        inverse = ~transform
+        return pygonal.BoundingBox(inverse * p for p in hull), transform
+    best = None
+    right = top = left = 0
+    for i in range(count):
+        a = hull[i]
+        u = (hull[(i + 1) % count] - a).normalized()
+        if u.is_null:
+            continue
+        v = u.perpendicular()
+        if best is None:
+            # Position the calipers for the first edge
+            right = _advance(hull, i, u)
+            top = _advance(hull, right, v)
+            left = _advance(hull, top, -u)
+        else:
+            right = _advance(hull, right, u)
+            top = _advance(hull, top, v)
+            left = _advance(hull, left, -u)
+        min_x = u.dot(hull[left])
+        max_x = u.dot(hull[right])
+        min_y = v.dot(a)
+        max_y = v.dot(hull[top])
+        value = measure(max_x - min_x, max_y - min_y)
+        if best is None or value < best:
+            best = value
+            best_u = u
+            corners = [(min_x, min_y), (max_x, max_y)]
+    transform = pygonal.Affine.rotation(best_u.angle)
+    return pygonal.BoundingBox(corners), transform
+
+
+def min_area_rect(points):
+    """Return the minimum-area enclosing rectangle of a set of points.
+
+    The rectangle is returned as a tuple ``(box, transform)``, where
+    ``box`` is a :class:`~pygonal.BoundingBox` in the rectangle's own
+    coordinate frame, and ``transform`` is the :class:`~pygonal.Affine`
+    rotation that maps this frame back to the original coordinates. Thus
+    ``box.to_polygon() * transform`` is the rectangle as a polygon, and
+    ``points * ~transform`` aligns the points with the rectangle axes.
+
+    :param points: A polygon or sequence of points.
+    :rtype: tuple
+    """
+    return _min_rect(points, lambda w, h: w * h)
+
+
+def min_perimeter_rect(points):
+    """Return the minimum-perimeter enclosing rectangle of a set of points
+    as a tuple ``(box, transform)``. See :func:`min_area_rect` for
+    a description of the result.
+
+    :param points: A polygon or sequence of points.
+    :rtype: tuple
+    """
+    return _min_rect(points, lambda w, h: w + h)
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+import math
+import random
+import pygonal
+
+
+class Circle(object):
+    """An immutable circle described by a center point and radius.
+
+    :param center: The center point of the circle.
+    :type center: :class:`~pygonal.Vec2`
+    :param radius: The radius of the circle, must not be negative.
+    :type radius: float
+    """
+
+    def __init__(self, center, radius):
+        if radius < 0:
+            raise ValueError("Circle(): radius must not be negative")
+        self._center = pygonal.Vec2(*center)
+        self._radius = radius * 1.0
+        self._radius2 = self._radius * self._radius
+
+    @classmethod
+    def from_points(cls, points):
+        """Create the minimum enclosing circle of the specified points.
+
+        The circle is computed using Welzl's randomized incremental
+        algorithm, written as three nested loops over the shuffled points
+        rather than recursively, thus the expected runtime complexity is
+        O(n).
+
+        :param points: Iterable containing one or more points.
+        :rtype: Circle
+        """
+        points = [tuple(p) for p in points]
+        if not points:
+            raise ValueError(
+                'Circle.from_points(): requires at least one point')
+        random.shuffle(points)
+        cx, cy = points[0]
+        r2 = 0.0
+        # Allow for rounding error in the circles constructed below
+        slack = 1.0 + 1e-12
+        for i, (px, py) in enumerate(points):
+            if (px - cx)**2 + (py - cy)**2 <= r2 * slack:
+                continue
+            cx, cy, r2 = px, py, 0.0
+            for j in range(i):
+                qx, qy = points[j]
+                if (qx - cx)**2 + (qy - cy)**2 <= r2 * slack:
+                    continue
+                cx = (px + qx) * 0.5
+                cy = (py + qy) * 0.5
+                r2 = (px - cx)**2 + (py - cy)**2
+                for k in range(j):
+                    sx, sy = points[k]
+                    if (sx - cx)**2 + (sy - cy)**2 <= r2 * slack:
+                        continue
+                    cx, cy, r2 = _circumcircle(px, py, qx, qy, sx, sy)
+        circle = object.__new__(cls)
+        circle._center = pygonal.Vec2(cx, cy)
+        circle._radius = math.sqrt(r2)
+        circle._radius2 = r2
+        return circle
+
+    @property
+    def center(self):
+        """The center point of the circle."""
+        return self._center
+
+    @property
+    def radius(self):
+        """The radius of the circle."""
+        return self._radius
+
+    @property
+    def area(self):
+        """The area of the circle."""
+        return math.pi * self._radius2
+
+    @property
+    def bounding_box(self):
+        """The bounding box of the circle."""
+        cx, cy = self._center
+        r = self._radius
+        return pygonal.BoundingBox([(cx - r, cy - r), (cx + r, cy + r)])
+
+    def contains_point(self, point):
+        """Return True if the circle contains the specified point. Points
+        on the circumference are considered inside.
+
+        :param point: A point vector.
+        :type point: :class:`~pygonal.Vec2`
+        :rtype: bool
+        """
+        px, py = point
+        cx, cy = self._center
+        return (px - cx)**2 + (py - cy)**2 <= self._radius2
+
+    def contains_points(self, points):
+        """Return a list of bools indicating which of the specified
+        points are contained in the circle.
+
+        :param points: Iterable of point vectors.
+        :rtype: list of bool
+        """
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        cx, cy = self._center
+        r2 = self._radius2
+        return [(px - cx)**2 + (py - cy)**2 <= r2 for px, py in points]
+
+    def __eq__(self, other):
+        return (self.__class__ is other.__class__
+            and self._center == other._center
+            and self._radius == other._radius)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self._center, self._radius))
+
+    def almost_equals(self, other):
+        """Return True if this circle is approximately equal to another
+        circle, within precision limits.
+        """
+        return (self.__class__ is other.__class__
+            and self._center.almost_equals(other._center)
+            and abs(self._radius - other._radius) < pygonal.EPSILON)
+
+    def __repr__(self):
+        """Precise string representation."""
+        return "Circle((%r, %r), %r)" % (
+            self._center.x, self._center.y, self._radius)
+
+    __str__ = __repr__
+
+    def __mul__(self, other):
+        """Transform the circle. Only transforms that preserve the
+        shape of circles, i.e. combinations of translation, rotation
+        and uniform scaling, are supported.
+        """
+        try:
+            conformal = other.is_conformal
+        except AttributeError:
+            return NotImplemented
+        sx, sy, _ = other.column_vectors
+        if not conformal or abs(sx.length - sy.length) >= pygonal.EPSILON:
+            raise TypeError("Circle can only be transformed by translation, "
+                "rotation and uniform scaling")
+        return Circle(self._center * other, self._radius * sx.length)
+
+    __rmul__ = __mul__
+
+
+def _circumcircle(ax, ay, bx, by, cx, cy):
+    """Return the center and squared radius of the circle passing
+    through the three points. If the points are collinear, the circle
+    through the two points furthest apart is returned.
+    """
+    bx -= ax
+    by -= ay
+    cx -= ax
+    cy -= ay
+    d = 2.0 * (bx * cy - by * cx)
+    if not d:
+        pairs = [(0.0, 0.0, bx, by), (0.0, 0.0, cx, cy), (bx, by, cx, cy)]
+        x0, y0, x1, y1 = max(pairs,
+            key=lambda p: (p[2] - p[0])**2 + (p[3] - p[1])**2)
+        ox = (x0 + x1) * 0.5
+        oy = (y0 + y1) * 0.5
+        return ox + ax, oy + ay, (x1 - ox)**2 + (y1 - oy)**2
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+    ox = (cy * b2 - by * c2) / d
+    oy = (bx * c2 - cx * b2) / d
+    return ox + ax, oy + ay, ox * ox + oy * oy
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
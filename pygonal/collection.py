@@ -0,0 +1,395 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+from array import array
+import pygonal
+from pygonal.polygon import _unknown
+
+# Bits of the per-polygon flags recording what is known about each polygon
+_CONVEX_KNOWN = 1
+_CONVEX = 2
+_SIMPLE_KNOWN = 4
+_SIMPLE = 8
+
+
+class PolygonCollection(object):
+    """Collection of polygons sharing a single vertex buffer.
+
+    The vertices of all polygons are stored in one flat buffer of
+    interleaved x and y coordinates, and polygon ``i`` spans the vertices
+    ``offsets[i]`` to ``offsets[i + 1]``. Together with a byte of flags per
+    polygon for the known convexity and simplicity, this replaces the list
+    of vectors and cached attributes each :class:`~pygonal.Polygon` object
+    carries, and allows batch operations over the whole collection in a
+    single pass over the buffer.
+
+    :param polygons: Iterable of :class:`~pygonal.Polygon` objects or
+        sequences of three or more vertices. Known convexity and
+        simplicity of polygons are retained.
+    :param typecode: The array typecode of the coordinate buffer, ``'d'``
+        for double precision or ``'f'`` for single precision, which halves
+        the memory used. Coordinates are rounded to single precision when
+        stored, all computations are still done in double precision.
+        Since rounding can change the convexity of a polygon, what is known
+        about the polygons is not retained for single precision, except
+        for triangles.
+    :type typecode: str
+    """
+
+    def __init__(self, polygons=(), typecode='d'):
+        if typecode not in ('d', 'f'):
+            raise ValueError(
+                "PolygonCollection(): typecode must be 'd' or 'f', not %r"
+                % (typecode,))
+        coords = array(typecode)
+        offsets = array('l', [0])
+        flags = bytearray()
+        for poly in polygons:
+            if isinstance(poly, pygonal.Seq2):
+                vertices = poly._vectors
+            else:
+                vertices = list(poly)
+            if len(vertices) < 3:
+                raise ValueError(
+                    "PolygonCollection(): minimum of 3 vertices required")
+            for x, y in vertices:
+                coords.append(x)
+                coords.append(y)
+            offsets.append(len(coords) // 2)
+            if typecode == 'd' or len(vertices) == 3:
+                flags.append(_poly_flags(poly))
+            else:
+                flags.append(0)
+        self._coords = coords
+        self._offsets = offsets
+        self._flags = flags
+
+    @classmethod
+    def from_buffers(cls, coords, offsets, flags=None):
+        """Create a collection over existing buffers without copying them.
+
+        :param coords: Buffer of interleaved x and y coordinates, e.g. an
+            ``array('d')`` or ``array('f')``, or a ``memoryview`` cast to
+            doubles or floats.
+        :param offsets: Sequence of ``len(collection) + 1`` vertex indices
+            into ``coords``, where polygon ``i`` spans the vertices
+            ``offsets[i]`` to ``offsets[i + 1]``.
+        :param flags: Optional mutable buffer of flag bytes, one for each
+            polygon. If omitted, nothing is known about the polygons.
+        """
+        if not len(offsets) or offsets[0] != 0:
+            raise ValueError(
+                "PolygonCollection.from_buffers(): offsets must start at 0")
+        if offsets[-1] * 2 != len(coords):
+            raise ValueError("PolygonCollection.from_buffers(): "
+                "offsets do not match the size of the coordinate buffer")
+        if flags is None:
+            flags = bytearray(len(offsets) - 1)
+        elif len(flags) != len(offsets) - 1:
+            raise ValueError("PolygonCollection.from_buffers(): "
+                "expected %d flags, got %d" % (len(offsets) - 1, len(flags)))
+        self = cls.__new__(cls)
+        self._coords = coords
+        self._offsets = offsets
+        self._flags = flags
+        return self
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    @property
+    def typecode(self):
+        """The typecode of the coordinate buffer, ``'d'`` for double
+        precision or ``'f'`` for single precision.
+        """
+        coords = self._coords
+        if isinstance(coords, array):
+            return coords.typecode
+        return coords.format
+
+    def __getitem__(self, index):
+        """Return the polygon at the given index. The polygon is created
+        on access from the shared buffer, with the convexity and
+        simplicity already known to the collection. Changes to the
+        polygon returned are not reflected in the collection.
+        """
+        count = len(self._offsets) - 1
+        if isinstance(index, slice):
+            return self.__class__(
+                (self[i] for i in range(*index.indices(count))),
+                self.typecode)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("PolygonCollection index out of range")
+        coords = self._coords
+        Vec2 = pygonal.Vec2
+        start = self._offsets[index] * 2
+        end = self._offsets[index + 1] * 2
+        poly = pygonal.Polygon.from_points([Vec2(coords[i], coords[i + 1])
+            for i in range(start, end, 2)])
+        flags = self._flags[index]
+        if flags & _CONVEX_KNOWN and poly._convex is _unknown:
+            poly._convex = bool(flags & _CONVEX)
+            if poly._convex:
+                poly._simple = True
+                if len(poly) > 3:
+                    poly._split_y_polylines()
+        if flags & _SIMPLE_KNOWN and poly._simple is _unknown:
+            poly._simple = bool(flags & _SIMPLE)
+        return poly
+
+    def __iter__(self):
+        for i in range(len(self._offsets) - 1):
+            yield self[i]
+
+    def __repr__(self):
+        return "PolygonCollection([%s])" % ', '.join(
+            repr(poly) for poly in self)
+
+    __str__ = __repr__
+
+    def __eq__(self, other):
+        return (self.__class__ is other.__class__
+            and len(self) == len(other)
+            and all(a == b for a, b in zip(self, other)))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        raise TypeError("unhashable type: %s" % self.__class__.__name__)
+
+    def _rings(self):
+        """Iterate the polygons as tuples of start and end indices into
+        the coordinate buffer.
+        """
+        offsets = self._offsets
+        start = 0
+        for i in range(1, len(offsets)):
+            end = offsets[i] * 2
+            yield start, end
+            start = end
+
+    def vertex_counts(self):
+        """Return the number of vertices of each polygon.
+
+        :rtype: list of int
+        """
+        offsets = self._offsets
+        return [offsets[i + 1] - offsets[i] for i in range(len(offsets) - 1)]
+
+    def bounding_boxes(self):
+        """Return the bounding boxes of all polygons.
+
+        :rtype: :class:`~pygonal.BoxArray`
+        """
+        coords = self._coords
+        typecode = self.typecode
+        min_xs = array(typecode)
+        min_ys = array(typecode)
+        max_xs = array(typecode)
+        max_ys = array(typecode)
+        for start, end in self._rings():
+            xs = coords[start:end:2]
+            ys = coords[start + 1:end:2]
+            min_xs.append(min(xs))
+            min_ys.append(min(ys))
+            max_xs.append(max(xs))
+            max_ys.append(max(ys))
+        return pygonal.BoxArray.from_arrays(min_xs, min_ys, max_xs, max_ys,
+            typecode)
+
+    def areas(self, signed=False):
+        """Return the areas of all polygons.
+
+        :param signed: If True, the areas of clockwise polygons are
+            negative.
+        :type signed: bool
+        :rtype: array of float
+        """
+        coords = self._coords
+        areas = array('d')
+        for start, end in self._rings():
+            x0 = coords[end - 2]
+            y0 = coords[end - 1]
+            area = 0.0
+            for i in range(start, end, 2):
+                x1 = coords[i]
+                y1 = coords[i + 1]
+                area += x0 * y1 - x1 * y0
+                x0 = x1
+                y0 = y1
+            areas.append(area * 0.5 if signed else abs(area) * 0.5)
+        return areas
+
+    def centroids(self):
+        """Return the centroids of all polygons. As with
+        :attr:`Polygon.centroid <pygonal.Polygon.centroid>`, the centroid
+        is ``None`` for polygons known to be non-simple, and for polygons
+        with zero area. Simplicity is not checked for the other polygons.
+
+        :rtype: list
+        """
+        coords = self._coords
+        flags = self._flags
+        Vec2 = pygonal.Vec2
+        centroids = []
+        for index, (start, end) in enumerate(self._rings()):
+            if flags[index] & (_SIMPLE_KNOWN | _SIMPLE) == _SIMPLE_KNOWN:
+                centroids.append(None)
+                continue
+            x0 = coords[end - 2]
+            y0 = coords[end - 1]
+            area = cx = cy = 0.0
+            for i in range(start, end, 2):
+                x1 = coords[i]
+                y1 = coords[i + 1]
+                cross = x0 * y1 - x1 * y0
+                area += cross
+                cx += (x0 + x1) * cross
+                cy += (y0 + y1) * cross
+                x0 = x1
+                y0 = y1
+            if area:
+                centroids.append(Vec2(cx / (3.0 * area), cy / (3.0 * area)))
+            else:
+                centroids.append(None)
+        return centroids
+
+    def classify(self):
+        """Return a list of bools indicating which of the polygons are
+        convex, using the same classification as
+        :attr:`Polygon.is_convex <pygonal.Polygon.is_convex>`. The
+        results are cached in the collection, and passed on to the
+        polygons it returns.
+
+        :rtype: list of bool
+        """
+        coords = self._coords
+        flags = self._flags
+        convex = []
+        for index, (start, end) in enumerate(self._rings()):
+            flag = flags[index]
+            if not flag & _CONVEX_KNOWN:
+                if _is_convex(coords, start, end):
+                    flag |= _CONVEX_KNOWN | _CONVEX | _SIMPLE_KNOWN | _SIMPLE
+                else:
+                    flag |= _CONVEX_KNOWN
+                flags[index] = flag
+            convex.append(bool(flag & _CONVEX))
+        return convex
+
+    def transform(self, transform):
+        """Return a new collection with all polygons transformed.
+
+        :param transform: The transform to apply.
+        :type transform: :class:`~pygonal.Affine`
+        :rtype: PolygonCollection
+        """
+        sa, sb, sc, sd, se, sf = transform[:6]
+        src = self._coords
+        coords = array(self.typecode, src)
+        for i in range(0, len(coords), 2):
+            x = src[i]
+            y = src[i + 1]
+            coords[i] = x*sa + y*sd + sc
+            coords[i + 1] = x*sb + y*se + sf
+        if transform.is_degenerate:
+            flags = bytearray(len(self._flags))
+        else:
+            # Convexity and simplicity are invariant under
+            # non-degenerate affine transforms
+            flags = bytearray(self._flags)
+            if self.typecode == 'f':
+                # Rounding the transformed coordinates to single
+                # precision can change them, as in __init__()
+                offsets = self._offsets
+                for i in range(len(flags)):
+                    if offsets[i + 1] - offsets[i] != 3:
+                        flags[i] = 0
+        return self.from_buffers(coords, array('l', self._offsets), flags)
+
+
+def _poly_flags(poly):
+    """Return the collection flags for what is known about a polygon."""
+    flags = 0
+    if isinstance(poly, pygonal.Polygon):
+        if poly._convex is not _unknown:
+            flags |= _CONVEX_KNOWN | (poly._convex and _CONVEX)
+        if poly._simple is not _unknown:
+            flags |= _SIMPLE_KNOWN | (poly._simple and _SIMPLE)
+    elif len(poly) == 3:
+        flags = _CONVEX_KNOWN | _CONVEX | _SIMPLE_KNOWN | _SIMPLE
+    return flags
+
+
+def _is_convex(coords, start, end):
+    """Return True if the polygon with vertices in coords[start:end]
+    is convex. This follows the algorithm used by Polygon._classify().
+    """
+    if end - start <= 6:
+        return True
+    dir_changes = 0
+    angle_sign = 0
+    last_dx = coords[end - 2] - coords[end - 4]
+    last_dy = coords[end - 1] - coords[end - 3]
+    last_dir = (
+        (last_dx > 0) * -1 or
+        (last_dx < 0) * 1 or
+        (last_dy > 0) * -1 or
+        (last_dy < 0) * 1) or 0
+    x0 = coords[end - 2]
+    y0 = coords[end - 1]
+    for i in range(start, end, 2):
+        x1 = coords[i]
+        y1 = coords[i + 1]
+        dx = x1 - x0
+        dy = y1 - y0
+        x0 = x1
+        y0 = y1
+        if not dx and not dy:
+            continue
+        this_dir = (
+            (dx > 0) * -1 or
+            (dx < 0) * 1 or
+            (dy > 0) * -1 or
+            (dy < 0) * 1) or 0
+        dir_changes += (this_dir == -last_dir)
+        last_dir = this_dir
+        cross = last_dx * dy - last_dy * dx
+        if cross > 0.0:
+            if angle_sign == -1:
+                return False
+            angle_sign = 1
+        elif cross < 0.0:
+            if angle_sign == 1:
+                return False
+            angle_sign = -1
+        last_dx = dx
+        last_dy = dy
+    return dir_changes <= 2
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
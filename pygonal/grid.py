@@ -0,0 +1,444 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+import math
+from array import array
+import pygonal
+
+# Integer grid coordinates. Points are snapped to the nearest multiple of
+# the grid scale and stored as integer multiples of it, so that the
+# orientation, intersection and containment predicates below are computed
+# exactly in integer arithmetic, without the epsilon tolerances needed
+# with floating point coordinates.
+
+_typecodes = {'i': 'int32', 'q': 'int64'}
+
+
+def _snap(value, scale):
+    """Round a coordinate to the nearest grid multiple, halves rounding up"""
+    return int(math.floor(value / scale + 0.5))
+
+def _direction(dx, dy):
+    return (
+        (dx > 0) * -1 or
+        (dx < 0) * 1 or
+        (dy > 0) * -1 or
+        (dy < 0) * 1) or 0
+
+def _segments_intersect(a, b, c, d):
+    """Return True if the line segment a->b intersects with
+    line segment c->d, using exact integer arithmetic
+    """
+    dir1 = (b[0] - a[0])*(c[1] - a[1]) - (c[0] - a[0])*(b[1] - a[1])
+    dir2 = (b[0] - a[0])*(d[1] - a[1]) - (d[0] - a[0])*(b[1] - a[1])
+    if (dir1 > 0) != (dir2 > 0) or (not dir1) != (not dir2):
+        dir1 = (d[0] - c[0])*(a[1] - c[1]) - (a[0] - c[0])*(d[1] - c[1])
+        dir2 = (d[0] - c[0])*(b[1] - c[1]) - (b[0] - c[0])*(d[1] - c[1])
+        return ((dir1 > 0) != (dir2 > 0)
+            or (not dir1) != (not dir2))
+    return False
+
+
+class GridVec2Array(object):
+    """Sequence of points with coordinates on an integer grid.
+
+    Each coordinate is snapped to the nearest multiple of ``scale`` and
+    stored as that integer multiple in a compact array. Indexing and
+    iteration return :class:`~pygonal.Vec2` points in world coordinates.
+
+    :param points: Iterable of points in world coordinates.
+    :param scale: The grid spacing, e.g. ``0.01`` for centimeters when
+        coordinates are in meters.
+    :type scale: float
+    :param typecode: ``'i'`` to store coordinates as 32-bit integers, or
+        ``'q'`` for 64-bit integers. Snapping a coordinate outside the range
+        of the integer type raises :exc:`OverflowError`.
+    :type typecode: str
+    """
+
+    def __init__(self, points=(), scale=1.0, typecode='q'):
+        self._init_grid(scale, typecode)
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        coords = array(typecode)
+        for x, y in points:
+            coords.append(_snap(x, scale))
+            coords.append(_snap(y, scale))
+        self._init_coords(coords)
+
+    @classmethod
+    def from_grid(cls, coords, scale=1.0, typecode='q'):
+        """Create an array from integer grid coordinates, without snapping.
+
+        :param coords: Iterable of interleaved integer x and y grid
+            coordinates.
+        :param scale: The grid spacing.
+        :type scale: float
+        :param typecode: ``'i'`` or ``'q'``, see :class:`GridVec2Array`.
+        :type typecode: str
+        """
+        self = cls.__new__(cls)
+        self._init_grid(scale, typecode)
+        coords = array(typecode, coords)
+        if len(coords) % 2:
+            raise ValueError(
+                "%s.from_grid(): odd number of coordinates" % cls.__name__)
+        self._init_coords(coords)
+        return self
+
+    def _init_grid(self, scale, typecode):
+        if typecode not in _typecodes:
+            raise ValueError("%s(): typecode must be 'i' or 'q', not %r"
+                % (self.__class__.__name__, typecode))
+        scale = float(scale)
+        if not scale > 0.0:
+            raise ValueError(
+                "%s(): scale must be positive" % self.__class__.__name__)
+        self._scale = scale
+        self._typecode = typecode
+
+    def _init_coords(self, coords):
+        self._coords = coords
+
+    @property
+    def scale(self):
+        """The grid spacing."""
+        return self._scale
+
+    @property
+    def typecode(self):
+        """The array typecode of the integer coordinates."""
+        return self._typecode
+
+    def __len__(self):
+        return len(self._coords) // 2
+
+    def __getitem__(self, index):
+        count = len(self._coords) // 2
+        if isinstance(index, slice):
+            start, stop, step = index.indices(count)
+            return GridVec2Array.from_grid(
+                _slice_coords(self._coords, start, stop, step),
+                self._scale, self._typecode)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("%s index out of range" % self.__class__.__name__)
+        scale = self._scale
+        return pygonal.Vec2(self._coords[index * 2] * scale,
+            self._coords[index * 2 + 1] * scale)
+
+    def __iter__(self):
+        coords = self._coords
+        scale = self._scale
+        Vec2 = pygonal.Vec2
+        for i in range(0, len(coords), 2):
+            yield Vec2(coords[i] * scale, coords[i + 1] * scale)
+
+    def grid_points(self):
+        """Return the integer grid coordinates of the points.
+
+        :rtype: list of tuples of int
+        """
+        coords = self._coords
+        return list(zip(coords[0::2], coords[1::2]))
+
+    def snap(self, point):
+        """Return the grid coordinates of the grid point nearest to the
+        specified point.
+
+        :type point: :class:`~pygonal.Vec2`
+        :rtype: tuple of int
+        """
+        x, y = point
+        return _snap(x, self._scale), _snap(y, self._scale)
+
+    @property
+    def bounding_box(self):
+        """The bounding box of the points in world coordinates."""
+        return pygonal.BoundingBox(self)
+
+    def to_vec2_array(self):
+        """Return the points in world coordinates.
+
+        :rtype: :class:`~pygonal.Vec2Array`
+        """
+        return pygonal.Vec2Array(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, GridVec2Array):
+            return NotImplemented
+        return (type(self) is type(other)
+            and self._scale == other._scale
+            and self._coords == other._coords)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        coords = self._coords
+        return "%s([%s], scale=%r%s)" % (self.__class__.__name__,
+            ', '.join("(%r, %r)" % (coords[i] * self._scale,
+                coords[i + 1] * self._scale)
+                for i in range(0, len(coords), 2)),
+            self._scale,
+            '' if self._typecode == 'q' else ', typecode=%r' % self._typecode)
+
+
+class GridPolygon(GridVec2Array):
+    """Polygon with vertices on an integer grid.
+
+    Vertices are snapped to the grid as in :class:`GridVec2Array`, and
+    consecutive vertices that snap to the same grid point are merged.
+    Convexity, simplicity, area and containment are computed exactly.
+    Unlike :class:`~pygonal.Polygon`, grid polygons are immutable, so
+    these results are cached for the lifetime of the polygon.
+
+    :param vertices: Iterable of three or more vertices in world
+        coordinates.
+    :param scale: The grid spacing.
+    :type scale: float
+    :param typecode: ``'i'`` or ``'q'``, see :class:`GridVec2Array`.
+    :type typecode: str
+    """
+
+    def __init__(self, vertices, scale=1.0, typecode='q'):
+        super(GridPolygon, self).__init__(vertices, scale, typecode)
+
+    def _init_coords(self, coords):
+        # Merge repeated vertices, including the last with the first
+        if len(coords) >= 4:
+            merged = array(coords.typecode, coords[:2])
+            for i in range(2, len(coords), 2):
+                x = coords[i]
+                y = coords[i + 1]
+                if x != merged[-2] or y != merged[-1]:
+                    merged.append(x)
+                    merged.append(y)
+            while (len(merged) > 2 and merged[-2] == merged[0]
+                and merged[-1] == merged[1]):
+                del merged[-2:]
+            coords = merged
+        if len(coords) < 6:
+            raise ValueError("%s(): minimum of 3 distinct vertices required"
+                % self.__class__.__name__)
+        self._coords = coords
+        self._convex = None
+        self._simple = None
+
+    @property
+    def signed_area2(self):
+        """Twice the signed area of the polygon in squared grid units,
+        computed exactly. Positive for counter-clockwise polygons.
+
+        :rtype: int
+        """
+        coords = self._coords
+        x0 = coords[-2]
+        y0 = coords[-1]
+        area2 = 0
+        for i in range(0, len(coords), 2):
+            x = coords[i]
+            y = coords[i + 1]
+            area2 += x0 * y - x * y0
+            x0 = x
+            y0 = y
+        return area2
+
+    @property
+    def area(self):
+        """The area of the polygon in world units. Only meaningful for
+        simple polygons.
+        """
+        return abs(self.signed_area2) * 0.5 * self._scale * self._scale
+
+    @property
+    def is_convex(self):
+        """True if the polygon is convex, computed exactly and cached.
+        Runtime complexity: O(n)
+        """
+        if self._convex is None:
+            self._classify()
+        return self._convex
+
+    def _classify(self):
+        """Calculate the polygon convexity as in
+        :meth:`pygonal.Polygon._classify`, using exact integer arithmetic.
+        """
+        coords = self._coords
+        last_dx = coords[-2] - coords[-4]
+        last_dy = coords[-1] - coords[-3]
+        last_dir = _direction(last_dx, last_dy)
+        x0 = coords[-2]
+        y0 = coords[-1]
+        dir_changes = 0
+        angle_sign = 0
+        convex = True
+        for i in range(0, len(coords), 2):
+            x = coords[i]
+            y = coords[i + 1]
+            dx = x - x0
+            dy = y - y0
+            this_dir = _direction(dx, dy)
+            dir_changes += (this_dir == -last_dir)
+            last_dir = this_dir
+            cross = last_dx * dy - last_dy * dx
+            if cross > 0:
+                if angle_sign == -1:
+                    convex = False
+                    break
+                angle_sign = 1
+            elif cross < 0:
+                if angle_sign == 1:
+                    convex = False
+                    break
+                angle_sign = -1
+            last_dx = dx
+            last_dy = dy
+            x0 = x
+            y0 = y
+        if dir_changes > 2:
+            convex = False
+        if convex:
+            self._simple = True
+        self._convex = convex
+
+    @property
+    def is_simple(self):
+        """True if the polygon has no self-intersections, computed exactly
+        and cached. Edges that touch count as intersecting.
+        Runtime complexity: O(n) convex, O(n log n) expected for most
+        non-convex cases, O(n^2) worst case non-convex
+        """
+        if self._simple is None:
+            if self._convex is None:
+                self._classify()
+            if self._simple is None:
+                self._simple = self._check_is_simple()
+        return self._simple
+
+    def _check_is_simple(self):
+        """Plane sweep for self-intersections as in
+        :meth:`pygonal.Polygon._check_is_simple`.
+        """
+        verts = self.grid_points()
+        last_index = len(verts) - 1
+        indices = range(len(verts))
+        points = ([(verts[i - 1], verts[i], i) for i in indices]
+            + [(verts[i], verts[i - 1], i) for i in indices])
+        points.sort()
+        open_segments = {}
+        for point in points:
+            seg_start, seg_end, index = point
+            if index not in open_segments:
+                for open_start, open_end, open_index in open_segments.values():
+                    if (last_index > abs(index - open_index) > 1
+                        and _segments_intersect(
+                            seg_start, seg_end, open_start, open_end)):
+                        return False
+                open_segments[index] = point
+            else:
+                del open_segments[index]
+        return True
+
+    def contains_point(self, point):
+        """Return True if the specified point is inside the polygon. The
+        point is snapped to the grid first, and the non-zero winding rule
+        is applied exactly, as in :meth:`pygonal.Polygon.contains_point`.
+
+        :param point: A point vector in world coordinates.
+        :type point: :class:`~pygonal.Vec2`
+        :rtype: bool
+        """
+        return self._contains_grid_point(*self.snap(point))
+
+    def contains_points(self, points):
+        """Return a list of bools indicating which of the specified
+        points are inside the polygon. See :meth:`contains_point`.
+
+        :param points: Iterable of point vectors, e.g. a
+            :class:`~pygonal.Vec2Array`.
+        :rtype: list of bool
+        """
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        contains = self._contains_grid_point
+        scale = self._scale
+        return [contains(_snap(x, scale), _snap(y, scale))
+            for x, y in points]
+
+    def _contains_grid_point(self, px, py):
+        coords = self._coords
+        winding_no = 0
+        v0_x = coords[-2]
+        v0_y = coords[-1]
+        v0_above = (v0_y >= py)
+        for i in range(0, len(coords), 2):
+            v1_x = coords[i]
+            v1_y = coords[i + 1]
+            v1_above = (v1_y >= py)
+            if v0_above != v1_above:
+                if v1_above: # upward crossing
+                    if ((v1_x - v0_x) * (py - v0_y)
+                        - (px - v0_x) * (v1_y - v0_y) <= 0):
+                        winding_no += 1
+                else:
+                    if ((v1_x - v0_x) * (py - v0_y)
+                        - (px - v0_x) * (v1_y - v0_y) >= 0):
+                        winding_no -= 1
+            v0_above = v1_above
+            v0_x = v1_x
+            v0_y = v1_y
+        return winding_no != 0
+
+    def to_polygon(self):
+        """Return a :class:`~pygonal.Polygon` with the vertices in world
+        coordinates. The exactly computed convexity, and the simplicity if
+        already known, are declared to the polygon so that they are not
+        recomputed in floating point.
+
+        :rtype: :class:`~pygonal.Polygon`
+        """
+        is_convex = self.is_convex
+        if is_convex and not self.signed_area2:
+            # Leave degenerate polygons for Polygon to classify
+            is_convex = None
+        return pygonal.Polygon(list(self), is_convex=is_convex,
+            is_simple=self._simple)
+
+
+def _slice_coords(coords, start, stop, step):
+    result = array(coords.typecode)
+    for i in range(start, stop, step):
+        result.append(coords[i * 2])
+        result.append(coords[i * 2 + 1])
+    return result
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
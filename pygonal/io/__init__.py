@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+
+# Reading and writing geometry in standard interchange formats. Each format
+# lives in its own module of this package, which must be imported
+# explicitly, e.g.:
+#
+#   from pygonal.io import wkb
+
+from __future__ import division
+from array import array
+import pygonal
+
+
+class MultiPoint(pygonal.Vec2Array):
+    """A :class:`~pygonal.Vec2Array` of points read from a MultiPoint
+    geometry. The readers return this type so that the writers can encode
+    it as a MultiPoint again, rather than as a LineString.
+    """
+
+
+class MultiLineString(list):
+    """A list of :class:`~pygonal.Vec2Array` lines read from a
+    MultiLineString geometry. The readers return this type so that the
+    writers can encode it as a MultiLineString again, rather than as a
+    GeometryCollection.
+    """
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, list.__repr__(self))
+
+
+class Empty(object):
+    """An empty geometry of a type that pygonal has no empty value for,
+    either a point or a polygon. Other empty geometries are read as empty
+    sequences or collections.
+
+    :param geometry_type: ``'Point'`` or ``'Polygon'``.
+    :type geometry_type: str
+    """
+
+    __slots__ = ('geometry_type',)
+
+    def __init__(self, geometry_type):
+        if geometry_type not in ('Point', 'Polygon'):
+            raise ValueError(
+                "Empty(): expected 'Point' or 'Polygon', got %r"
+                % (geometry_type,))
+        self.geometry_type = geometry_type
+
+    def __eq__(self, other):
+        return (self.__class__ is other.__class__
+            and self.geometry_type == other.geometry_type)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.__class__, self.geometry_type))
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.geometry_type)
+
+
+def _vec2_array(coords, cls=None):
+    """Create a Vec2Array, or an instance of the subclass cls, from an
+    array of interleaved coordinates.
+    """
+    Vec2 = pygonal.Vec2
+    return (cls or pygonal.Vec2Array).from_points(
+        [Vec2(coords[i], coords[i + 1]) for i in range(0, len(coords), 2)])
+
+
+def _polygon(coords):
+    """Create a Polygon from an array of interleaved coordinates."""
+    Vec2 = pygonal.Vec2
+    return pygonal.Polygon.from_points(
+        [Vec2(coords[i], coords[i + 1]) for i in range(0, len(coords), 2)])
+
+
+def _open_ring(coords):
+    """Remove the closing vertex from an array of interleaved ring
+    coordinates in place, and check that the ring has enough vertices.
+    """
+    if len(coords) >= 4 and coords[:2] == coords[-2:]:
+        del coords[-2:]
+    if len(coords) < 6:
+        raise ValueError("Polygon ring has fewer than 3 vertices")
+    return coords
+
+
+def _polygon_rings(rings):
+    """Create a Polygon from a list of arrays of interleaved ring
+    coordinates, or a PolygonWithHoles if there are interior rings.
+    """
+    if len(rings) == 1:
+        return _polygon(rings[0])
+    coords = array('d')
+    offsets = array('l', [0])
+    for ring in rings:
+        coords.extend(ring)
+        offsets.append(len(coords) // 2)
+    return pygonal.PolygonWithHoles.from_buffers(coords, offsets)
+
+
+def _multipolygon(polygons):
+    """Create a PolygonCollection from a list of polygons, each a list of
+    arrays of interleaved ring coordinates, or a MultiPolygon if any of
+    the polygons has interior rings.
+    """
+    coords = array('d')
+    offsets = array('l', [0])
+    parts = array('l', [0])
+    for rings in polygons:
+        for ring in rings:
+            coords.extend(ring)
+            offsets.append(len(coords) // 2)
+        parts.append(len(offsets) - 1)
+    if len(offsets) == len(parts):
+        return pygonal.PolygonCollection.from_buffers(coords, offsets)
+    return pygonal.MultiPolygon.from_buffers(coords, offsets, parts)
+
+
+def _ring_slices(rings):
+    """Iterate the interleaved coordinates of each polygon in a
+    PolygonCollection.
+    """
+    coords = rings._coords
+    for start, end in rings._rings():
+        yield coords[start:end]
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
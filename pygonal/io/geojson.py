@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import absolute_import, division
+import codecs
+import json
+from array import array
+import pygonal
+from pygonal.io import (MultiPoint, MultiLineString, Empty, _vec2_array,
+    _open_ring, _polygon_rings, _multipolygon, _ring_slices)
+
+# Reader and writer for GeoJSON. Geometries map to pygonal types the same
+# way as in pygonal.io.wkb, and a null geometry maps to None. Coordinates
+# beyond x and y are dropped when reading. A Point or Polygon with empty
+# coordinates maps to pygonal.io.Empty.
+#
+# FeatureCollections are streamed: the reader scans the top-level object
+# incrementally and decodes one feature at a time from a bounded buffer,
+# so the memory used does not depend on the number of features.
+
+
+def _ring(coordinates):
+    coords = array('d')
+    for position in coordinates:
+        coords.append(position[0])
+        coords.append(position[1])
+    return coords
+
+
+def _ring_coords(rings):
+    if not rings:
+        raise ValueError("Empty GeoJSON polygons are not supported")
+    return [_open_ring(_ring(ring)) for ring in rings]
+
+
+def from_dict(obj):
+    """Convert a decoded GeoJSON geometry object to a pygonal geometry.
+
+    :param obj: The GeoJSON geometry as a dict, or None.
+    :return: The geometry.
+    """
+    if obj is None:
+        return None
+    kind = obj.get('type')
+    if kind == 'GeometryCollection':
+        return [from_dict(part) for part in obj['geometries']]
+    coordinates = obj.get('coordinates')
+    if coordinates is None:
+        raise ValueError("Invalid GeoJSON geometry %r" % kind)
+    if not coordinates and kind in ('Point', 'Polygon'):
+        return Empty(kind)
+    if kind == 'Point':
+        return pygonal.Vec2(coordinates[0], coordinates[1])
+    if kind == 'LineString':
+        return _vec2_array(_ring(coordinates))
+    if kind == 'MultiPoint':
+        return _vec2_array(_ring(coordinates), MultiPoint)
+    if kind == 'Polygon':
+        return _polygon_rings(_ring_coords(coordinates))
+    if kind == 'MultiLineString':
+        return MultiLineString(
+            [_vec2_array(_ring(line)) for line in coordinates])
+    if kind == 'MultiPolygon':
+        return _multipolygon([_ring_coords(rings) for rings in coordinates])
+    raise ValueError("Unsupported GeoJSON geometry type %r" % kind)
+
+
+def _positions(points, precision):
+    if precision is None:
+        return [[x, y] for x, y in points]
+    return [[round(x, precision), round(y, precision)] for x, y in points]
+
+
+def _closed(points, precision):
+    positions = _positions(points, precision)
+    positions.append(positions[0])
+    return positions
+
+
+def _rings(rings, precision):
+    return [_closed(zip(ring[0::2], ring[1::2]), precision)
+        for ring in _ring_slices(rings)]
+
+
+def to_dict(geometry, precision=None):
+    """Convert a pygonal geometry to a GeoJSON geometry object.
+
+    :param geometry: The geometry to convert. A list of geometries is
+        converted to a GeometryCollection, and None to a null geometry.
+    :param precision: Optional number of decimal places to round the
+        coordinates to.
+    :type precision: int
+    :rtype: dict
+    """
+    if geometry is None:
+        return None
+    if isinstance(geometry, pygonal.Vec2):
+        return {'type': 'Point',
+            'coordinates': _positions([geometry], precision)[0]}
+    elif isinstance(geometry, pygonal.Polygon):
+        return {'type': 'Polygon',
+            'coordinates': [_closed(geometry._vectors, precision)]}
+    elif isinstance(geometry, MultiPoint):
+        return {'type': 'MultiPoint',
+            'coordinates': _positions(geometry._vectors, precision)}
+    elif isinstance(geometry, pygonal.Seq2):
+        return {'type': 'LineString',
+            'coordinates': _positions(geometry._vectors, precision)}
+    elif isinstance(geometry, pygonal.LineSegment):
+        return {'type': 'LineString',
+            'coordinates': _positions(geometry.points, precision)}
+    elif isinstance(geometry, pygonal.BoundingBox):
+        return to_dict(geometry.to_polygon(), precision)
+    elif isinstance(geometry, pygonal.PolygonCollection):
+        return {'type': 'MultiPolygon',
+            'coordinates': [[ring] for ring in _rings(geometry, precision)]}
+    elif isinstance(geometry, pygonal.PolygonWithHoles):
+        return {'type': 'Polygon',
+            'coordinates': _rings(geometry.rings, precision)}
+    elif isinstance(geometry, pygonal.MultiPolygon):
+        return {'type': 'MultiPolygon', 'coordinates':
+            [_rings(poly.rings, precision) for poly in geometry]}
+    elif isinstance(geometry, Empty):
+        return {'type': geometry.geometry_type, 'coordinates': []}
+    elif isinstance(geometry, MultiLineString):
+        return {'type': 'MultiLineString',
+            'coordinates': [_positions(line, precision) for line in geometry]}
+    elif isinstance(geometry, list):
+        return {'type': 'GeometryCollection',
+            'geometries': [to_dict(part, precision) for part in geometry]}
+    raise TypeError("Cannot encode %s as GeoJSON" % type(geometry).__name__)
+
+
+def loads(text):
+    """Decode a geometry from a GeoJSON geometry string.
+
+    :param text: The GeoJSON text.
+    :type text: str
+    :return: The decoded geometry.
+    """
+    return from_dict(json.loads(text))
+
+
+def dumps(geometry, precision=None):
+    """Encode a geometry as a GeoJSON geometry string.
+    See :func:`to_dict`.
+
+    :rtype: str
+    """
+    return json.dumps(to_dict(geometry, precision))
+
+
+class _Stream(object):
+    """Buffered incremental JSON value decoder over a file-like object."""
+
+    def __init__(self, fp, chunk_size):
+        self._read = fp.read
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._utf8 = None
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        """Read another chunk, discarding the consumed part of the
+        buffer. Return False at the end of the file.
+        """
+        if self._eof:
+            return False
+        # Grow the reads with the pending data, so that decoding large
+        # values, which restarts after each read, takes linear time
+        chunk = self._read(
+            max(self._chunk_size, len(self._buffer) - self._pos))
+        if not chunk:
+            self._eof = True
+        if isinstance(chunk, bytes):
+            if self._utf8 is None:
+                self._utf8 = codecs.getincrementaldecoder('utf-8-sig')()
+            chunk = self._utf8.decode(chunk, self._eof)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character, or '' at the end."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in ' \t\n\r':
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError("Invalid GeoJSON: expected %r" % char)
+        self._pos += 1
+
+    def value(self):
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the
+            # next chunk, so only accept values followed by more data
+            if end < len(self._buffer) or not self._fill():
+                self._pos = end
+                return value
+
+
+def iter_load(fp, chunk_size=65536):
+    """Iterate over the features of a GeoJSON FeatureCollection read
+    incrementally from a file-like object. A file containing a single
+    feature or geometry yields that alone.
+
+    :param fp: A file-like object opened for reading, in text or
+        binary mode.
+    :param chunk_size: The number of characters or bytes read at a time.
+    :type chunk_size: int
+    :return: Iterator of ``(geometry, properties)`` tuples, where
+        properties is a dict or None.
+    """
+    stream = _Stream(fp, chunk_size)
+    stream.expect('{')
+    members = {}
+    while stream.peek() != '}':
+        if members or members is None:
+            stream.expect(',')
+        key = stream.value()
+        stream.expect(':')
+        if key == 'features':
+            stream.expect('[')
+            first = True
+            while stream.peek() != ']':
+                if not first:
+                    stream.expect(',')
+                first = False
+                feature = stream.value()
+                if not isinstance(feature, dict):
+                    raise ValueError("Invalid GeoJSON feature %r" % feature)
+                yield (from_dict(feature.get('geometry')),
+                    feature.get('properties'))
+            stream.expect(']')
+            members = None
+        else:
+            value = stream.value()
+            if members is not None:
+                members[key] = value
+    if members is not None:
+        if members.get('type') == 'Feature':
+            yield (from_dict(members.get('geometry')),
+                members.get('properties'))
+        elif members.get('type') != 'FeatureCollection':
+            yield from_dict(members), None
+
+
+def dump(features, fp, precision=None):
+    """Write features as a GeoJSON FeatureCollection to a text file-like
+    object, one feature at a time.
+
+    :param features: Iterable of ``(geometry, properties)`` tuples, or of
+        geometries without properties.
+    :param fp: A file-like object opened for writing text.
+    :param precision: Optional number of decimal places to round the
+        coordinates to.
+    :type precision: int
+    """
+    write = fp.write
+    write('{"type": "FeatureCollection", "features": [')
+    separator = '\n'
+    for feature in features:
+        if isinstance(feature, tuple) and not isinstance(
+            feature, pygonal.Vec2):
+            geometry, properties = feature
+        else:
+            geometry = feature
+            properties = None
+        write(separator)
+        write(json.dumps({'type': 'Feature',
+            'geometry': to_dict(geometry, precision),
+            'properties': properties}))
+        separator = ',\n'
+    write('\n]}\n')
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
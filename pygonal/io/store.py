@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import absolute_import, division
+import mmap
+import struct
+import sys
+from array import array
+import pygonal
+
+# Compact binary file format for polygon collections, designed to be
+# memory-mapped. All values are little-endian:
+#
+#   magic           8 bytes, b'PYGPOLY1', or b'PYGPOLYF' for float32
+#   polygon count   uint64, n
+#   vertex count    uint64, v
+#   offsets         (n + 1) int64 vertex offsets of the polygons
+#   coordinates     2v float64 (or float32) interleaved x and y values
+#   flags           n bytes, the known convexity and simplicity
+#
+# All arrays are 8 byte aligned, so the file can be viewed directly as
+# the buffers of a PolygonCollection without copying or parsing anything.
+# Since the pages of the mapping are shared through the OS page cache,
+# several processes opening the same file share a single copy in memory.
+
+MAGIC = b'PYGPOLY1'
+MAGIC_FLOAT32 = b'PYGPOLYF'
+_header = struct.Struct('<8sQQ')
+_little_endian = sys.byteorder == 'little'
+
+
+def _little_endian_bytes(values, typecode):
+    values = array(typecode, values)
+    if not _little_endian:
+        values.byteswap()
+    return values.tobytes()
+
+
+def dump(polygons, fp, classify=True, typecode=None):
+    """Write polygons to a binary file in the memory-mappable store
+    format.
+
+    :param polygons: A :class:`~pygonal.PolygonCollection`, or an
+        iterable of polygons.
+    :param fp: A file-like object opened for binary writing, or a path.
+    :param classify: If True, the convexity of the polygons is computed
+        before writing, so that readers of the file need not compute it.
+    :type classify: bool
+    :param typecode: ``'d'`` to store coordinates in double precision,
+        or ``'f'`` for single precision. Defaults to the precision of the
+        collection, or double precision for other iterables.
+    :type typecode: str
+    """
+    if not isinstance(polygons, pygonal.PolygonCollection):
+        polygons = pygonal.PolygonCollection(polygons, typecode or 'd')
+    elif typecode is not None and typecode != polygons.typecode:
+        polygons = pygonal.PolygonCollection(polygons, typecode)
+    if classify:
+        polygons.classify()
+    if not hasattr(fp, 'write'):
+        with open(fp, 'wb') as f:
+            return dump(polygons, f, classify=False)
+    count = len(polygons)
+    offsets = polygons._offsets
+    typecode = polygons.typecode
+    fp.write(_header.pack(MAGIC if typecode == 'd' else MAGIC_FLOAT32,
+        count, offsets[count]))
+    fp.write(_little_endian_bytes(offsets, 'q'))
+    fp.write(_little_endian_bytes(polygons._coords, typecode))
+    fp.write(bytes(polygons._flags))
+
+
+def load(fp):
+    """Open a polygon store file as a :class:`~pygonal.PolygonCollection`.
+
+    The file is memory-mapped read-only and the collection views the
+    mapped offsets and vertex coordinates directly, so loading takes
+    constant time regardless of the file size, and vertex data is only
+    paged in from disk when accessed. The mapping remains open as long as
+    the collection, or any collection transformed from it, is in use.
+
+    :param fp: A file-like object opened for binary reading that supports
+        ``fileno()``, or a path.
+    :rtype: :class:`~pygonal.PolygonCollection`
+    """
+    if not hasattr(fp, 'fileno'):
+        with open(fp, 'rb') as f:
+            return load(f)
+    size = fp.seek(0, 2)
+    if size < _header.size:
+        raise ValueError("Not a pygonal polygon store file")
+    data = memoryview(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ))
+    magic, count, vertex_count = _header.unpack(data[:_header.size])
+    if magic == MAGIC:
+        typecode = 'd'
+    elif magic == MAGIC_FLOAT32:
+        typecode = 'f'
+    else:
+        raise ValueError("Not a pygonal polygon store file")
+    start = _header.size
+    coords_start = start + 8 * (count + 1)
+    flags_start = coords_start + (16 if typecode == 'd' else 8) * vertex_count
+    if size != flags_start + count:
+        raise ValueError("Polygon store file is truncated or corrupt")
+    offsets = data[start:coords_start].cast('q')
+    coords = data[coords_start:flags_start].cast(typecode)
+    if not _little_endian:
+        offsets = array('q', offsets)
+        offsets.byteswap()
+        coords = array(typecode, coords)
+        coords.byteswap()
+    # The flags are copied, so that the collection can cache the
+    # classification of polygons not classified in the file
+    flags = bytearray(data[flags_start:])
+    return pygonal.PolygonCollection.from_buffers(coords, offsets, flags)
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
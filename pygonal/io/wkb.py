@@ -0,0 +1,376 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import absolute_import, division
+import io
+import struct
+import sys
+from array import array
+import pygonal
+from pygonal.io import (MultiPoint, MultiLineString, Empty, _vec2_array,
+    _open_ring, _polygon_rings, _multipolygon, _ring_slices)
+
+# Reader and writer for the Well-Known Binary geometry format, including
+# the PostGIS extended variant (EWKB). Geometries map to pygonal types as
+# follows:
+#
+#   Point               Vec2
+#   LineString          Vec2Array
+#   Polygon             Polygon, or PolygonWithHoles if it has holes
+#   MultiPoint          pygonal.io.MultiPoint, a Vec2Array subclass
+#   MultiLineString     pygonal.io.MultiLineString, a list of Vec2Array
+#   MultiPolygon        PolygonCollection, or MultiPolygon if any of the
+#                       polygons has holes
+#   GeometryCollection  list of geometries
+#
+# LineSegment and BoundingBox objects are written as a LineString and
+# Polygon respectively. Since pygonal is 2D only, Z and M coordinates are
+# dropped when reading, as are SRIDs. The closing vertex of polygon rings
+# is omitted when reading and added when writing. Empty points, which
+# PostGIS writes with NaN coordinates, and polygons without rings are read
+# as pygonal.io.Empty.
+
+POINT = 1
+LINESTRING = 2
+POLYGON = 3
+MULTIPOINT = 4
+MULTILINESTRING = 5
+MULTIPOLYGON = 6
+GEOMETRYCOLLECTION = 7
+
+_EWKB_Z = 0x80000000
+_EWKB_M = 0x40000000
+_EWKB_SRID = 0x20000000
+
+_native = '<' if sys.byteorder == 'little' else '>'
+_uint = {'<': struct.Struct('<I'), '>': struct.Struct('>I')}
+
+
+class _Reader(object):
+    """Read exactly the requested number of bytes from a file-like
+    object, raising ValueError if the data ends prematurely.
+    """
+
+    def __init__(self, fp):
+        self._read = fp.read
+
+    def read(self, size):
+        data = self._read(size)
+        if len(data) != size:
+            while data and len(data) < size:
+                # Unbuffered streams may return short reads
+                more = self._read(size - len(data))
+                if not more:
+                    break
+                data += more
+            if len(data) != size:
+                raise ValueError("Unexpected end of WKB data")
+        return data
+
+    def uint(self, endian):
+        return _uint[endian].unpack(self.read(4))[0]
+
+    def coords(self, endian, dims, count):
+        """Read count coordinate tuples, returning an array of the
+        interleaved x and y values.
+        """
+        values = array('d')
+        values.frombytes(self.read(8 * dims * count))
+        if endian != _native:
+            values.byteswap()
+        if dims == 2:
+            return values
+        coords = array('d', bytes(16 * count))
+        coords[0::2] = values[0::dims]
+        coords[1::2] = values[1::dims]
+        return coords
+
+    def header(self):
+        """Read the byte order and geometry type, returning a tuple of
+        ``(endian, geometry type, coordinate dimensions)``, or ``None``
+        at the end of the stream.
+        """
+        order = self._read(1)
+        if not order:
+            return None
+        if order == b'\x01':
+            endian = '<'
+        elif order == b'\x00':
+            endian = '>'
+        else:
+            raise ValueError("Invalid WKB byte order %r" % order)
+        code = self.uint(endian)
+        dims = 2 + bool(code & _EWKB_Z) + bool(code & _EWKB_M)
+        if code & _EWKB_SRID:
+            self.read(4)
+        code &= 0x0fffffff
+        if code >= 1000:
+            # ISO WKB encodes Z, M and ZM geometries as 1000 + type etc.
+            dims = 2 + (code // 1000 == 3) + 1
+            code %= 1000
+        if not POINT <= code <= GEOMETRYCOLLECTION:
+            raise ValueError("Unsupported WKB geometry type %d" % code)
+        return endian, code, dims
+
+    def rings(self, endian, dims, allow_empty=False):
+        """Read the rings of a polygon as coordinate arrays without the
+        closing vertices.
+        """
+        rings = []
+        for i in range(self.uint(endian)):
+            rings.append(_open_ring(
+                self.coords(endian, dims, self.uint(endian))))
+        if not rings and not allow_empty:
+            raise ValueError("Empty WKB polygons cannot be part of a "
+                "multipolygon or collection")
+        return rings
+
+    def geometry(self, header=None):
+        header = header or self.header()
+        if header is None:
+            raise ValueError("Unexpected end of WKB data")
+        endian, code, dims = header
+        if code == POINT:
+            x, y = self.coords(endian, dims, 1)
+            if x != x and y != y:
+                return Empty('Point')
+            return pygonal.Vec2(x, y)
+        if code == LINESTRING:
+            return _vec2_array(self.coords(endian, dims, self.uint(endian)))
+        if code == POLYGON:
+            rings = self.rings(endian, dims, allow_empty=True)
+            if not rings:
+                return Empty('Polygon')
+            return _polygon_rings(rings)
+        if code == MULTIPOLYGON:
+            polygons = []
+            for i in range(self.uint(endian)):
+                endian, code, dims = self.header()
+                if code != POLYGON:
+                    raise ValueError(
+                        "Expected WKB polygon in multipolygon, got type %d"
+                        % code)
+                polygons.append(self.rings(endian, dims))
+            return _multipolygon(polygons)
+        parts = [self.geometry() for i in range(self.uint(endian))]
+        if code == MULTIPOINT:
+            return MultiPoint.from_points(parts)
+        if code == MULTILINESTRING:
+            return MultiLineString(parts)
+        return parts
+
+
+def loads(data):
+    """Decode a single geometry from WKB data.
+
+    :param data: The WKB data as bytes, or as a hex string as used by
+        PostGIS text dumps.
+    :return: The decoded geometry.
+    """
+    if isinstance(data, str):
+        data = bytes.fromhex(data)
+    return _Reader(io.BytesIO(data)).geometry()
+
+
+def load(fp):
+    """Decode a single geometry from a binary file-like object. Only the
+    bytes of the geometry are read from the file.
+
+    :param fp: A file-like object opened for binary reading.
+    :return: The decoded geometry.
+    """
+    return _Reader(fp).geometry()
+
+
+def iter_load(fp):
+    """Iterate over the geometries in a stream of concatenated WKB
+    geometries. The stream is read incrementally, one geometry at a time,
+    so streams of any size can be processed.
+
+    :param fp: A file-like object opened for binary reading.
+    """
+    reader = _Reader(fp)
+    while True:
+        header = reader.header()
+        if header is None:
+            return
+        yield reader.geometry(header)
+
+
+def load_collection(fp):
+    """Read a stream of concatenated WKB polygons and multipolygons
+    straight into a :class:`~pygonal.PolygonCollection`. The vertices are
+    copied directly into the collection's buffer, without creating
+    intermediate polygon objects.
+
+    :param fp: A file-like object opened for binary reading, or WKB data
+        as bytes.
+    :rtype: :class:`~pygonal.PolygonCollection`
+    """
+    if isinstance(fp, (bytes, bytearray, memoryview)):
+        fp = io.BytesIO(fp)
+    reader = _Reader(fp)
+    coords = array('d')
+    offsets = array('l', [0])
+    while True:
+        header = reader.header()
+        if header is None:
+            break
+        endian, code, dims = header
+        if code == MULTIPOLYGON:
+            headers = (reader.header() for i in range(reader.uint(endian)))
+        else:
+            headers = (header,)
+        for endian, code, dims in headers:
+            if code != POLYGON:
+                raise ValueError(
+                    "Expected WKB polygon or multipolygon, got type %d" % code)
+            rings = reader.rings(endian, dims)
+            if len(rings) > 1:
+                raise ValueError("WKB polygons with holes cannot be loaded "
+                    "into a PolygonCollection")
+            coords.extend(rings[0])
+            offsets.append(len(coords) // 2)
+    return pygonal.PolygonCollection.from_buffers(coords, offsets)
+
+
+def _coords_bytes(coords):
+    # WKB coordinates are always doubles, also for single precision
+    # collections
+    if (_native != '<' or not isinstance(coords, array)
+        or coords.typecode != 'd'):
+        coords = array('d', coords)
+    if _native != '<':
+        coords.byteswap()
+    return coords.tobytes()
+
+
+_empty_point = array('d', [float('nan')] * 2)
+
+
+def _ring_bytes(coords):
+    return _uint['<'].pack(len(coords) // 2 + 1) + _coords_bytes(
+        coords) + _coords_bytes(coords[:2])
+
+
+def _header(code):
+    return b'\x01' + _uint['<'].pack(code)
+
+
+def _polygon_bytes(rings):
+    return (_header(POLYGON) + _uint['<'].pack(len(rings))
+        + b''.join([_ring_bytes(ring) for ring in _ring_slices(rings)]))
+
+
+def _flat(points):
+    coords = array('d')
+    for x, y in points:
+        coords.append(x)
+        coords.append(y)
+    return coords
+
+
+def _encode(geometry, out):
+    """Append the WKB encoding of the geometry to the list out."""
+    if isinstance(geometry, pygonal.Vec2):
+        out.append(_header(POINT) + _coords_bytes(geometry))
+    elif isinstance(geometry, pygonal.Polygon):
+        out.append(_header(POLYGON) + _uint['<'].pack(1)
+            + _ring_bytes(_flat(geometry._vectors)))
+    elif isinstance(geometry, MultiPoint):
+        out.append(_header(MULTIPOINT) + _uint['<'].pack(len(geometry)))
+        for point in geometry._vectors:
+            out.append(_header(POINT) + _coords_bytes(point))
+    elif isinstance(geometry, pygonal.Seq2):
+        out.append(_header(LINESTRING) + _uint['<'].pack(len(geometry))
+            + _coords_bytes(_flat(geometry._vectors)))
+    elif isinstance(geometry, pygonal.LineSegment):
+        out.append(_header(LINESTRING) + _uint['<'].pack(2)
+            + _coords_bytes(_flat(geometry.points)))
+    elif isinstance(geometry, pygonal.BoundingBox):
+        _encode(geometry.to_polygon(), out)
+    elif isinstance(geometry, pygonal.PolygonCollection):
+        out.append(_header(MULTIPOLYGON) + _uint['<'].pack(len(geometry)))
+        coords = geometry._coords
+        offsets = geometry._offsets
+        for i in range(len(geometry)):
+            out.append(_header(POLYGON) + _uint['<'].pack(1) + _ring_bytes(
+                coords[offsets[i] * 2:offsets[i + 1] * 2]))
+    elif isinstance(geometry, pygonal.PolygonWithHoles):
+        out.append(_polygon_bytes(geometry.rings))
+    elif isinstance(geometry, pygonal.MultiPolygon):
+        out.append(_header(MULTIPOLYGON) + _uint['<'].pack(len(geometry)))
+        for poly in geometry:
+            out.append(_polygon_bytes(poly.rings))
+    elif isinstance(geometry, Empty):
+        if geometry.geometry_type == 'Point':
+            out.append(_header(POINT) + _coords_bytes(_empty_point))
+        else:
+            out.append(_header(POLYGON) + _uint['<'].pack(0))
+    elif isinstance(geometry, MultiLineString):
+        out.append(_header(MULTILINESTRING) + _uint['<'].pack(len(geometry)))
+        for line in geometry:
+            coords = _flat(line)
+            out.append(_header(LINESTRING) + _uint['<'].pack(len(coords) // 2)
+                + _coords_bytes(coords))
+    elif isinstance(geometry, list):
+        out.append(_header(GEOMETRYCOLLECTION)
+            + _uint['<'].pack(len(geometry)))
+        for part in geometry:
+            _encode(part, out)
+    else:
+        raise TypeError("Cannot encode %s as WKB" % type(geometry).__name__)
+
+
+def dumps(geometry, hex=False):
+    """Encode a geometry as little-endian WKB.
+
+    :param geometry: The geometry to encode. A list of geometries is
+        encoded as a GeometryCollection.
+    :param hex: If True, return the WKB as an upper case hex string.
+    :type hex: bool
+    :rtype: bytes or str
+    """
+    out = []
+    _encode(geometry, out)
+    data = b''.join(out)
+    if hex:
+        return data.hex().upper()
+    return data
+
+
+def dump(geometry, fp):
+    """Write a geometry as little-endian WKB to a binary file-like
+    object. Geometries written consecutively to the same file can be
+    read back using :func:`iter_load`.
+
+    :param geometry: The geometry to encode.
+    :param fp: A file-like object opened for binary writing.
+    """
+    out = []
+    _encode(geometry, out)
+    for chunk in out:
+        fp.write(chunk)
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
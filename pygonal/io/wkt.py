@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import absolute_import, division
+import re
+from array import array
+import pygonal
+from pygonal.io import (MultiPoint, MultiLineString, Empty, _vec2_array,
+    _open_ring, _polygon_rings, _multipolygon, _ring_slices)
+
+# Reader and writer for the Well-Known Text geometry format, including the
+# SRID prefix of the PostGIS extended variant (EWKT). Geometries map to
+# pygonal types the same way as in pygonal.io.wkb. Z and M coordinates
+# and SRIDs are dropped when reading. POINT EMPTY and POLYGON EMPTY are
+# read as pygonal.io.Empty, other empty geometries as empty sequences.
+#
+# The tokenizer matches each innermost parenthesized list of coordinates as
+# a single token, and converts its numbers straight into an array of floats
+# in one call, so no Python objects are created per coordinate tuple.
+
+_tokens = re.compile(r'''\s*(?:
+    (?P<coords>\([^()]*\)) |
+    (?P<word>[A-Za-z]+) |
+    (?P<open>\() |
+    (?P<close>\)) |
+    (?P<comma>,)
+    )''', re.X)
+
+_dimensions = {'Z': 3, 'M': 3, 'ZM': 4}
+
+
+class _Parser(object):
+
+    def __init__(self, text):
+        if text[:5].upper() == 'SRID=':
+            text = text[text.index(';') + 1:]
+        self._text = text
+        self._pos = 0
+
+    def token(self):
+        match = _tokens.match(self._text, self._pos)
+        if match is None or match.end() == self._pos:
+            if self._text[self._pos:].strip():
+                raise ValueError("Invalid WKT at position %d" % self._pos)
+            raise ValueError("Unexpected end of WKT data")
+        self._pos = match.end()
+        return match.lastgroup, match.group(match.lastgroup)
+
+    def expect(self, kind):
+        token, value = self.token()
+        if token != kind:
+            raise ValueError(
+                "Invalid WKT: expected %s, got %r" % (kind, value))
+        return value
+
+    def at_end(self):
+        return not self._text[self._pos:].strip()
+
+    def coords(self, text, dims):
+        """Convert a parenthesized coordinate list to an array of
+        interleaved x and y values.
+        """
+        text = text[1:-1]
+        values = array('d', map(float, text.replace(',', ' ').split()))
+        if dims is None:
+            first = text.split(',', 1)[0]
+            dims = len(first.split())
+        if dims < 2 or len(values) % dims:
+            raise ValueError("Invalid WKT coordinates %r" % text[:80])
+        if dims == 2:
+            return values
+        count = len(values) // dims
+        coords = array('d', bytes(16 * count))
+        coords[0::2] = values[0::dims]
+        coords[1::2] = values[1::dims]
+        return coords
+
+    def coords_list(self, dims):
+        """Parse a parenthesized list of coordinate lists."""
+        self.expect('open')
+        items = []
+        while True:
+            items.append(self.coords(self.expect('coords'), dims))
+            token, value = self.token()
+            if token == 'close':
+                return items
+            if token != 'comma':
+                raise ValueError("Invalid WKT: unexpected %r" % value)
+
+    def polygon_rings(self, dims):
+        return [_open_ring(ring) for ring in self.coords_list(dims)]
+
+    def geometry(self):
+        kind = self.expect('word').upper()
+        token, value = self.token()
+        dims = None
+        if token == 'word' and value.upper() in _dimensions:
+            dims = _dimensions[value.upper()]
+            token, value = self.token()
+        if token == 'word' and value.upper() == 'EMPTY':
+            return self.empty(kind)
+        # Push back the token following the type name
+        self._pos -= len(value)
+        if kind == 'POINT':
+            coords = self.coords(self.expect('coords'), dims)
+            if len(coords) != 2:
+                raise ValueError("Invalid WKT point")
+            return pygonal.Vec2(coords[0], coords[1])
+        if kind == 'LINESTRING':
+            return _vec2_array(self.coords(self.expect('coords'), dims))
+        if kind == 'POLYGON':
+            return _polygon_rings(self.polygon_rings(dims))
+        if kind == 'MULTIPOINT':
+            token, value = self.token()
+            if token == 'coords':
+                return _vec2_array(self.coords(value, dims), MultiPoint)
+            self._pos -= len(value)
+            coords = array('d')
+            for point in self.coords_list(dims):
+                coords.extend(point)
+            return _vec2_array(coords, MultiPoint)
+        if kind == 'MULTILINESTRING':
+            return MultiLineString(
+                [_vec2_array(line) for line in self.coords_list(dims)])
+        if kind == 'MULTIPOLYGON':
+            polygons = []
+            self.expect('open')
+            while True:
+                polygons.append(self.polygon_rings(dims))
+                token, value = self.token()
+                if token == 'close':
+                    return _multipolygon(polygons)
+                if token != 'comma':
+                    raise ValueError("Invalid WKT: unexpected %r" % value)
+        if kind == 'GEOMETRYCOLLECTION':
+            self.expect('open')
+            parts = []
+            while True:
+                parts.append(self.geometry())
+                token, value = self.token()
+                if token == 'close':
+                    return parts
+                if token != 'comma':
+                    raise ValueError("Invalid WKT: unexpected %r" % value)
+        raise ValueError("Unsupported WKT geometry type %r" % kind)
+
+    def empty(self, kind):
+        if kind == 'POINT':
+            return Empty('Point')
+        if kind == 'POLYGON':
+            return Empty('Polygon')
+        if kind == 'LINESTRING':
+            return pygonal.Vec2Array()
+        if kind == 'MULTIPOINT':
+            return MultiPoint()
+        if kind == 'MULTILINESTRING':
+            return MultiLineString()
+        if kind == 'MULTIPOLYGON':
+            return pygonal.PolygonCollection()
+        if kind == 'GEOMETRYCOLLECTION':
+            return []
+        raise ValueError("Unsupported WKT geometry type %r" % kind)
+
+
+def loads(text):
+    """Decode a geometry from WKT.
+
+    :param text: The WKT string, optionally prefixed by a PostGIS
+        ``SRID=<srid>;``.
+    :type text: str
+    :return: The decoded geometry.
+    """
+    parser = _Parser(text)
+    geometry = parser.geometry()
+    if not parser.at_end():
+        raise ValueError("Unexpected data after WKT geometry")
+    return geometry
+
+
+def load(fp):
+    """Decode a geometry from a text file-like object containing WKT.
+
+    :param fp: A file-like object opened for reading.
+    :return: The decoded geometry.
+    """
+    return loads(fp.read())
+
+
+_trailing_zeros = re.compile(r'(\.[0-9]*[1-9])0+(?=[ ,)])|\.0+(?=[ ,)])')
+
+
+def _strip_zeros(match):
+    return match.group(1) or ''
+
+
+def _coords_text(points, fmt):
+    return '(%s)' % ', '.join([fmt % p for p in points])
+
+
+def _ring_text(points, fmt):
+    points = list(points)
+    return '(%s, %s)' % (
+        ', '.join([fmt % p for p in points]), fmt % points[0])
+
+
+def _rings_text(rings, fmt):
+    return '(%s)' % ', '.join([_ring_text(zip(ring[0::2], ring[1::2]), fmt)
+        for ring in _ring_slices(rings)])
+
+
+def _encode(geometry, fmt):
+    if isinstance(geometry, pygonal.Vec2):
+        return 'POINT ' + _coords_text([geometry], fmt)
+    elif isinstance(geometry, pygonal.Polygon):
+        return 'POLYGON (%s)' % _ring_text(geometry._vectors, fmt)
+    elif isinstance(geometry, MultiPoint):
+        if not len(geometry):
+            return 'MULTIPOINT EMPTY'
+        return 'MULTIPOINT (%s)' % ', '.join(
+            [_coords_text([point], fmt) for point in geometry._vectors])
+    elif isinstance(geometry, pygonal.Seq2):
+        if not len(geometry):
+            return 'LINESTRING EMPTY'
+        return 'LINESTRING ' + _coords_text(geometry._vectors, fmt)
+    elif isinstance(geometry, pygonal.LineSegment):
+        return 'LINESTRING ' + _coords_text(geometry.points, fmt)
+    elif isinstance(geometry, pygonal.BoundingBox):
+        return _encode(geometry.to_polygon(), fmt)
+    elif isinstance(geometry, pygonal.PolygonCollection):
+        if not len(geometry):
+            return 'MULTIPOLYGON EMPTY'
+        return 'MULTIPOLYGON (%s)' % ', '.join(['(%s)' % _ring_text(
+            zip(ring[0::2], ring[1::2]), fmt)
+            for ring in _ring_slices(geometry)])
+    elif isinstance(geometry, pygonal.PolygonWithHoles):
+        return 'POLYGON ' + _rings_text(geometry.rings, fmt)
+    elif isinstance(geometry, pygonal.MultiPolygon):
+        if not len(geometry):
+            return 'MULTIPOLYGON EMPTY'
+        return 'MULTIPOLYGON (%s)' % ', '.join(
+            [_rings_text(poly.rings, fmt) for poly in geometry])
+    elif isinstance(geometry, Empty):
+        return geometry.geometry_type.upper() + ' EMPTY'
+    elif isinstance(geometry, MultiLineString):
+        if not geometry:
+            return 'MULTILINESTRING EMPTY'
+        return 'MULTILINESTRING (%s)' % ', '.join(
+            [_coords_text(line, fmt) for line in geometry])
+    elif isinstance(geometry, list):
+        if not geometry:
+            return 'GEOMETRYCOLLECTION EMPTY'
+        return 'GEOMETRYCOLLECTION (%s)' % ', '.join(
+            [_encode(part, fmt) for part in geometry])
+    raise TypeError("Cannot encode %s as WKT" % type(geometry).__name__)
+
+
+def dumps(geometry, precision=None):
+    """Encode a geometry as WKT.
+
+    :param geometry: The geometry to encode. A list of geometries is
+        encoded as a GEOMETRYCOLLECTION.
+    :param precision: The number of decimal places written for each
+        coordinate, with trailing zeros removed. If omitted, coordinates
+        are written exactly, so that they read back unchanged.
+    :type precision: int
+    :rtype: str
+    """
+    if precision is None:
+        return _encode(geometry, '%r %r')
+    fmt = '%%.%df %%.%df' % (precision, precision)
+    return _trailing_zeros.sub(_strip_zeros, _encode(geometry, fmt))
+
+
+def dump(geometry, fp, precision=None):
+    """Write a geometry as WKT to a text file-like object.
+    See :func:`dumps`.
+    """
+    fp.write(dumps(geometry, precision))
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
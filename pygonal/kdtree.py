@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+import heapq
+import math
+from array import array
+import pygonal
+
+
+class KDTree(object):
+    """Static 2D tree of points for fast proximity queries.
+
+    The tree is bulk-built once from the points supplied and cannot be
+    modified afterwards. It is stored implicitly in flat arrays: the
+    points are permuted so that each subtree occupies a contiguous range,
+    with the splitting point in the middle of the range. No Python object
+    is created per node.
+
+    Query results refer to points by their index in the original sequence.
+
+    :param points: Sequence of points, e.g. a :class:`~pygonal.Vec2Array`.
+    :param leaf_size: Ranges of at most this many points are scanned
+        linearly rather than split further.
+    :type leaf_size: int
+    :param typecode: The array typecode used to store the points, ``'d'``
+        for double precision or ``'f'`` for single precision, which halves
+        the memory used. Distances are computed in double precision from
+        the stored coordinates.
+    :type typecode: str
+    """
+
+    def __init__(self, points, leaf_size=16, typecode='d'):
+        if typecode not in ('d', 'f'):
+            raise ValueError("KDTree(): typecode must be 'd' or 'f', not %r"
+                % (typecode,))
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        xs = array(typecode)
+        ys = array(typecode)
+        for x, y in points:
+            xs.append(x)
+            ys.append(y)
+        count = len(xs)
+        self._leaf_size = leaf_size = max(int(leaf_size), 1)
+        order = list(range(count))
+        dims = bytearray(count)
+        stack = [(0, count)]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= leaf_size:
+                continue
+            # Split along the dimension with the largest spread
+            sub = order[lo:hi]
+            sub_xs = [xs[i] for i in sub]
+            sub_ys = [ys[i] for i in sub]
+            if max(sub_ys) - min(sub_ys) > max(sub_xs) - min(sub_xs):
+                coords = ys
+                dim = 1
+            else:
+                coords = xs
+                dim = 0
+            sub.sort(key=coords.__getitem__)
+            order[lo:hi] = sub
+            mid = (lo + hi) // 2
+            dims[mid] = dim
+            stack.append((lo, mid))
+            stack.append((mid + 1, hi))
+        self._xs = array(typecode, [xs[i] for i in order])
+        self._ys = array(typecode, [ys[i] for i in order])
+        self._index = array('l', order)
+        self._dims = dims
+
+    def __len__(self):
+        return len(self._index)
+
+    def knn(self, point, k=1):
+        """Find the ``k`` points nearest to the specified point.
+
+        Runtime complexity: O(k log n) expected
+
+        :param point: The query point.
+        :type point: :class:`~pygonal.Vec2`
+        :param k: Number of neighbors to find.
+        :type k: int
+        :return: List of ``(distance, index)`` tuples sorted by distance.
+        :rtype: list
+        """
+        if k < 1:
+            raise ValueError("KDTree.knn(): k must be at least 1, not %r"
+                % (k,))
+        px, py = point
+        xs = self._xs
+        ys = self._ys
+        dims = self._dims
+        leaf_size = self._leaf_size
+        heap = [] # max-heap of (-distance2, position)
+        push = heapq.heappush
+        replace = heapq.heapreplace
+        worst = float('inf')
+        stack = [(0, len(xs), 0.0)]
+        while stack:
+            lo, hi, bound = stack.pop()
+            if bound > worst:
+                continue
+            if hi - lo <= leaf_size:
+                for i in range(lo, hi):
+                    dx = xs[i] - px
+                    dy = ys[i] - py
+                    d2 = dx*dx + dy*dy
+                    if len(heap) < k:
+                        push(heap, (-d2, i))
+                        if len(heap) == k:
+                            worst = -heap[0][0]
+                    elif d2 < worst:
+                        replace(heap, (-d2, i))
+                        worst = -heap[0][0]
+                continue
+            mid = (lo + hi) // 2
+            dx = xs[mid] - px
+            dy = ys[mid] - py
+            d2 = dx*dx + dy*dy
+            if len(heap) < k:
+                push(heap, (-d2, mid))
+                if len(heap) == k:
+                    worst = -heap[0][0]
+            elif d2 < worst:
+                replace(heap, (-d2, mid))
+                worst = -heap[0][0]
+            diff = -dy if dims[mid] else -dx
+            if diff < 0.0:
+                stack.append((mid + 1, hi, diff * diff))
+                stack.append((lo, mid, 0.0))
+            else:
+                stack.append((lo, mid, diff * diff))
+                stack.append((mid + 1, hi, 0.0))
+        index = self._index
+        return sorted((math.sqrt(-d2), index[i]) for d2, i in heap)
+
+    def nearest(self, point):
+        """Find the point nearest to the specified point.
+
+        :param point: The query point.
+        :type point: :class:`~pygonal.Vec2`
+        :return: A ``(distance, index)`` tuple.
+        :rtype: tuple
+        """
+        if not len(self):
+            raise ValueError("KDTree.nearest(): tree is empty")
+        return self.knn(point, 1)[0]
+
+    def query_radius(self, point, radius):
+        """Find all points within the specified distance of a point.
+        Points exactly at the given distance are included.
+
+        :param point: The query point.
+        :type point: :class:`~pygonal.Vec2`
+        :param radius: The maximum distance from the query point.
+        :type radius: float
+        :return: Sorted list of indices of the points found.
+        :rtype: list of int
+        """
+        px, py = point
+        xs = self._xs
+        ys = self._ys
+        dims = self._dims
+        index = self._index
+        leaf_size = self._leaf_size
+        r2 = radius * radius
+        found = []
+        add = found.append
+        stack = [(0, len(xs))]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= leaf_size:
+                for i in range(lo, hi):
+                    dx = xs[i] - px
+                    dy = ys[i] - py
+                    if dx*dx + dy*dy <= r2:
+                        add(index[i])
+                continue
+            mid = (lo + hi) // 2
+            dx = xs[mid] - px
+            dy = ys[mid] - py
+            if dx*dx + dy*dy <= r2:
+                add(index[mid])
+            diff = -dy if dims[mid] else -dx
+            if diff < 0.0:
+                stack.append((lo, mid))
+                if diff * diff <= r2:
+                    stack.append((mid + 1, hi))
+            else:
+                stack.append((mid + 1, hi))
+                if diff * diff <= r2:
+                    stack.append((lo, mid))
+        found.sort()
+        return found
+
+    def knn_many(self, points, k=1):
+        """Find the ``k`` nearest neighbors for each of the specified
+        query points. See :meth:`knn`.
+
+        :param points: Iterable of query points.
+        :rtype: list of lists
+        """
+        if k < 1:
+            raise ValueError(
+                "KDTree.knn_many(): k must be at least 1, not %r" % (k,))
+        knn = self.knn
+        return [knn(p, k) for p in points]
+
+    def query_radius_many(self, points, radius):
+        """Find the points within the specified distance for each of the
+        specified query points. See :meth:`query_radius`.
+
+        :param points: Iterable of query points.
+        :rtype: list of lists
+        """
+        query = self.query_radius
+        return [query(p, radius) for p in points]
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+from array import array
+import pygonal
+
+
+class PolygonWithHoles(object):
+    """Polygon with an exterior ring and any number of interior rings,
+    or holes.
+
+    All rings share a single vertex buffer, a
+    :class:`~pygonal.PolygonCollection`. Containment is tested against
+    the bounding box of the exterior ring first, then the exterior ring,
+    and only then against the holes whose bounding boxes contain the
+    point. Each ring is a :class:`~pygonal.Polygon` when tested, so the
+    strategies of :meth:`Polygon.contains_point
+    <pygonal.Polygon.contains_point>` apply to each of them.
+
+    :param exterior: A :class:`~pygonal.Polygon` or sequence of three or
+        more vertices.
+    :param interiors: Iterable of polygons or vertex sequences of the
+        holes. Holes are assumed to lie inside the exterior ring and not
+        to overlap each other, this is not checked.
+    """
+
+    def __init__(self, exterior, interiors=()):
+        rings = [exterior]
+        rings.extend(interiors)
+        self._init_rings(pygonal.PolygonCollection(rings))
+
+    @classmethod
+    def from_buffers(cls, coords, offsets, flags=None):
+        """Create a polygon over existing buffers without copying them,
+        see :meth:`PolygonCollection.from_buffers
+        <pygonal.PolygonCollection.from_buffers>`. The first ring is the
+        exterior, the others are holes.
+        """
+        self = cls.__new__(cls)
+        self._init_rings(
+            pygonal.PolygonCollection.from_buffers(coords, offsets, flags))
+        return self
+
+    def _init_rings(self, rings, boxes=None):
+        if not len(rings):
+            raise ValueError("%s(): an exterior ring is required"
+                % self.__class__.__name__)
+        self._rings = rings
+        self._boxes = boxes
+        self._exterior = None
+        self._interiors = None
+
+    @property
+    def rings(self):
+        """The rings of the polygon, exterior first.
+
+        :rtype: :class:`~pygonal.PolygonCollection`
+        """
+        return self._rings
+
+    @property
+    def exterior(self):
+        """The exterior ring.
+
+        :rtype: :class:`~pygonal.Polygon`
+        """
+        if self._exterior is None:
+            self._exterior = self._rings[0]
+        return self._exterior
+
+    @property
+    def interiors(self):
+        """The interior rings, or holes.
+
+        :rtype: list of :class:`~pygonal.Polygon`
+        """
+        if self._interiors is None:
+            self._interiors = list(self._rings[1:])
+        return self._interiors
+
+    def _ring_boxes(self):
+        if self._boxes is None:
+            self._boxes = self._rings.bounding_boxes()
+        return self._boxes
+
+    @property
+    def bounding_box(self):
+        """The bounding box of the exterior ring."""
+        return self._ring_boxes()[0]
+
+    @property
+    def area(self):
+        """The area of the exterior ring less the area of the holes."""
+        areas = self._rings.areas()
+        return areas[0] - sum(areas[1:])
+
+    def contains_point(self, point):
+        """Return True if the specified point is inside the exterior
+        ring and not inside any of the holes.
+
+        :param point: A point vector.
+        :type point: :class:`~pygonal.Vec2`
+        :rtype: bool
+        """
+        boxes = self._ring_boxes()
+        min_x = boxes._min_x
+        min_y = boxes._min_y
+        max_x = boxes._max_x
+        max_y = boxes._max_y
+        x, y = point
+        if not (min_x[0] <= x <= max_x[0] and min_y[0] <= y <= max_y[0]):
+            return False
+        if not self.exterior.contains_point(point):
+            return False
+        for i in range(1, len(min_x)):
+            if (min_x[i] <= x <= max_x[i] and min_y[i] <= y <= max_y[i]
+                and self.interiors[i - 1].contains_point(point)):
+                return False
+        return True
+
+    def contains_points(self, points):
+        """Return a list of bools indicating which of the specified
+        points are inside the polygon. See :meth:`contains_point`.
+
+        :param points: Iterable of point vectors, e.g. a
+            :class:`~pygonal.Vec2Array`.
+        :rtype: list of bool
+        """
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        contains = self.contains_point
+        return [contains(point) for point in points]
+
+    def __reduce__(self):
+        # The rings may be views of a multipolygon's buffer, which cannot
+        # be pickled, so they are reduced to plain buffers
+        return (self.__class__.from_buffers, _ring_buffers(self._rings))
+
+    def __eq__(self, other):
+        return (self.__class__ is other.__class__
+            and self.exterior == other.exterior
+            and self.interiors == other.interiors)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        raise TypeError("unhashable type: %s" % self.__class__.__name__)
+
+    def __repr__(self):
+        return "%s(%r, [%s])" % (self.__class__.__name__, self.exterior,
+            ', '.join(repr(hole) for hole in self.interiors))
+
+    __str__ = __repr__
+
+
+class MultiPolygon(object):
+    """Collection of polygons, with or without holes, treated as a
+    single shape.
+
+    The rings of all polygons share a single vertex buffer. Containment
+    is only tested against the polygons whose exterior bounding box
+    contains the point.
+
+    :param polygons: Iterable of :class:`PolygonWithHoles` objects,
+        :class:`~pygonal.Polygon` objects or vertex sequences.
+    """
+
+    def __init__(self, polygons=()):
+        rings = []
+        parts = array('l', [0])
+        for poly in polygons:
+            if isinstance(poly, PolygonWithHoles):
+                rings.extend(poly._rings)
+            else:
+                rings.append(poly)
+            parts.append(len(rings))
+        self._init(pygonal.PolygonCollection(rings), parts)
+
+    @classmethod
+    def from_buffers(cls, coords, offsets, parts, flags=None):
+        """Create a multipolygon over existing buffers without copying
+        them.
+
+        :param coords: Buffer of interleaved x and y coordinates of all
+            rings.
+        :param offsets: Vertex offsets of the rings, see
+            :meth:`PolygonCollection.from_buffers
+            <pygonal.PolygonCollection.from_buffers>`.
+        :param parts: Sequence of ``len(multipolygon) + 1`` ring indices,
+            where polygon ``i`` consists of the rings ``parts[i]`` to
+            ``parts[i + 1]``, exterior first.
+        :param flags: Optional mutable buffer of flag bytes, one for each
+            ring.
+        """
+        rings = pygonal.PolygonCollection.from_buffers(coords, offsets, flags)
+        self = cls.__new__(cls)
+        self._init(rings, parts)
+        return self
+
+    def _init(self, rings, parts):
+        if not len(parts) or parts[0] != 0 or parts[-1] != len(rings):
+            raise ValueError("%s(): parts do not match the number of rings"
+                % self.__class__.__name__)
+        for i in range(len(parts) - 1):
+            if parts[i + 1] <= parts[i]:
+                raise ValueError("%s(): each polygon requires an exterior "
+                    "ring" % self.__class__.__name__)
+        self._rings = rings
+        self._parts = parts
+        self._polygons = None
+        self._boxes = None
+
+    @property
+    def rings(self):
+        """The rings of all polygons.
+
+        :rtype: :class:`~pygonal.PolygonCollection`
+        """
+        return self._rings
+
+    def __len__(self):
+        return len(self._parts) - 1
+
+    def _ring_boxes(self):
+        if self._boxes is None:
+            self._boxes = self._rings.bounding_boxes()
+        return self._boxes
+
+    def _polygon_views(self):
+        """Return the polygons as views of the shared vertex buffer."""
+        if self._polygons is None:
+            rings = self._rings
+            offsets = rings._offsets
+            coords = memoryview(rings._coords)
+            flags = memoryview(rings._flags)
+            boxes = self._ring_boxes()
+            parts = self._parts
+            polygons = []
+            for i in range(len(parts) - 1):
+                first = parts[i]
+                last = parts[i + 1]
+                start = offsets[first]
+                poly = PolygonWithHoles.__new__(PolygonWithHoles)
+                poly._init_rings(pygonal.PolygonCollection.from_buffers(
+                        coords[start * 2:offsets[last] * 2],
+                        array('l', [offsets[j] - start
+                            for j in range(first, last + 1)]),
+                        flags[first:last]),
+                    boxes[first:last])
+                polygons.append(poly)
+            self._polygons = polygons
+        return self._polygons
+
+    def __getitem__(self, index):
+        """Return the polygon at the given index, as a
+        :class:`PolygonWithHoles` sharing the vertex buffer of the
+        multipolygon.
+        """
+        if isinstance(index, slice):
+            return self.__class__(self._polygon_views()[index])
+        return self._polygon_views()[index]
+
+    def __iter__(self):
+        return iter(self._polygon_views())
+
+    @property
+    def bounding_box(self):
+        """The bounding box enclosing all polygons."""
+        return self._ring_boxes().bounding_box
+
+    @property
+    def area(self):
+        """The total area of the polygons, less the area of their holes."""
+        return sum(poly.area for poly in self._polygon_views())
+
+    def contains_point(self, point):
+        """Return True if the specified point is inside any of the
+        polygons.
+
+        :param point: A point vector.
+        :type point: :class:`~pygonal.Vec2`
+        :rtype: bool
+        """
+        boxes = self._ring_boxes()
+        min_x = boxes._min_x
+        min_y = boxes._min_y
+        max_x = boxes._max_x
+        max_y = boxes._max_y
+        x, y = point
+        parts = self._parts
+        polygons = self._polygon_views()
+        for i in range(len(parts) - 1):
+            j = parts[i]
+            if (min_x[j] <= x <= max_x[j] and min_y[j] <= y <= max_y[j]
+                and polygons[i].contains_point(point)):
+                return True
+        return False
+
+    def contains_points(self, points):
+        """Return a list of bools indicating which of the specified
+        points are inside any of the polygons. See :meth:`contains_point`.
+
+        :param points: Iterable of point vectors, e.g. a
+            :class:`~pygonal.Vec2Array`.
+        :rtype: list of bool
+        """
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        contains = self.contains_point
+        return [contains(point) for point in points]
+
+    def __reduce__(self):
+        # Drops the cached polygon views, which cannot be pickled
+        coords, offsets, flags = _ring_buffers(self._rings)
+        return (self.__class__.from_buffers,
+            (coords, offsets, array('l', self._parts), flags))
+
+    def __eq__(self, other):
+        return (self.__class__ is other.__class__
+            and len(self) == len(other)
+            and all(a == b for a, b in zip(self, other)))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        raise TypeError("unhashable type: %s" % self.__class__.__name__)
+
+    def __repr__(self):
+        return "%s([%s])" % (self.__class__.__name__,
+            ', '.join(repr(poly) for poly in self))
+
+    __str__ = __repr__
+
+
+def _ring_buffers(rings):
+    """Return copies of the coordinates, offsets and flags of a
+    PolygonCollection as plain arrays, as arguments for from_buffers().
+    """
+    return (array(rings.typecode, rings._coords), array('l', rings._offsets),
+        bytearray(rings._flags))
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygonal
+
+# Batch queries split across a pool of threads. Shapes cache derived
+# properties lazily; these are computed up front by prewarm() so that the
+# worker threads only read shared state. Polygon caches are published
+# atomically once complete, so sharing a polygon that is not prewarmed is
+# safe too, but may compute the same property in several threads.
+
+
+def prewarm(shape, point=None):
+    """Compute the lazily cached properties of a shape used by its
+    ``contains_point()`` method, so that the shape can be queried from
+    several threads without duplicating that work.
+
+    :param shape: The shape to prepare, e.g. a :class:`~pygonal.Polygon`.
+    :param point: An optional sample point. Triangles prepare their
+        point-in-triangle test on first use with a point.
+    """
+    if isinstance(shape, pygonal.Polygon):
+        shape.is_convex
+        shape.bounding_box
+        if len(shape) == 3 and point is not None:
+            shape.contains_point(point)
+
+def contains_points(shape, points, executor=None, workers=None,
+    chunk_size=None):
+    """Return a list of bools indicating which of the specified points
+    are contained in a shape, testing chunks of the points concurrently.
+
+    On interpreters with a global interpreter lock this mostly helps by
+    overlapping with other work; free-threaded builds run the chunks in
+    parallel.
+
+    :param shape: A shape with a ``contains_points()`` method, e.g. a
+        :class:`~pygonal.Polygon`, :class:`~pygonal.BoundingBox` or
+        :class:`~pygonal.Circle`.
+    :param points: Sequence of point vectors, e.g. a
+        :class:`~pygonal.Vec2Array`.
+    :param executor: A :class:`concurrent.futures.Executor` to run the
+        chunks. If omitted, a thread pool is created for the call.
+    :param workers: The number of threads of the pool created, defaults
+        to the number of CPUs.
+    :type workers: int
+    :param chunk_size: The number of points tested per task. Defaults to
+        splitting the points into four chunks per worker.
+    :type chunk_size: int
+    :rtype: list of bool
+    """
+    if isinstance(points, pygonal.Seq2):
+        points = points._vectors
+    elif not isinstance(points, (list, tuple)):
+        points = list(points)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError("contains_points(): workers must be positive")
+    if chunk_size is None:
+        chunk_size = max(-(-len(points) // (workers * 4)), 1)
+    elif chunk_size < 1:
+        raise ValueError("contains_points(): chunk_size must be positive")
+    if not points:
+        return []
+    prewarm(shape, points[0])
+    chunks = [points[i:i + chunk_size]
+        for i in range(0, len(points), chunk_size)]
+    if executor is None:
+        with ThreadPoolExecutor(workers) as executor:
+            results = list(executor.map(shape.contains_points, chunks))
+    else:
+        results = list(executor.map(shape.contains_points, chunks))
+    mask = []
+    for result in results:
+        mask.extend(result)
+    return mask
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
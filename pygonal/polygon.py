@@ -29,8 +29,16 @@ except ImportError:
     # Python 3
     pass
 import bisect
+import functools
+import hashlib
+import itertools
+import sys
+from array import array
 import pygonal
+from pygonal import stats
 from pygonal.util import cos_sin_deg
+from pygonal.simplify import simplify_ring
+from pygonal.vector import _pack_vectors, _unpack_vectors
 
 
 class Polygon(pygonal.Seq2):
@@ -73,11 +81,23 @@ class Polygon(pygonal.Seq2):
         ``is_simple`` will be invalidated.
     """
 
+    property_cache = None
+    """Optional :class:`~pygonal.cache.PropertyCache` shared by all
+    polygons. If set, derived properties such as convexity, simplicity and
+    the centroid are stored in the cache when computed, and polygons
+    constructed with the same vertices as a cached polygon are initialized
+    from the cache. Disabled by default.
+    """
+
     def __init__(self, vertices, is_convex=None, is_simple=None):
         super(Polygon, self).__init__(vertices)
         if len(self) < 3:
             raise ValueError("Polygon(): minimum of 3 vertices required")
         self._clear_cached_properties()
+        if self.property_cache is not None and len(self) > 3:
+            props = self.property_cache.get(self.fingerprint)
+            if props is not None:
+                self.__dict__.update(props)
         if is_convex is not None and self._convex is _unknown:
             self._convex = bool(is_convex)
             self._simple = self._convex or _unknown
@@ -117,6 +137,7 @@ class Polygon(pygonal.Seq2):
         poly._min_r = min_r = ((poly[0] + poly[1]) * 0.5 - center).length
         poly._min_r2 = min_r * min_r
         poly._dupe_verts = False
+        poly._bcircle = pygonal.Circle(center, abs(radius))
         return poly
 
     @classmethod
@@ -168,6 +189,7 @@ class Polygon(pygonal.Seq2):
                 poly._min_r2 = min_r * min_r
         if radius1 > 0.0 and radius2 > 0.0:
             poly._dupe_verts = False
+            poly._bcircle = pygonal.Circle(center, max_r)
         return poly
 
     @classmethod
@@ -177,6 +199,86 @@ class Polygon(pygonal.Seq2):
         poly._clear_cached_properties()
         return poly
 
+    @classmethod
+    def from_ragged(cls, coords, offsets, is_convex=None, is_simple=None):
+        """Create many polygons at once from a flat buffer of coordinates,
+        laid out as for :meth:`PolygonCollection.from_buffers
+        <pygonal.PolygonCollection.from_buffers>`. All vertices are
+        converted in a single pass, and the initial state of the polygons
+        is copied rather than reset attribute by attribute, so this is
+        much faster than constructing each polygon separately.
+
+        When creating millions of polygons, much of the remaining time
+        can be spent in garbage collection passes triggered by the
+        allocations. Callers may want to disable the collector with
+        :func:`gc.disable` meanwhile.
+
+        :param coords: Sequence or buffer of interleaved x and y
+            coordinates, e.g. an ``array('d')``.
+        :param offsets: Sequence of ``len(polygons) + 1`` vertex indices
+            into ``coords``, where polygon ``i`` spans the vertices
+            ``offsets[i]`` to ``offsets[i + 1]``.
+        :param is_convex: Optional sequence with a value for each polygon,
+            declaring it convex or non-convex as the ``is_convex``
+            argument of :class:`Polygon` does. None values are unknown.
+        :param is_simple: Optional sequence with a value for each polygon,
+            declaring it simple or non-simple as the ``is_simple``
+            argument of :class:`Polygon` does. None values are unknown.
+        :rtype: list of :class:`Polygon`
+        """
+        count = len(offsets) - 1
+        if count < 0 or offsets[0] != 0:
+            raise ValueError("Polygon.from_ragged(): offsets must start at 0")
+        if offsets[-1] * 2 != len(coords):
+            raise ValueError("Polygon.from_ragged(): "
+                "offsets do not match the number of coordinates")
+        for name, values in (('is_convex', is_convex),
+            ('is_simple', is_simple)):
+            if values is not None and len(values) != count:
+                raise ValueError("Polygon.from_ragged(): expected %d %s "
+                    "values, got %d" % (count, name, len(values)))
+        if cls.property_cache is not None:
+            # Each polygon must be looked up in the cache
+            polys = []
+            for i in range(count):
+                start = offsets[i] * 2
+                end = offsets[i + 1] * 2
+                polys.append(cls(
+                    zip(coords[start:end:2], coords[start + 1:end:2]),
+                    None if is_convex is None else is_convex[i],
+                    None if is_simple is None else is_simple[i]))
+            return polys
+        coords = array('d', coords)
+        Vec2 = pygonal.Vec2
+        vectors = list(map(tuple.__new__, itertools.repeat(Vec2),
+            zip(coords[0::2], coords[1::2])))
+        triangle_state = _initial_state(cls, 3)
+        polygon_state = _initial_state(cls, 4)
+        new = object.__new__
+        polys = []
+        for i in range(count):
+            start = offsets[i]
+            end = offsets[i + 1]
+            sides = end - start
+            if sides < 3:
+                raise ValueError(
+                    "Polygon.from_ragged(): minimum of 3 vertices required")
+            poly = new(cls)
+            state = poly.__dict__
+            state.update(triangle_state if sides == 3 else polygon_state)
+            state['_vectors'] = vectors[start:end]
+            if sides > 3:
+                if is_convex is not None and is_convex[i] is not None:
+                    poly._convex = bool(is_convex[i])
+                    if poly._convex:
+                        poly._simple = True
+                        poly._split_y_polylines()
+                if (is_simple is not None and is_simple[i] is not None
+                    and poly._simple is _unknown):
+                    poly._simple = bool(is_simple[i])
+            polys.append(poly)
+        return polys
+
     def _clear_cached_properties(self):
         if len(self) > 3:
             self._convex = _unknown
@@ -184,13 +286,16 @@ class Polygon(pygonal.Seq2):
         else:
             self._convex = True
             self._simple = True
-            if '_pnp_triangle_test' in self.__dict__:
-                # clear cached closure
-                del self.__dict__['_pnp_triangle_test']
+            # clear cached closure
+            self.__dict__.pop('_pnp_triangle_test', None)
         self._y_polylines = None
+        self._winding = _unknown
         self._dupe_verts = _unknown
         self._degenerate = _unknown
         self._bbox = None
+        self._bcircle = None
+        self._canonical = None
+        self._fingerprint = None
         self._centroid = _unknown
         self._max_r = self._max_r2 = None
         self._min_r = self._min_r2 = None
@@ -202,6 +307,16 @@ class Polygon(pygonal.Seq2):
             self._bbox = pygonal.BoundingBox(self)
         return self._bbox
 
+    @property
+    def bounding_circle(self):
+        """The minimum enclosing circle of the polygon. This is computed
+        in expected O(n) time and cached. Regular polygons and stars know
+        their enclosing circle from construction.
+        """
+        if self._bcircle is None:
+            self._bcircle = pygonal.Circle.from_points(self._vectors)
+        return self._bcircle
+
     @property
     def is_convex(self):
         """True if the polygon is convex.
@@ -211,6 +326,8 @@ class Polygon(pygonal.Seq2):
         """
         if self._convex is _unknown:
             self._classify()
+        elif stats.enabled:
+            stats.count('is_convex.cached')
         return self._convex
 
     @property
@@ -229,17 +346,22 @@ class Polygon(pygonal.Seq2):
         for i in range(len(self)):
             yield self[i] - self[i - 1]
 
+    @stats.timed('classify')
     def _classify(self):
         """Calculate the polygon convexity, winding direction,
         detecting and handling degenerate cases.
 
         Algorithm derived from Graphics Gems IV.
+
+        The results are computed in local variables and published when
+        complete, with the convexity last, so that other threads never
+        observe a partial classification.
         """
         dir_changes = 0
         angle_sign = 0
         count = 0
-        self._convex = True
-        self._winding = 0
+        convex = True
+        winding = 0
         last_delta = self[-1] - self[-2]
         last_dir = (
             (last_delta.x > 0) * -1 or
@@ -258,65 +380,85 @@ class Polygon(pygonal.Seq2):
             cross = last_delta.cross(delta)
             if cross > 0.0: # XXX Should this be cross > pygonal.EPSILON?
                 if angle_sign == -1:
-                    self._convex = False
+                    convex = False
                     break
                 angle_sign = 1
             elif cross < 0.0:
                 if angle_sign == 1:
-                    self._convex = False
+                    convex = False
                     break
                 angle_sign = -1
             last_delta = delta
         if dir_changes <= 2:
-            self._winding = angle_sign
+            winding = angle_sign
         else:
-            self._convex = False
-        self._simple = self._convex or _unknown
-        self._degenerate = not count or not angle_sign
-        if self._convex and not self._degenerate:
+            convex = False
+        degenerate = not count or not angle_sign
+        if convex and not degenerate:
             self._dupe_verts = (count < len(self))
             self._split_y_polylines()
+        self._winding = winding
+        self._degenerate = degenerate
+        self._simple = convex or _unknown
+        self._convex = convex
+        if self.property_cache is not None:
+            self._cache_properties()
 
     def _split_y_polylines(self):
         """Split the polygon into left and right y-monotone polylines.
         This optimizes operations on y-monotone polygons.
+
+        The polylines are stored as a tuple of four parallel lists of
+        floats, the y and x coordinates of the left polyline followed by
+        those of the right polyline, each in order of increasing y. Point
+        queries can then bisect the y coordinates directly.
         """
-        min_y = max_y = self[0].y
-        min_x = max_x = self[0].x
-        min_i = max_i = left_i = right_i = 0
-        for i, vert in enumerate(self):
-            if vert.y < min_y:
-                min_y = vert.y
+        vectors = self._vectors
+        xs = [float(v[0]) for v in vectors]
+        ys = [float(v[1]) for v in vectors]
+        min_y = max_y = ys[0]
+        min_i = max_i = 0
+        area = 0.0
+        x0 = xs[-1]
+        y0 = ys[-1]
+        for i in range(len(ys)):
+            x = xs[i]
+            y = ys[i]
+            if y < min_y:
+                min_y = y
                 min_i = i
-            if vert.y > max_y:
-                max_y = vert.y
+            if y > max_y:
+                max_y = y
                 max_i = i
-            if vert.x < min_x:
-                min_x = vert.x
-                left_i = i
-            if vert.x > max_x:
-                max_x = vert.x
-                right_i = i
-
-        verts_yx = [(y, x) for x, y in self]
+            area += x0 * y - x * y0
+            x0 = x
+            y0 = y
+
+        # Following the vertex order from the bottom to the top
+        # traverses the right side for counter-clockwise polygons
         if min_i < max_i:
-            pl1 = verts_yx[min_i:max_i+1]
-            pl2 = verts_yx[max_i:] + verts_yx[:min_i+1]
-            if min_i <= left_i < max_i or right_i < min_i or right_i > max_i:
-                self._y_polylines = pl1, pl2
-            else:
-                self._y_polylines = pl2, pl1
+            ys1 = ys[min_i:max_i+1]
+            xs1 = xs[min_i:max_i+1]
+            ys2 = ys[max_i:] + ys[:min_i+1]
+            xs2 = xs[max_i:] + xs[:min_i+1]
+            swap = area >= 0.0
         else:
-            pl1 = verts_yx[max_i:min_i+1]
-            pl2 = verts_yx[min_i:] + verts_yx[:max_i+1]
-            if min_i >= left_i > max_i or right_i > min_i or right_i < max_i:
-                self._y_polylines = pl1, pl2
-            else:
-                self._y_polylines = pl2, pl1
-        if pl1[0][0] > pl1[-1][0]:
-            pl1.reverse()
-        if pl2[0][0] > pl2[-1][0]:
-            pl2.reverse()
+            ys1 = ys[max_i:min_i+1]
+            xs1 = xs[max_i:min_i+1]
+            ys2 = ys[min_i:] + ys[:max_i+1]
+            xs2 = xs[min_i:] + xs[:max_i+1]
+            swap = area <= 0.0
+        if ys1[0] > ys1[-1]:
+            ys1.reverse()
+            xs1.reverse()
+        if ys2[0] > ys2[-1]:
+            ys2.reverse()
+            xs2.reverse()
+        # Publish the polylines only once they are complete
+        if swap:
+            self._y_polylines = ys2, xs2, ys1, xs1
+        else:
+            self._y_polylines = ys1, xs1, ys2, xs2
 
     @property
     def is_simple(self):
@@ -333,6 +475,8 @@ class Polygon(pygonal.Seq2):
                 self._classify()
             if self._simple is _unknown:
                 self._check_is_simple()
+        elif stats.enabled:
+            stats.count('is_simple.cached')
         return self._simple
 
     @property
@@ -358,6 +502,7 @@ class Polygon(pygonal.Seq2):
                 or (not dir1) != (not dir2))
         return False
 
+    @stats.timed('check_is_simple')
     def _check_is_simple(self):
         """Check the polygon for self-intersection and cache the result
 
@@ -385,14 +530,28 @@ class Polygon(pygonal.Seq2):
                     if (last_index > abs(index - open_index) > 1
                         and intersects(seg_start, seg_end, open_start, open_end)):
                         self._simple = False
+                        if self.property_cache is not None:
+                            self._cache_properties()
                         return False
                 open_segments[index] = point
             else:
                 # Segment end point
                 del open_segments[index]
         self._simple = True
+        if self.property_cache is not None:
+            self._cache_properties()
         return True
 
+    def _cache_properties(self):
+        """Store the known derived properties in the property cache."""
+        if len(self) > 3:
+            props = {}
+            for name in _shared_properties:
+                value = getattr(self, name)
+                if value is not _unknown and value is not None:
+                    props[name] = value
+            self.property_cache.put(self.fingerprint, props)
+
     @property
     def centroid(self):
         """The geometric center point of the polygon. This point only exists
@@ -421,6 +580,8 @@ class Polygon(pygonal.Seq2):
                     total_area += area
                     b = c
                 self._centroid = centroid / (3.0 * total_area)
+                if self.property_cache is not None:
+                    self._cache_properties()
             else:
                 self._centroid = None
         return self._centroid
@@ -437,64 +598,62 @@ class Polygon(pygonal.Seq2):
         super(Polygon, self).__setitem__(index, vert)
         self._clear_cached_properties()
 
+    def _canonical_form(self):
+        """Return the vertices as a tuple of coordinate tuples in a
+        canonical order: the lexicographically least of all rotations of
+        the vertices in either winding direction. Polygons are equal if
+        and only if their canonical forms are equal. The result is cached.
+
+        Runtime complexity: O(n)
+        """
+        if self._canonical is None:
+            # Adding 0.0 normalizes -0.0, which compares equal to 0.0
+            verts = [(x + 0.0, y + 0.0) for x, y in self._vectors]
+            forward = _least_rotation(verts)
+            verts.reverse()
+            backward = _least_rotation(verts)
+            self._canonical = min(forward, backward)
+        return self._canonical
+
+    @property
+    def fingerprint(self):
+        """A stable digest of the polygon's shape as a hex string. Polygons
+        that are equal have the same fingerprint, irrespective of initial
+        vertex and winding direction. Since polygons are mutable and thus
+        unhashable, the fingerprint can be used as a dictionary key
+        instead, e.g., to find duplicate polygons. The fingerprint is the
+        same across processes and platforms.
+
+        Runtime complexity: O(n), the result is cached.
+        """
+        if self._fingerprint is None:
+            coords = array('d')
+            for x, y in self._canonical_form():
+                coords.append(x)
+                coords.append(y)
+            if _big_endian:
+                coords.byteswap()
+            self._fingerprint = _digest(coords.tobytes()).hexdigest()
+        return self._fingerprint
+
     def __eq__(self, other):
         """Return True if other is the same shape as self, irrespective
         of initial vertex and winding direction. Note if the polygons
         have duplicate vertices, then these must also match for the
         polygons to be considered equal.
+
+        The polygons are compared using their canonical forms, which are
+        computed once in O(n) time and cached, thus subsequent comparisons
+        are a linear comparison of vertices.
         """
         if not isinstance(other, Polygon) or len(self) != len(other):
             return False
-        if self is other:
-            return True
-
-        # Test for identical verts
-        indices = range(len(self))
-        for i in indices:
-            if self[i] != other[i]:
-                break
-        else:
+        if self is other or self._vectors == other._vectors:
             return True
-
-        # Test for identical edges
-        self_edges = set()
-        add_self_edge = self_edges.add
-        for i in indices:
-            tgram = (self[i-2], self[i-1], self[i], 0)
-            while tgram in self_edges:
-                a, b, c, i = tgram
-                tgram = (a, b, c, i+1)
-            add_self_edge(tgram)
-
-        other_edges = set()
-        add_other_edge = other_edges.add
-        for i in indices:
-            tgram = (other[i-2], other[i-1], other[i], 0)
-            while tgram in other_edges:
-                a, b, c, i = tgram
-                tgram = (a, b, c, i+1)
-            if tgram in self_edges:
-                add_other_edge(tgram)
-            else:
-                # Sets can't possibly match
-                break
-        else:
-            if self_edges == other_edges:
-                return True
-
-        # Try reverse winding
-        other_edges.clear()
-        for i in indices:
-            tgram = (other[i], other[i-1], other[i-2], 0)
-            while tgram in other_edges:
-                a, b, c, i = tgram
-                tgram = (a, b, c, i+1)
-            if tgram in self_edges:
-                add_other_edge(tgram)
-            else:
-                # Sets can't possibly match
-                return False
-        return self_edges == other_edges
+        if (self._fingerprint is not None
+            and other._fingerprint is not None):
+            return self._fingerprint == other._fingerprint
+        return self._canonical_form() == other._canonical_form()
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -525,9 +684,13 @@ class Polygon(pygonal.Seq2):
         copy._convex = self._convex
         copy._simple = self._simple
         copy._y_polylines = self._y_polylines
+        copy._winding = self._winding
         copy._dupe_verts = self._dupe_verts
         copy._degenerate = self._degenerate
         copy._bbox = self._bbox
+        copy._bcircle = self._bcircle
+        copy._canonical = self._canonical
+        copy._fingerprint = self._fingerprint
         copy._centroid = self._centroid
         copy._max_r = self._max_r
         copy._max_r2 = self._max_r2
@@ -539,8 +702,24 @@ class Polygon(pygonal.Seq2):
         copy = self.__copy__()
         copy._y_polylines = None
         copy._bbox = None
+        copy._bcircle = None
         return copy
 
+    def __reduce_ex__(self, protocol):
+        """Pickle the vertices as a single buffer, together with the
+        cached properties that are known, so that unpickled polygons do
+        not need to compute them again.
+        """
+        state = {}
+        for name in _pickled_properties:
+            value = getattr(self, name)
+            if value is not _unknown:
+                state[name] = value
+        if self._y_polylines is not None:
+            state['_y_polylines'] = True
+        return (_unpickle_polygon, (self.__class__,
+            _pack_vectors(self._vectors, protocol), state))
+
     ## Point in poly methods ##
 
     def _pnp_winding_test(self, point):
@@ -589,21 +768,51 @@ class Polygon(pygonal.Seq2):
         Complexity: O(log n)
         """
         px, py = point
-        pt_y_tuple = (py,)
-        lpline, rpline = self._y_polylines
-        i = bisect.bisect_right(lpline, pt_y_tuple)
-        if i == 0 or i == len(lpline):
+        left_y, left_x, right_y, right_x = self._y_polylines
+        i = bisect.bisect_left(left_y, py)
+        if i == 0 or i == len(left_y):
             return False # Point above or below
-        v0_y, v0_x = lpline[i-1]
-        v1_y, v1_x = lpline[i]
-        if ((v1_x - v0_x) * (py - v0_y)
-            - (px - v0_x) * (v1_y - v0_y) > 0):
+        v0_x = left_x[i-1]
+        v0_y = left_y[i-1]
+        if ((left_x[i] - v0_x) * (py - v0_y)
+            - (px - v0_x) * (left_y[i] - v0_y) > 0):
             return False # Point too far left
-        i = bisect.bisect_right(rpline, pt_y_tuple)
-        v0_y, v0_x = rpline[i-1]
-        v1_y, v1_x = rpline[i]
-        return ((v1_x - v0_x) * (py - v0_y)
-            - (px - v0_x) * (v1_y - v0_y) > 0)
+        i = bisect.bisect_left(right_y, py)
+        v0_x = right_x[i-1]
+        v0_y = right_y[i-1]
+        return ((right_x[i] - v0_x) * (py - v0_y)
+            - (px - v0_x) * (right_y[i] - v0_y) > 0)
+
+    def _pnp_y_monotone_points(self, points):
+        """Return a list of bools indicating which of the points are in
+        the polygon, using the same test as _pnp_y_monotone_test() for
+        each point without the per-point method call overhead.
+
+        Complexity: O(m log n) for m points
+        """
+        left_y, left_x, right_y, right_x = self._y_polylines
+        bisect_left = bisect.bisect_left
+        bottom = left_y[0]
+        top = left_y[-1]
+        inside = []
+        append = inside.append
+        for px, py in points:
+            if not bottom < py <= top:
+                append(False) # Point above or below
+                continue
+            i = bisect_left(left_y, py)
+            v0_x = left_x[i-1]
+            v0_y = left_y[i-1]
+            if ((left_x[i] - v0_x) * (py - v0_y)
+                - (px - v0_x) * (left_y[i] - v0_y) > 0):
+                append(False) # Point too far left
+                continue
+            i = bisect_left(right_y, py)
+            v0_x = right_x[i-1]
+            v0_y = right_y[i-1]
+            append((right_x[i] - v0_x) * (py - v0_y)
+                - (px - v0_x) * (right_y[i] - v0_y) > 0)
+        return inside
 
     def _pnp_triangle_test(self, point):
         """Return True if the point is in the triangle polygon using
@@ -673,19 +882,57 @@ class Polygon(pygonal.Seq2):
         """
         sides = len(self)
         if sides == 3:
+            if stats.enabled:
+                stats.count('contains_point.triangle')
             return self._pnp_triangle_test(point)
         if self._centroid is not _unknown and sides > 4:
             d2 = (self._centroid - point).length2
             if self._min_r2 is not None and d2 < self._min_r2:
+                if stats.enabled:
+                    stats.count('contains_point.radial_inside')
                 return True
             if self._max_r2 is not None and d2 > self._max_r2:
+                if stats.enabled:
+                    stats.count('contains_point.radial_outside')
                 return False
         if self._y_polylines is not None:
+            if stats.enabled:
+                stats.count('contains_point.y_monotone')
             return self._pnp_y_monotone_test(point)
         if sides == 4 or self.bounding_box.contains_point(point):
+            if stats.enabled:
+                stats.count('contains_point.winding')
             return self._pnp_winding_test(point)
+        if stats.enabled:
+            stats.count('contains_point.bbox_reject')
         return False
 
+    def contains_points(self, points):
+        """Return a list of bools indicating which of the specified
+        points are inside the polygon. See :meth:`contains_point`.
+
+        When testing more than one point, the polygon is classified
+        first, if needed, and points are tested against convex polygons
+        in a single loop bisecting the y-monotone polylines.
+
+        :param points: Iterable of point vectors, e.g. a
+            :class:`~pygonal.Vec2Array`.
+        :rtype: list of bool
+        """
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        elif not isinstance(points, (list, tuple)):
+            points = list(points)
+        if len(points) > 1 and len(self) > 3:
+            if self._convex is _unknown:
+                self._classify()
+            if self._y_polylines is not None:
+                if stats.enabled:
+                    stats.count('contains_points.y_monotone', len(points))
+                return self._pnp_y_monotone_points(points)
+        contains = self.contains_point
+        return [contains(point) for point in points]
+
     ## Tangent methods ##
     # See: http://softsurfer.com/Archive/algorithm_0201/algorithm_0201.htm
 
@@ -810,11 +1057,172 @@ class Polygon(pygonal.Seq2):
         :rtype: tuple of :class:`~pygonal.Vec2`
         """
         if len(self) > 20 and self.is_convex and not self._dupe_verts:
+            if stats.enabled:
+                stats.count('tangents_to_point.convex')
             return (self[self._left_tan_i_convex(point)],
                 self[self._right_tan_i_convex(point)])
         else:
+            if stats.enabled:
+                stats.count('tangents_to_point.general')
             return self._pt_tangents(point)
 
+    ## Simplification ##
+
+    def simplified(self, tolerance, method='douglas-peucker',
+        preserve_simple=False):
+        """Return a new polygon with a subset of the vertices of this
+        polygon, such that the resulting shape deviates from the
+        original by no more than the specified tolerance. At least three
+        vertices are always retained.
+
+        If the polygon is known to be convex, the result is declared
+        convex as well, since any subset of the vertices of a convex
+        polygon is convex.
+
+        Runtime complexity: O(n log n) expected
+
+        :param tolerance: Distance tolerance for ``'douglas-peucker'``,
+            or minimum effective triangle area for ``'visvalingam-whyatt'``.
+        :type tolerance: float
+        :param method: The simplification algorithm, either
+            ``'douglas-peucker'`` or ``'visvalingam-whyatt'``.
+        :param preserve_simple: If True and this polygon is simple, the
+            tolerance is reduced as needed until the simplified polygon
+            is simple as well.
+        :type preserve_simple: bool
+        :rtype: Polygon
+        """
+        is_convex = (self._convex is True) or None
+        preserve_simple = (preserve_simple and not is_convex
+            and self.is_simple)
+        while True:
+            poly = self.from_points(
+                simplify_ring(self._vectors, tolerance, method))
+            if is_convex:
+                poly._convex = poly._simple = True
+                if len(poly) > 3:
+                    poly._split_y_polylines()
+            if not preserve_simple or poly.is_simple:
+                return poly
+            tolerance *= 0.5
+            if tolerance < pygonal.EPSILON2:
+                return self.__copy__()
+
+    ## Convex operations ##
+
+    def _ccw_vertices(self):
+        """Return the vertices as a list in counter-clockwise order.
+        The winding cached by :meth:`_classify` is used if known,
+        otherwise it is derived from the signed area in O(n) time.
+        """
+        winding = self._winding
+        if winding is _unknown or not winding:
+            area = _signed_area(self)
+            winding = (area > 0.0) - (area < 0.0)
+        if winding < 0:
+            return self._vectors[::-1]
+        return list(self._vectors)
+
+    def _require_convex(self, other, operation):
+        if not isinstance(other, Polygon):
+            raise TypeError("Polygon.%s(): expected Polygon, got %s"
+                % (operation, type(other).__name__))
+        if not self.is_convex or not other.is_convex:
+            raise ValueError(
+                "Polygon.%s(): requires convex polygons" % operation)
+
+    def convex_intersection(self, other):
+        """Return the intersection of this polygon with another polygon,
+        both of which must be convex. The result is declared convex, so
+        no further classification is required. If the polygons do not
+        overlap, only touch along an edge or at a vertex, or either one
+        has no area, ``None`` is returned.
+
+        The intersection is computed by advancing along the edges of both
+        polygons simultaneously using O'Rourke's algorithm, from
+        "Computational Geometry in C".
+
+        Runtime complexity: O(n + m)
+
+        :param other: A convex polygon.
+        :type other: Polygon
+        :rtype: Polygon
+        """
+        self._require_convex(other, 'convex_intersection')
+        if self._degenerate is True or other._degenerate is True:
+            return None
+        self_verts = self._ccw_vertices()
+        other_verts = other._ccw_vertices()
+        if not _signed_area(self_verts) or not _signed_area(other_verts):
+            # A polygon without area cannot overlap anything
+            return None
+        verts = _convex_intersect(self_verts, other_verts)
+        if verts is None:
+            # The boundaries do not cross, so either one polygon
+            # contains the other or they are disjoint. A vertex serves
+            # as the probe, which unlike the centroid needs no division
+            self_inside = other.contains_point(self_verts[0])
+            other_inside = self.contains_point(other_verts[0])
+            if self_inside and other_inside:
+                if _signed_area(self_verts) <= _signed_area(other_verts):
+                    verts = self_verts
+                else:
+                    verts = other_verts
+            elif self_inside:
+                verts = self_verts
+            elif other_inside:
+                verts = other_verts
+            else:
+                return None
+        if len(verts) < 3:
+            return None
+        poly = self.from_points(verts)
+        poly._convex = poly._simple = True
+        poly._winding = 1
+        if len(poly) > 3:
+            poly._split_y_polylines()
+        return poly
+
+    def minkowski_sum(self, other):
+        """Return the Minkowski sum of this polygon and another polygon,
+        both of which must be convex. The result is declared convex, so
+        no further classification is required.
+
+        The sum is computed by merging the edge sequences of both polygons
+        in order of their direction.
+
+        Runtime complexity: O(n + m)
+
+        :param other: A convex polygon.
+        :type other: Polygon
+        :rtype: Polygon
+        """
+        self._require_convex(other, 'minkowski_sum')
+        p = _lowest_first(self._ccw_vertices())
+        q = _lowest_first(other._ccw_vertices())
+        p_count = len(p)
+        q_count = len(q)
+        p += p[:2]
+        q += q[:2]
+        i = j = 0
+        verts = []
+        add_vert = verts.append
+        while i < p_count or j < q_count:
+            (px, py), (qx, qy) = p[i], q[j]
+            add_vert(pygonal.Vec2(px + qx, py + qy))
+            cross = ((p[i+1][0] - px) * (q[j+1][1] - qy)
+                - (p[i+1][1] - py) * (q[j+1][0] - qx))
+            if cross >= 0.0 and i < p_count:
+                i += 1
+            if cross <= 0.0 and j < q_count:
+                j += 1
+        poly = self.from_points(verts)
+        poly._convex = poly._simple = True
+        poly._winding = 1
+        if len(poly) > 3:
+            poly._split_y_polylines()
+        return poly
+
     ## Convex Hull ##
 
     @classmethod
@@ -841,6 +1249,7 @@ class Polygon(pygonal.Seq2):
         return cls(_adaptive_quick_hull(points), is_convex=True)
 
 
+@stats.timed('convex_hull')
 def _adaptive_quick_hull(points):
     """Compute the convex hull from an arbitrary collection of points
     using an adaptive quick hull algorithm. Return the points of the hull
@@ -887,6 +1296,8 @@ def _adaptive_quick_hull(points):
 
 def _ahull_partition_points(hull, points, p0, p1):
     """Partition the points 'above' p0->p1 to compute the sub-hull"""
+    if stats.enabled:
+        stats.count('convex_hull.partition')
 
     # Find point furthest from line p0->p1 as partition point
     furthest = -1.0
@@ -964,6 +1375,8 @@ def _ahull_partition_points(hull, points, p0, p1):
 
 def _ahull_sort_points(hull, points, p0, p1):
     """Compute the sub-hull using a sorted chain-hull algorithm"""
+    if stats.enabled:
+        stats.count('convex_hull.sort')
     dx, dy = p1 - p0
     p0_x, p0_y = p0
     def line_order(pt):
@@ -987,7 +1400,236 @@ def _ahull_sort_points(hull, points, p0, p1):
     hull.extend(stack)
 
 
+def _signed_area(verts):
+    """Return twice the signed area of the polygon with the given
+    vertices, positive if the vertices are counter-clockwise
+    """
+    x0, y0 = verts[-1]
+    area = 0.0
+    for x1, y1 in verts:
+        area += x0 * y1 - x1 * y0
+        x0 = x1
+        y0 = y1
+    return area
+
+def _lowest_first(verts):
+    """Rotate the list of vertices in place so that the lowest vertex
+    (by y, then x) is first.
+    """
+    lowest = min(range(len(verts)), key=lambda i: (verts[i][1], verts[i][0]))
+    verts[:] = verts[lowest:] + verts[:lowest]
+    return verts
+
+def _area_sign(a, b, c):
+    """Return the sign of the area of triangle a, b, c: positive if
+    the triangle is counter-clockwise, negative if clockwise
+    """
+    area = (b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])
+    return (area > 0.0) - (area < 0.0)
+
+def _between(a, b, c):
+    """Return True if the point c, collinear with a->b, lies between them"""
+    if a[0] != b[0]:
+        return a[0] <= c[0] <= b[0] or b[0] <= c[0] <= a[0]
+    return a[1] <= c[1] <= b[1] or b[1] <= c[1] <= a[1]
+
+def _segment_intersection(a, b, c, d):
+    """Intersect the line segments a->b and c->d. Return a tuple of
+    (code, p, q) where code is one of:
+
+    ``'1'``: The segments intersect properly at p.
+    ``'v'``: An endpoint of one segment lies on the other at p.
+    ``'e'``: The segments are collinear and overlap from p to q.
+    ``'0'``: The segments do not intersect.
+    """
+    denom = (a[0] * (d[1] - c[1]) + b[0] * (c[1] - d[1])
+        + d[0] * (b[1] - a[1]) + c[0] * (a[1] - b[1]))
+    if not denom:
+        # Parallel segments
+        if _area_sign(a, b, c):
+            return '0', None, None
+        if _between(a, b, c) and _between(a, b, d):
+            return 'e', c, d
+        if _between(c, d, a) and _between(c, d, b):
+            return 'e', a, b
+        if _between(a, b, c) and _between(c, d, b):
+            return 'e', c, b
+        if _between(a, b, c) and _between(c, d, a):
+            return 'e', c, a
+        if _between(a, b, d) and _between(c, d, b):
+            return 'e', d, b
+        if _between(a, b, d) and _between(c, d, a):
+            return 'e', d, a
+        return '0', None, None
+    code = '?'
+    num = a[0] * (d[1] - c[1]) + c[0] * (a[1] - d[1]) + d[0] * (c[1] - a[1])
+    if not num or num == denom:
+        code = 'v'
+    s = num / denom
+    num = -(a[0] * (c[1] - b[1]) + b[0] * (a[1] - c[1])
+        + c[0] * (b[1] - a[1]))
+    if not num or num == denom:
+        code = 'v'
+    t = num / denom
+    if 0.0 < s < 1.0 and 0.0 < t < 1.0:
+        code = '1'
+    elif s < 0.0 or s > 1.0 or t < 0.0 or t > 1.0:
+        code = '0'
+    p = pygonal.Vec2(a[0] + s * (b[0] - a[0]), a[1] + s * (b[1] - a[1]))
+    return code, p, None
+
+def _convex_intersect(p, q):
+    """Compute the intersection of two convex polygons given as lists
+    of counter-clockwise vertices. Return the vertices of the intersection
+    as a list, an empty list if the polygons are disjoint or intersect
+    in a degenerate way, or None if their boundaries do not cross, in
+    which case one polygon may contain the other.
+
+    Algorithm derived from O'Rourke, "Computational Geometry in C",
+    2nd edition, section 7.6.
+    """
+    p_count = len(p)
+    q_count = len(q)
+    a = b = 0 # current vertex indices
+    a_adv = b_adv = 0 # number of advances
+    inside = None # which polygon is inside: 'p', 'q' or unknown
+    first_point = True
+    verts = []
+    add_vert = verts.append
+    while True:
+        a1 = a - 1
+        b1 = b - 1
+        pa, pa1, qb, qb1 = p[a], p[a1], q[b], q[b1]
+        cross = _area_sign((0.0, 0.0),
+            (pa[0] - pa1[0], pa[1] - pa1[1]), (qb[0] - qb1[0], qb[1] - qb1[1]))
+        a_hb = _area_sign(qb1, qb, pa)
+        b_ha = _area_sign(pa1, pa, qb)
+        code, pt, pt2 = _segment_intersection(pa1, pa, qb1, qb)
+        if code == '1' or code == 'v':
+            if inside is None and first_point:
+                a_adv = b_adv = 0
+                first_point = False
+            add_vert(pt)
+            if a_hb > 0:
+                inside = 'p'
+            elif b_ha > 0:
+                inside = 'q'
+        if code == 'e' and ((pa[0] - pa1[0]) * (qb[0] - qb1[0])
+            + (pa[1] - pa1[1]) * (qb[1] - qb1[1])) < 0.0:
+            # Shared edge with opposite direction, the polygons only touch
+            return []
+        if not cross and a_hb < 0 and b_ha < 0:
+            # Parallel separated edges, the polygons are disjoint
+            return []
+        if not cross and not a_hb and not b_ha:
+            # Collinear edges, advance the outside polygon
+            if inside == 'p':
+                b_adv += 1
+                b = (b + 1) % q_count
+            else:
+                a_adv += 1
+                a = (a + 1) % p_count
+        elif cross >= 0:
+            if b_ha > 0:
+                if inside == 'p':
+                    add_vert(pa)
+                a_adv += 1
+                a = (a + 1) % p_count
+            else:
+                if inside == 'q':
+                    add_vert(qb)
+                b_adv += 1
+                b = (b + 1) % q_count
+        else:
+            if a_hb > 0:
+                if inside == 'q':
+                    add_vert(qb)
+                b_adv += 1
+                b = (b + 1) % q_count
+            else:
+                if inside == 'p':
+                    add_vert(pa)
+                a_adv += 1
+                a = (a + 1) % p_count
+        if not ((a_adv < p_count or b_adv < q_count)
+            and a_adv < 2 * p_count and b_adv < 2 * q_count):
+            break
+    if inside is None:
+        return None
+    # Remove duplicate vertices where boundaries touch or close the loop
+    unique = []
+    for vert in verts:
+        if not unique or not vert.almost_equals(unique[-1]):
+            unique.append(vert)
+    while len(unique) > 1 and unique[0].almost_equals(unique[-1]):
+        unique.pop()
+    return unique
+
+
 _unknown = object()
 
+_big_endian = sys.byteorder == 'big'
+
+try:
+    _digest = functools.partial(hashlib.blake2b, digest_size=16)
+except AttributeError:
+    # Python < 3.6
+    _digest = hashlib.sha1
+
+def _least_rotation(seq):
+    """Return the lexicographically least rotation of seq as a tuple,
+    using Booth's algorithm in O(n) time.
+    """
+    count = len(seq)
+    double = seq + seq
+    failure = [-1] * len(double)
+    k = 0
+    for j in range(1, len(double)):
+        item = double[j]
+        i = failure[j - k - 1]
+        while i != -1 and item != double[k + i + 1]:
+            if item < double[k + i + 1]:
+                k = j - i - 1
+            i = failure[i]
+        if item != double[k + i + 1]:
+            # i == -1 here
+            if item < double[k]:
+                k = j
+            failure[j - k] = -1
+        else:
+            failure[j - k] = i + 1
+    return tuple(double[k:k + count])
+
+def _initial_state(cls, sides):
+    """Return the attributes of a newly constructed polygon of the class
+    with the given number of sides, other than its vertices.
+    """
+    poly = object.__new__(cls)
+    poly._vectors = [None] * sides
+    poly._clear_cached_properties()
+    state = dict(poly.__dict__)
+    del state['_vectors']
+    return state
+
+# Cached properties shared between polygons with the same fingerprint
+# through the property cache. These do not depend on the initial vertex
+# or winding direction, since equal polygons have the same fingerprint.
+_shared_properties = ('_convex', '_simple', '_degenerate', '_dupe_verts',
+    '_y_polylines', '_centroid')
+
+# Cached properties carried over when pickling polygons
+_pickled_properties = ('_convex', '_simple', '_winding', '_dupe_verts',
+    '_degenerate', '_bbox', '_bcircle', '_centroid',
+    '_max_r', '_max_r2', '_min_r', '_min_r2')
+
+def _unpickle_polygon(cls, data, state):
+    poly = cls.from_points(_unpack_vectors(data))
+    if state.pop('_y_polylines', False):
+        # The y-monotone polylines are derived from the vertices in O(n)
+        # time, which is cheaper than unpickling them
+        poly._split_y_polylines()
+    poly.__dict__.update(state)
+    return poly
+
 
 # vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+import pygonal
+
+
+class Polyline(pygonal.Seq2):
+    """Open chain of line segments through a sequence of vertices.
+
+    The cumulative arc length at each vertex is computed once, on first
+    use, and cached. Interpolating a point at a distance along the
+    polyline then takes O(log n) time by bisecting the cumulative
+    lengths, instead of summing the segment lengths each time.
+
+    :param vertices: Iterable containing two or more
+        :class:`~pygonal.Vec2` objects.
+
+    .. note::
+        If the polyline is mutated, the cached lengths are invalidated.
+    """
+
+    _lengths = None
+    _bbox = None
+
+    def __init__(self, vertices):
+        super(Polyline, self).__init__(vertices)
+        if len(self) < 2:
+            raise ValueError("Polyline(): minimum of 2 vertices required")
+
+    def _clear_cached_properties(self):
+        self._lengths = None
+        self._bbox = None
+
+    def _cumulative_lengths(self):
+        lengths = self._lengths
+        if lengths is None:
+            hypot = math.hypot
+            lengths = array('d', [0.0])
+            total = 0.0
+            x0, y0 = self._vectors[0]
+            for x1, y1 in self._vectors[1:]:
+                total += hypot(x1 - x0, y1 - y0)
+                lengths.append(total)
+                x0 = x1
+                y0 = y1
+            self._lengths = lengths
+        return lengths
+
+    @property
+    def lengths(self):
+        """The cumulative arc length at each vertex, starting with 0.0 at
+        the first vertex.
+
+        :rtype: array of float
+        """
+        return array('d', self._cumulative_lengths())
+
+    @property
+    def length(self):
+        """The total length of the polyline."""
+        return self._cumulative_lengths()[-1]
+
+    @property
+    def bounding_box(self):
+        """The bounding box of the polyline"""
+        if self._bbox is None:
+            self._bbox = pygonal.BoundingBox(self)
+        return self._bbox
+
+    def _point_at(self, lengths, distance, lo=0):
+        """Return the point at the distance along the polyline, and the
+        index of the segment containing it. The distance must be within
+        the length of the polyline.
+        """
+        i = bisect_right(lengths, distance, lo) - 1
+        if i >= len(lengths) - 1:
+            i = len(lengths) - 2
+        ax, ay = self._vectors[i]
+        bx, by = self._vectors[i + 1]
+        start = lengths[i]
+        seg_length = lengths[i + 1] - start
+        if seg_length > 0.0:
+            t = (distance - start) / seg_length
+        else:
+            t = 0.0
+        return pygonal.Vec2(ax + (bx - ax) * t, ay + (by - ay) * t), i
+
+    def point_at(self, distance):
+        """Return the point at the specified distance along the polyline,
+        measured from the first vertex. Distances outside of the polyline
+        are clamped to its ends. This takes O(log n) time.
+
+        :param distance: The distance along the polyline.
+        :type distance: float
+        :rtype: :class:`~pygonal.Vec2`
+        """
+        lengths = self._cumulative_lengths()
+        distance = min(max(distance, 0.0), lengths[-1])
+        return self._point_at(lengths, distance)[0]
+
+    def points_at(self, distances):
+        """Return the points at the specified distances along the
+        polyline. See :meth:`point_at`. Increasing runs of distances
+        are interpolated without restarting the search from the first
+        segment.
+
+        :param distances: Iterable of distances.
+        :rtype: :class:`~pygonal.Vec2Array`
+        """
+        lengths = self._cumulative_lengths()
+        total = lengths[-1]
+        point_at = self._point_at
+        points = []
+        i = 0
+        last = -1.0
+        for distance in distances:
+            distance = min(max(distance, 0.0), total)
+            if distance < last:
+                i = 0
+            point, i = point_at(lengths, distance, i)
+            points.append(point)
+            last = distance
+        return pygonal.Vec2Array.from_points(points)
+
+    def locate(self, point):
+        """Return the distance along the polyline of the point on the
+        polyline nearest to the specified point. If several points are
+        equally near, the one nearest the start is used. This takes O(n)
+        time.
+
+        :param point: A point vector.
+        :type point: :class:`~pygonal.Vec2`
+        :rtype: float
+        """
+        lengths = self._cumulative_lengths()
+        px, py = point
+        vectors = self._vectors
+        ax, ay = vectors[0]
+        best = (px - ax) ** 2 + (py - ay) ** 2
+        best_i = 0
+        best_t = 0.0
+        for i in range(1, len(vectors)):
+            bx, by = vectors[i]
+            dx = bx - ax
+            dy = by - ay
+            len2 = dx * dx + dy * dy
+            t = 0.0
+            if len2 > 0.0:
+                t = ((px - ax) * dx + (py - ay) * dy) / len2
+                if t < 0.0:
+                    t = 0.0
+                elif t > 1.0:
+                    t = 1.0
+            ex = ax + dx * t - px
+            ey = ay + dy * t - py
+            dist2 = ex * ex + ey * ey
+            if dist2 < best:
+                best = dist2
+                best_i = i - 1
+                best_t = t
+            ax = bx
+            ay = by
+        start = lengths[best_i]
+        return start + (lengths[best_i + 1] - start) * best_t
+
+    def locate_points(self, points):
+        """Return the distances along the polyline of the points on the
+        polyline nearest to each of the specified points. See
+        :meth:`locate`.
+
+        :param points: Iterable of point vectors, e.g. a
+            :class:`~pygonal.Vec2Array`.
+        :rtype: array of float
+        """
+        if isinstance(points, pygonal.Seq2):
+            points = points._vectors
+        locate = self.locate
+        return array('d', [locate(point) for point in points])
+
+    def substring(self, start, end):
+        """Return the part of the polyline between two distances along it.
+        Distances outside of the polyline are clamped to its ends. If
+        ``start`` is greater than ``end``, the result runs backwards.
+
+        :param start: The distance along the polyline where the result
+            starts.
+        :type start: float
+        :param end: The distance along the polyline where the result ends.
+        :type end: float
+        :rtype: Polyline
+        """
+        lengths = self._cumulative_lengths()
+        total = lengths[-1]
+        reverse = start > end
+        if reverse:
+            start, end = end, start
+        start = min(max(start, 0.0), total)
+        end = min(max(end, 0.0), total)
+        first = self._point_at(lengths, start)[0]
+        last = self._point_at(lengths, end)[0]
+        vertices = [first]
+        vertices.extend(self._vectors[
+            bisect_right(lengths, start):bisect_left(lengths, end)])
+        vertices.append(last)
+        if reverse:
+            vertices.reverse()
+        return self.from_points(vertices)
+
+    def __setitem__(self, index, vert):
+        super(Polyline, self).__setitem__(index, vert)
+        self._clear_cached_properties()
+
+    def __imul__(self, other):
+        try:
+            other.itransform(self)
+            self._clear_cached_properties()
+            return self
+        except AttributeError:
+            raise TypeError("Cannot multiply %s with %s"
+                % (type(self).__name__, type(other).__name__))
+
+    def __repr__(self):
+        return "%s([%s])" % (self.__class__.__name__,
+            ', '.join(repr(tuple(v)) for v in self))
+
+    __str__ = __repr__
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+import heapq
+import pygonal
+
+# Line simplification algorithms. All functions accept any iterable of
+# points, including generators streaming vertices from a file. The points
+# are collected into a list first, since both algorithms need random
+# access to them, so memory use grows with the number of input points.
+
+DOUGLAS_PEUCKER = 'douglas-peucker'
+VISVALINGAM_WHYATT = 'visvalingam-whyatt'
+
+
+def _as_vec2_list(points):
+    """Return the points as a list of Vec2, reusing existing Vec2 objects.
+    """
+    Vec2 = pygonal.Vec2
+    return [p if p.__class__ is Vec2 else Vec2(*p) for p in points]
+
+
+def douglas_peucker(points, tolerance):
+    """Simplify an open polyline using the Douglas-Peucker algorithm.
+    The first and last points are always retained. Points that lie within
+    ``tolerance`` distance of the simplified polyline are discarded.
+
+    The algorithm is implemented iteratively using an explicit stack,
+    so arbitrarily long polylines can be simplified without hitting
+    the recursion limit.
+
+    Runtime complexity: O(n log n) expected, O(n^2) worst case
+
+    :param points: Iterable of points.
+    :param tolerance: Maximum distance between a discarded point and
+        the simplified polyline.
+    :type tolerance: float
+    :return: The retained points.
+    :rtype: list of :class:`~pygonal.Vec2`
+    """
+    points = _as_vec2_list(points)
+    count = len(points)
+    if count < 3:
+        return points
+    tolerance2 = tolerance * tolerance
+    keep = bytearray(count)
+    keep[0] = keep[-1] = 1
+    stack = [(0, count - 1)]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        first, last = pop()
+        ax, ay = points[first]
+        bx, by = points[last]
+        dx = bx - ax
+        dy = by - ay
+        seg_len2 = dx*dx + dy*dy
+        max_dist2 = tolerance2
+        index = 0
+        for i in range(first + 1, last):
+            px, py = points[i]
+            ex = px - ax
+            ey = py - ay
+            if seg_len2:
+                t = (ex * dx + ey * dy) / seg_len2
+                if t >= 1.0:
+                    ex = px - bx
+                    ey = py - by
+                elif t > 0.0:
+                    ex -= t * dx
+                    ey -= t * dy
+            dist2 = ex*ex + ey*ey
+            if dist2 > max_dist2:
+                max_dist2 = dist2
+                index = i
+        if index:
+            keep[index] = 1
+            if index - first > 1:
+                push((first, index))
+            if last - index > 1:
+                push((index, last))
+    return [p for p, k in zip(points, keep) if k]
+
+
+def visvalingam_whyatt(points, tolerance, closed=False):
+    """Simplify a polyline using the Visvalingam-Whyatt algorithm.
+    Points are eliminated in order of increasing effective area, i.e. the
+    area of the triangle formed with their neighbors, until every remaining
+    point has an effective area of at least ``tolerance``.
+
+    The effective areas are kept in a heap, thus the runtime complexity
+    is O(n log n).
+
+    :param points: Iterable of points.
+    :param tolerance: Minimum effective area of the retained points.
+    :type tolerance: float
+    :param closed: If True, the points are treated as a closed ring,
+        otherwise the first and last points are always retained.
+    :type closed: bool
+    :return: The retained points.
+    :rtype: list of :class:`~pygonal.Vec2`
+    """
+    points = _as_vec2_list(points)
+    count = len(points)
+    min_count = 3 if closed else 2
+    if count <= min_count:
+        return points
+    prev = list(range(-1, count - 1))
+    next = list(range(1, count + 1))
+    if closed:
+        prev[0] = count - 1
+        next[-1] = 0
+        candidates = range(count)
+    else:
+        candidates = range(1, count - 1)
+
+    def area(i):
+        ax, ay = points[prev[i]]
+        bx, by = points[i]
+        cx, cy = points[next[i]]
+        return abs((bx - ax) * (cy - ay) - (cx - ax) * (by - ay)) * 0.5
+
+    areas = [None] * count
+    heap = []
+    for i in candidates:
+        areas[i] = a = area(i)
+        heap.append((a, i))
+    heapq.heapify(heap)
+    removed = bytearray(count)
+    remaining = count
+    while heap and remaining > min_count:
+        a, i = heapq.heappop(heap)
+        if removed[i] or areas[i] != a:
+            continue # stale heap entry
+        if a >= tolerance:
+            break
+        removed[i] = 1
+        remaining -= 1
+        p = prev[i]
+        n = next[i]
+        next[p] = n
+        prev[n] = p
+        for j in (p, n):
+            if areas[j] is not None:
+                # Effective areas never decrease, so that points
+                # are eliminated in a consistent order
+                areas[j] = new_area = max(area(j), a)
+                heapq.heappush(heap, (new_area, j))
+    return [p for p, r in zip(points, removed) if not r]
+
+
+def simplify(points, tolerance, method=DOUGLAS_PEUCKER):
+    """Simplify an open polyline using the specified method.
+
+    :param points: Iterable of points.
+    :param tolerance: Distance tolerance for ``'douglas-peucker'``, or
+        minimum effective area for ``'visvalingam-whyatt'``.
+    :type tolerance: float
+    :param method: Either ``'douglas-peucker'`` or ``'visvalingam-whyatt'``.
+    :rtype: list of :class:`~pygonal.Vec2`
+    """
+    if method == DOUGLAS_PEUCKER:
+        return douglas_peucker(points, tolerance)
+    elif method == VISVALINGAM_WHYATT:
+        return visvalingam_whyatt(points, tolerance)
+    raise ValueError("Unknown simplification method: %r" % (method,))
+
+
+def simplify_ring(points, tolerance, method=DOUGLAS_PEUCKER):
+    """Simplify a closed ring of points using the specified method.
+    At least three distinct points are always retained, thus ValueError
+    is raised if the ring has fewer than three distinct points.
+
+    :param points: Iterable of points, the ring is implicitly closed.
+    :param tolerance: Distance tolerance for ``'douglas-peucker'``, or
+        minimum effective area for ``'visvalingam-whyatt'``.
+    :type tolerance: float
+    :param method: Either ``'douglas-peucker'`` or ``'visvalingam-whyatt'``.
+    :rtype: list of :class:`~pygonal.Vec2`
+    """
+    points = _as_vec2_list(points)
+    if method == VISVALINGAM_WHYATT:
+        return visvalingam_whyatt(points, tolerance, closed=True)
+    elif method != DOUGLAS_PEUCKER:
+        raise ValueError("Unknown simplification method: %r" % (method,))
+    if len(points) <= 3:
+        return points
+    # Split the ring at the first vertex and the vertex furthest from it,
+    # both of which are retained, and simplify the halves separately
+    first = points[0]
+    split = max(range(len(points)), key=lambda i: first.distance_to(points[i]))
+    head = douglas_peucker(points[:split + 1], tolerance)
+    tail = douglas_peucker(points[split:] + [first], tolerance)
+    ring = head + tail[1:-1]
+    if len(ring) < 3:
+        # Retain the vertex furthest from the chord to keep an area
+        end = points[split]
+        ax, ay = first
+        dx, dy = end - first
+        apex = max(points,
+            key=lambda p: abs(dx * (p[1] - ay) - (p[0] - ax) * dy))
+        if apex == first or apex == end:
+            # All points are collinear, any other distinct point will do
+            apex = None
+            for p in points:
+                if p != first and p != end:
+                    apex = p
+                    break
+            if apex is None:
+                raise ValueError(
+                    "simplify_ring(): ring has fewer than 3 distinct points")
+        index = points.index(apex)
+        ring = [first, apex, end] if index < split else [first, end, apex]
+    return ring
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
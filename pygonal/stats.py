@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+from __future__ import division
+import contextlib
+import functools
+import threading
+from timeit import default_timer
+
+# Opt-in instrumentation of the algorithms in pygonal. When enabled, the
+# code paths taken by e.g. Polygon.contains_point() are counted and the
+# time spent in the more expensive algorithms is accumulated. Call sites
+# check the module-level ``enabled`` flag before recording anything, so
+# the overhead is a single attribute lookup when disabled.
+
+enabled = False
+"""True if statistics are being collected. Use :func:`enable` and
+:func:`disable` to change it.
+"""
+
+_counts = {}
+_times = {}
+_lock = threading.Lock()
+
+
+def enable():
+    """Start collecting statistics."""
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Stop collecting statistics. Statistics collected so far are kept
+    until :func:`reset` is called.
+    """
+    global enabled
+    enabled = False
+
+
+def reset():
+    """Discard all statistics collected."""
+    with _lock:
+        _counts.clear()
+        _times.clear()
+
+
+def count(name, n=1):
+    """Increment the named counter. Callers check :data:`enabled`
+    first.
+    """
+    with _lock:
+        _counts[name] = _counts.get(name, 0) + n
+
+
+def add_time(name, seconds):
+    """Add a call taking the specified time to the named timer.
+    Callers check :data:`enabled` first.
+    """
+    with _lock:
+        calls, total = _times.get(name, (0, 0.0))
+        _times[name] = (calls + 1, total + seconds)
+
+
+def timed(name):
+    """Decorator that accumulates the time spent in the function
+    under the specified name while statistics are enabled.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kw):
+            if not enabled:
+                return func(*args, **kw)
+            start = default_timer()
+            try:
+                return func(*args, **kw)
+            finally:
+                add_time(name, default_timer() - start)
+        return wrapper
+    return decorator
+
+
+def snapshot():
+    """Return the statistics collected so far.
+
+    :return: A dict with the keys ``'counts'``, mapping counter names to
+        the number of times they were incremented, and ``'times'``,
+        mapping timer names to ``(calls, seconds)`` tuples.
+    :rtype: dict
+    """
+    with _lock:
+        return {'counts': dict(_counts), 'times': dict(_times)}
+
+
+@contextlib.contextmanager
+def collecting():
+    """Context manager that collects statistics for the duration of the
+    ``with`` block. Previously collected statistics are discarded. The
+    dict yielded is filled with a :func:`snapshot` on exit::
+
+        with stats.collecting() as result:
+            poly.contains_point(point)
+        print(result['counts'])
+    """
+    global enabled
+    was_enabled = enabled
+    reset()
+    result = {}
+    enabled = True
+    try:
+        yield result
+    finally:
+        enabled = was_enabled
+        result.update(snapshot())
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
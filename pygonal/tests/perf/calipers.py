@@ -0,0 +1,43 @@
+from random import random
+from timeit import timeit
+import functools
+from pygonal import Vec2, Polygon
+from pygonal import calipers
+
+def rand_pts(count, span=10):
+    return [Vec2(random() * span, random() * span) for i in range(count)]
+
+def brute_diameter(points):
+    return max(p.distance_to(q) for p in points for q in points)
+
+def brute_min_area_rect(points):
+    hull = list(Polygon.convex_hull(points))
+    best = None
+    for i in range(len(hull)):
+        u = (hull[i] - hull[i - 1]).normalized()
+        v = u.perpendicular()
+        xs = [u.dot(p) for p in hull]
+        ys = [v.dot(p) for p in hull]
+        area = (max(xs) - min(xs)) * (max(ys) - min(ys))
+        if best is None or area < best:
+            best = area
+    return best
+
+times = 20
+
+for count in [8, 32, 128, 512]:
+    for name, points in [
+        ("rand", rand_pts(count)),
+        ("reg", Polygon.regular(count, 10))]:
+        print("Brute diameter", name, count, "points:",
+            timeit(functools.partial(brute_diameter, points), number=times))
+        print("Calipers diameter", name, count, "points:",
+            timeit(functools.partial(calipers.diameter, points), number=times))
+        print("Brute min area rect", name, count, "points:",
+            timeit(functools.partial(brute_min_area_rect, points),
+            number=times))
+        print("Calipers min area rect", name, count, "points:",
+            timeit(functools.partial(calipers.min_area_rect, points),
+            number=times))
+    print()
+
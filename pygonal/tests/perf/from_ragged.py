@@ -0,0 +1,54 @@
+# Compare constructing polygons one at a time with the bulk
+# Polygon.from_ragged() factory.
+from array import array
+from random import random, randint
+from timeit import default_timer
+from pygonal import Polygon
+
+count = 100000
+
+coords = array('d')
+offsets = array('l', [0])
+verts = []
+for i in range(count):
+    poly = Polygon.regular(randint(3, 16), random() * 100,
+        center=(random() * 1e6, random() * 1e6), angle=random() * 360)
+    verts.append([tuple(v) for v in poly])
+    for v in poly:
+        coords.extend(v)
+    offsets.append(len(coords) // 2)
+convex = [True] * count
+
+start = default_timer()
+[Polygon(v) for v in verts]
+print("Polygon()", count, "polygons:", default_timer() - start)
+
+start = default_timer()
+Polygon.from_ragged(coords, offsets)
+print("Polygon.from_ragged()", count, "polygons:", default_timer() - start)
+
+start = default_timer()
+[Polygon(v, is_convex=True) for v in verts]
+print("Polygon(is_convex=True)", count, "polygons:",
+    default_timer() - start)
+
+start = default_timer()
+Polygon.from_ragged(coords, offsets, is_convex=convex)
+print("Polygon.from_ragged(is_convex)", count, "polygons:",
+    default_timer() - start)
+
+# Most of the time above is spent in garbage collection passes triggered
+# by allocating millions of vectors
+import gc
+gc.disable()
+
+start = default_timer()
+[Polygon(v) for v in verts]
+print("Polygon() without gc", count, "polygons:", default_timer() - start)
+
+start = default_timer()
+Polygon.from_ragged(coords, offsets)
+print("Polygon.from_ragged() without gc", count, "polygons:",
+    default_timer() - start)
+
+gc.enable()
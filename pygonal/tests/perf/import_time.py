@@ -0,0 +1,32 @@
+# Measure the cold-start cost of importing pygonal. Each statement is run
+# in a fresh interpreter; the interpreter startup time is subtracted.
+import subprocess
+import sys
+from timeit import default_timer
+
+times = 20
+
+statements = [
+    'import pygonal',
+    'from pygonal import Vec2',
+    'from pygonal import Polygon',
+    'from pygonal import *',
+    'import pygonal.io.wkb',
+    'import pygonal.io.geojson',
+]
+
+def run(statement):
+    best = float('inf')
+    for i in range(times):
+        start = default_timer()
+        subprocess.check_call([sys.executable, '-c', statement])
+        best = min(best, default_timer() - start)
+    return best
+
+baseline = run('pass')
+for statement in statements:
+    modules = subprocess.check_output([sys.executable, '-c',
+        statement + '\nimport sys\n'
+        'print(len([m for m in sys.modules if m.startswith("pygonal")]))'])
+    print("%-28s %7.2f ms, %s pygonal modules" % (statement,
+        (run(statement) - baseline) * 1000, modules.decode().strip()))
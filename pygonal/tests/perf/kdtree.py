@@ -0,0 +1,40 @@
+from random import random
+from timeit import timeit
+import functools
+from pygonal import Vec2Array, KDTree
+
+def rand_pts(count, span=1000):
+    return Vec2Array((random() * span, random() * span) for i in range(count))
+
+def brute_knn(points, point, k):
+    return sorted((point.distance_to(p), i)
+        for i, p in enumerate(points))[:k]
+
+def brute_radius(points, point, radius):
+    return [i for i, p in enumerate(points) if point.distance_to(p) <= radius]
+
+def run_queries(func, queries, *args):
+    for q in queries:
+        func(q, *args)
+
+times = 3
+
+for count in [1000, 10000, 100000]:
+    points = rand_pts(count)
+    queries = list(rand_pts(100))
+    print("KDTree build", count, "points:",
+        timeit(functools.partial(KDTree, points), number=1))
+    tree = KDTree(points)
+    print("Brute knn", count, "points:",
+        timeit(functools.partial(run_queries,
+            functools.partial(brute_knn, points), queries, 10), number=times))
+    print("KDTree knn", count, "points:",
+        timeit(functools.partial(tree.knn_many, queries, 10), number=times))
+    print("Brute radius", count, "points:",
+        timeit(functools.partial(run_queries,
+            functools.partial(brute_radius, points), queries, 20),
+            number=times))
+    print("KDTree radius", count, "points:",
+        timeit(functools.partial(tree.query_radius_many, queries, 20),
+            number=times))
+    print()
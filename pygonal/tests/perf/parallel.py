@@ -0,0 +1,26 @@
+# Compare serial and thread pool point-in-polygon batch queries. Speedups
+# require a free-threaded interpreter.
+import functools
+import os
+from random import random
+from timeit import timeit
+from pygonal import Vec2Array, Polygon
+from pygonal import parallel
+
+count = 200000
+times = 3
+points = Vec2Array((random() * 4 - 2, random() * 4 - 2) for i in range(count))
+
+for name, poly in [
+    ('convex', Polygon.regular(100, 1.8, angle=5)),
+    ('concave', Polygon.star(50, 1.8, 1.0, angle=5)),
+]:
+    poly.is_convex
+    print(name, "serial:",
+        timeit(functools.partial(poly.contains_points, points),
+            number=times))
+    for workers in sorted(set([2, 4, os.cpu_count() or 1])):
+        print(name, workers, "threads:",
+            timeit(functools.partial(parallel.contains_points, poly, points,
+                workers=workers), number=times))
+    print()
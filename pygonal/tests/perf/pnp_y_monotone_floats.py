@@ -0,0 +1,64 @@
+# Compare the y-monotone point in polygon test on chains of (y, x) tuples,
+# as previously stored by Polygon._split_y_polylines(), with the test on
+# parallel lists of floats, and the batch test used by
+# Polygon.contains_points() with calling contains_point() for each point.
+import bisect
+from random import random
+from timeit import repeat
+from pygonal import Polygon
+
+def tuple_polylines(poly):
+    left_y, left_x, right_y, right_x = poly._y_polylines
+    return list(zip(left_y, left_x)), list(zip(right_y, right_x))
+
+def tuple_test(polylines, point):
+    px, py = point
+    pt_y_tuple = (py,)
+    lpline, rpline = polylines
+    i = bisect.bisect_right(lpline, pt_y_tuple)
+    if i == 0 or i == len(lpline):
+        return False
+    v0_y, v0_x = lpline[i-1]
+    v1_y, v1_x = lpline[i]
+    if ((v1_x - v0_x) * (py - v0_y)
+        - (px - v0_x) * (v1_y - v0_y) > 0):
+        return False
+    i = bisect.bisect_right(rpline, pt_y_tuple)
+    v0_y, v0_x = rpline[i-1]
+    v1_y, v1_x = rpline[i]
+    return ((v1_x - v0_x) * (py - v0_y)
+        - (px - v0_x) * (v1_y - v0_y) > 0)
+
+def run_tuples(polylines, points):
+    return [tuple_test(polylines, p) for p in points]
+
+def run_floats(poly, points):
+    test = poly._pnp_y_monotone_test
+    return [test(p) for p in points]
+
+def run_contains_point(poly, points):
+    contains = poly.contains_point
+    return [contains(p) for p in points]
+
+times = 20
+
+def timeit(func, number):
+    return min(repeat(func, number=number, repeat=5))
+
+for verts in [8, 64, 512, 4096]:
+    poly = Polygon.regular(verts, 10, angle=random() * 360)
+    polylines = tuple_polylines(poly)
+    for count in [10, 100, 2000, 20000]:
+        points = [(random() * 24 - 12, random() * 24 - 12)
+            for i in range(count)]
+        assert (run_tuples(polylines, points) == run_floats(poly, points)
+            == poly.contains_points(points))
+        print(verts, "sided,", count, "points")
+        print("  tuples:", timeit(
+            lambda: run_tuples(polylines, points), number=times))
+        print("  floats:", timeit(
+            lambda: run_floats(poly, points), number=times))
+        print("  contains_point:", timeit(
+            lambda: run_contains_point(poly, points), number=times))
+        print("  contains_points:", timeit(
+            lambda: poly.contains_points(points), number=times))
@@ -0,0 +1,25 @@
+from timeit import timeit
+import functools
+from pygonal import Polygon
+
+def compare(a, b):
+    return a == b
+
+def fresh_compare(verts_a, verts_b):
+    return Polygon(verts_a) == Polygon(verts_b)
+
+times = 1000
+
+for count in [4, 16, 64, 256]:
+    verts = list(Polygon.regular(count, 10))
+    rotated = verts[count // 3:] + verts[:count // 3]
+    rotated.reverse()
+    a = Polygon(verts)
+    b = Polygon(rotated)
+    print("Cached eq", count, "verts:",
+        timeit(functools.partial(compare, a, b), number=times))
+    print("Uncached eq", count, "verts:",
+        timeit(functools.partial(fresh_compare, verts, rotated),
+        number=times))
+    print("Fingerprint", count, "verts:",
+        timeit(lambda: Polygon(verts).fingerprint, number=times))
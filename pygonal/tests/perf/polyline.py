@@ -0,0 +1,46 @@
+from random import random
+from timeit import timeit
+import functools
+from pygonal import Vec2Array, Polyline
+
+def rand_route(count, step=10):
+    x = y = 0.0
+    points = []
+    for i in range(count):
+        x += (random() - 0.5) * step
+        y += (random() - 0.5) * step
+        points.append((x, y))
+    return Vec2Array(points)
+
+def brute_point_at(points, distance):
+    total = 0.0
+    for a, b in zip(points, points[1:]):
+        seg = a.distance_to(b)
+        if total + seg >= distance:
+            return a.lerp(b, (distance - total) / seg)
+        total += seg
+    return points[-1]
+
+def run_queries(func, queries):
+    for q in queries:
+        func(q)
+
+times = 3
+
+for count in [1000, 10000, 100000]:
+    points = rand_route(count)
+    line = Polyline(points)
+    print("Polyline lengths", count, "vertices:",
+        timeit(Polyline(points)._cumulative_lengths,
+            number=1))
+    queries = [random() * line.length for i in range(100)]
+    print("Brute point_at", count, "vertices:",
+        timeit(functools.partial(run_queries,
+            functools.partial(brute_point_at, list(points)), queries),
+            number=times))
+    print("Polyline.point_at", count, "vertices:",
+        timeit(functools.partial(run_queries, line.point_at, queries),
+            number=times))
+    print("Polyline.points_at", count, "vertices:",
+        timeit(functools.partial(line.points_at, sorted(queries)),
+            number=times))
@@ -0,0 +1,63 @@
+# Compare the startup cost of constructing polygons with loading them
+# from a memory-mapped polygon store.
+import os
+import tempfile
+from random import random, randint
+from timeit import default_timer
+from pygonal import Polygon, PolygonCollection
+from pygonal.io import store, wkb
+
+count = 100000
+
+def rand_verts():
+    poly = Polygon.regular(randint(4, 16), random() * 100,
+        center=(random() * 1e6, random() * 1e6), angle=random() * 360)
+    return [tuple(v) for v in poly]
+
+verts = [rand_verts() for i in range(count)]
+tmp = tempfile.mkdtemp()
+store_path = os.path.join(tmp, 'polys.pyg')
+wkb_path = os.path.join(tmp, 'polys.wkb')
+
+start = default_timer()
+polys = [Polygon(v) for v in verts]
+print("Polygon()", count, "polygons:", default_timer() - start)
+
+start = default_timer()
+PolygonCollection(polys)
+print("PolygonCollection()", count, "polygons:", default_timer() - start)
+
+store.dump(polys, store_path)
+with open(wkb_path, 'wb') as fp:
+    for poly in polys:
+        wkb.dump(poly, fp)
+
+start = default_timer()
+with open(wkb_path, 'rb') as fp:
+    wkb.load_collection(fp)
+print("wkb.load_collection()", count, "polygons:", default_timer() - start)
+
+start = default_timer()
+coll = store.load(store_path)
+print("store.load()", count, "polygons:", default_timer() - start)
+
+start = default_timer()
+coll.bounding_boxes()
+print("Bounding boxes from store", count, "polygons:",
+    default_timer() - start)
+
+store32_path = os.path.join(tmp, 'polys32.pyg')
+store.dump(polys, store32_path, typecode='f')
+print("Store size float64:", os.path.getsize(store_path),
+    "float32:", os.path.getsize(store32_path))
+coll32 = store.load(store32_path)
+start = default_timer()
+coll32.bounding_boxes()
+print("Bounding boxes from float32 store", count, "polygons:",
+    default_timer() - start)
+
+del coll, coll32
+os.remove(store_path)
+os.remove(store32_path)
+os.remove(wkb_path)
+os.rmdir(tmp)
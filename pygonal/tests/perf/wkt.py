@@ -0,0 +1,39 @@
+# Benchmark WKT reading and writing on a generated file of polygons.
+# Pass the file size in megabytes on the command line, e.g. 100.
+import os
+import sys
+import tempfile
+from random import random, randint
+from timeit import default_timer
+from pygonal import Polygon
+from pygonal.io import wkt
+
+size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+def rand_poly():
+    return Polygon.regular(randint(4, 64), random() * 100,
+        center=(random() * 1e6, random() * 1e6), angle=random() * 360)
+
+path = os.path.join(tempfile.mkdtemp(), 'polys.wkt')
+polys = [rand_poly() for i in range(1000)]
+start = default_timer()
+written = count = 0
+with open(path, 'w') as fp:
+    while written < size_mb * 1e6:
+        line = wkt.dumps(polys[count % len(polys)], precision=6) + '\n'
+        fp.write(line)
+        written += len(line)
+        count += 1
+print("Wrote", count, "polygons,", written // 1000000, "MB:",
+    default_timer() - start)
+
+start = default_timer()
+vertices = 0
+with open(path) as fp:
+    for line in fp:
+        vertices += len(wkt.loads(line))
+print("Read", count, "polygons,", vertices, "vertices:",
+    default_timer() - start)
+
+os.remove(path)
+os.rmdir(os.path.dirname(path))
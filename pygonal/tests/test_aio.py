@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import asyncio
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pygonal import Vec2Array, Polygon
+from pygonal import aio
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""Asyncio geometry processing unit tests"""
+
+
+def rand_points(count, seed=4):
+    rand = random.Random(seed)
+    return Vec2Array((rand.uniform(-3, 3), rand.uniform(-3, 3))
+        for i in range(count))
+
+def run_with_ticker(coro):
+    """Run coro alongside a task counting how often the event loop
+    gave it control. Return the coroutine result and the tick count.
+    """
+    async def main():
+        ticks = [0]
+        done = []
+        async def ticker():
+            while not done:
+                ticks[0] += 1
+                await asyncio.sleep(0)
+        task = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0)
+        result = await coro
+        done.append(True)
+        await task
+        return result, ticks[0]
+    return asyncio.run(main())
+
+
+class AioTestCase(unittest.TestCase):
+
+    def test_contains_points_chunked(self):
+        points = rand_points(1000)
+        poly = Polygon.star(7, 1, 2.5)
+        mask, ticks = run_with_ticker(
+            aio.contains_points(poly, points, chunk_size=100))
+        self.assertEqual(mask, poly.contains_points(points))
+        self.assertTrue(ticks >= 10)
+
+    def test_contains_points_executor(self):
+        points = rand_points(1000)
+        poly = Polygon.regular(20, 2)
+        with ThreadPoolExecutor(2) as executor:
+            mask = asyncio.run(aio.contains_points(poly, points,
+                chunk_size=300, executor=executor))
+        self.assertEqual(mask, poly.contains_points(points))
+
+    def test_contains_points_empty(self):
+        poly = Polygon.regular(5, 1)
+        self.assertEqual(asyncio.run(aio.contains_points(poly, [])), [])
+        with self.assertRaises(ValueError):
+            asyncio.run(aio.contains_points(poly, [(0, 0)], chunk_size=0))
+
+    def test_convex_hull_chunked(self):
+        points = rand_points(1000)
+        expected = Polygon.convex_hull(points)
+        hull, ticks = run_with_ticker(aio.convex_hull(points, chunk_size=64))
+        assert hull.is_convex_known
+        assert hull.is_convex
+        self.assertEqual(hull, expected)
+        self.assertTrue(ticks >= 15)
+
+    def test_convex_hull_executor(self):
+        points = list(rand_points(1000))
+        with ThreadPoolExecutor(2) as executor:
+            hull = asyncio.run(aio.convex_hull(points, chunk_size=100,
+                executor=executor))
+        self.assertEqual(hull, Polygon.convex_hull(points))
+
+    def test_convex_hull_of_convex_polygon(self):
+        poly = Polygon.regular(8, 1)
+        hull = asyncio.run(aio.convex_hull(poly))
+        self.assertEqual(hull, poly)
+        assert hull is not poly
+
+    def test_is_convex_is_simple(self):
+        star = Polygon.star(5, 1, 2)
+        assert asyncio.run(aio.is_simple(star))
+        assert not asyncio.run(aio.is_convex(star))
+        crossed = Polygon([(0,0), (1,1), (1,0), (0,1)])
+        with ThreadPoolExecutor(1) as executor:
+            assert not asyncio.run(aio.is_simple(crossed, executor))
+        assert crossed.is_simple_known
+        square = Polygon([(0,0), (1,0), (1,1), (0,1)])
+        assert asyncio.run(aio.is_simple(square))
+        assert asyncio.run(aio.is_convex(square))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -212,6 +212,27 @@ class BoundingBoxBaseTestCase(object):
         assert not box.contains_point((0, 50))
         assert not box.contains_point((50, 50))
 
+    def test_contains_points(self):
+        box = self.BoundingBox([(-1, -2), (3, 0)])
+        points = [(-0.5, -1), (-1, 0), (2.99, 0), (-1, -2), (3, 0),
+            (3, -2), (-50, 0), (0, 50)]
+        expected = [box.contains_point(p) for p in points]
+        self.assertEqual(expected, [True] * 3 + [False] * 5)
+        self.assertEqual(box.contains_points(points), expected)
+        self.assertEqual(box.contains_points(self.Vec2Array(points)),
+            expected)
+        self.assertEqual(box.contains_points(iter(points)), expected)
+        self.assertEqual(box.contains_points([]), [])
+
+    def test_filter(self):
+        box = self.BoundingBox([(-1, -2), (3, 0)])
+        points = self.Vec2Array([(-0.5, -1), (3, 0), (2.99, 0), (-50, 0)])
+        filtered = box.filter(points)
+        self.assertEqual(next(filtered), points[0])
+        self.assertEqual(list(filtered), [points[2]])
+        self.assertEqual(list(box.filter(iter([(0, -1), (5, 5)]))),
+            [(0, -1)])
+
     def test_contains_wrong_type(self):
         with self.assertRaises(AttributeError):
             self.BoundingBox([(2, 6), (5, 7)]).contains(None)
@@ -332,10 +353,156 @@ class BoundingBoxBaseTestCase(object):
 
 
 class PyBoundingBoxTestCase(BoundingBoxBaseTestCase, unittest.TestCase):
-    from pygonal.vector import Vec2, Seq2
+    from pygonal.vector import Vec2, Vec2Array, Seq2
     from pygonal.box import BoundingBox
 
 
+class BoxArrayBaseTestCase(object):
+
+    def boxes(self):
+        return self.BoxArray([
+            self.BoundingBox([(0, 0), (2, 2)]),
+            self.BoundingBox([(1, 1), (4, 3)]),
+            self.BoundingBox([(5, 5), (6, 6)]),
+            ])
+
+    def test_init(self):
+        boxes = self.boxes()
+        self.assertEqual(len(boxes), 3)
+        self.assertEqual(boxes[1], self.BoundingBox([(1, 1), (4, 3)]))
+        self.assertEqual(list(boxes)[2], self.BoundingBox([(5, 5), (6, 6)]))
+        self.assertEqual(len(self.BoxArray()), 0)
+
+    def test_from_shapes(self):
+        class Shape(object):
+            bounding_box = self.BoundingBox([(-1, -2), (3, 4)])
+        boxes = self.BoxArray([Shape(), Shape()])
+        self.assertEqual(list(boxes), [Shape.bounding_box] * 2)
+
+    def test_from_arrays(self):
+        boxes = self.BoxArray.from_arrays([0, 1], [0, 1], [2, 4], [2, 3])
+        self.assertEqual(boxes, self.boxes()[:2])
+        with self.assertRaises(ValueError):
+            self.BoxArray.from_arrays([0, 1], [0], [2, 4], [2, 3])
+
+    def test_bounding_box(self):
+        self.assertEqual(self.boxes().bounding_box,
+            self.BoundingBox([(0, 0), (6, 6)]))
+        with self.assertRaises(ValueError):
+            self.BoxArray().bounding_box
+
+    def test_areas(self):
+        self.assertEqual(list(self.boxes().areas()), [4, 6, 1])
+
+    def test_contains_point(self):
+        boxes = self.boxes()
+        self.assertEqual(boxes.contains_point((1.5, 1.5)),
+            [True, True, False])
+        self.assertEqual(boxes.contains_point((0, 2)), [True, False, False])
+        self.assertEqual(boxes.contains_point((2, 0)), [False, False, False])
+
+    def test_contains_points(self):
+        boxes = self.boxes()
+        self.assertEqual(boxes.contains_points(
+            self.Vec2Array([(1, 1), (0, 0), (5.5, 6)])), [True, False, True])
+        with self.assertRaises(ValueError):
+            boxes.contains_points([(1, 1)])
+
+    def test_intersects(self):
+        boxes = self.boxes()
+        self.assertEqual(boxes.intersects(self.BoundingBox([(2, 2), (5, 5)])),
+            [True, True, True])
+        self.assertEqual(boxes.intersects(self.BoundingBox([(3, 0), (4, 1)])),
+            [False, True, False])
+        other = self.BoxArray.from_arrays(
+            [3, 0, 0], [3, 0, 0], [4, 1, 1], [4, 1, 1])
+        self.assertEqual(boxes.intersects(other), [False, True, False])
+        with self.assertRaises(ValueError):
+            boxes.intersects(other[:1])
+
+    def test_union(self):
+        boxes = self.boxes()
+        union = boxes.union(self.BoundingBox([(1, 1), (3, 3)]))
+        self.assertEqual(list(union), [
+            self.BoundingBox([(0, 0), (3, 3)]),
+            self.BoundingBox([(1, 1), (4, 3)]),
+            self.BoundingBox([(1, 1), (6, 6)]),
+            ])
+        self.assertEqual(boxes.union(boxes), boxes)
+
+    def test_intersection(self):
+        boxes = self.boxes()
+        inter = boxes.intersection(self.BoundingBox([(1, 1), (3, 3)]))
+        self.assertEqual(list(inter)[:2], [
+            self.BoundingBox([(1, 1), (2, 2)]),
+            self.BoundingBox([(1, 1), (3, 3)]),
+            ])
+        self.assertEqual(inter.areas()[2], 0)
+        self.assertEqual(boxes.intersection(boxes), boxes)
+
+    def test_overlapping_pairs(self):
+        boxes = self.BoxArray.from_arrays(
+            [0, 1, 5, 2, 10], [0, 1, 5, 2, 0],
+            [2, 4, 6, 5, 11], [2, 3, 6, 5, 1])
+        self.assertEqual(boxes.overlapping_pairs(),
+            [(0, 1), (0, 3), (1, 3), (2, 3)])
+        self.assertEqual(self.BoxArray().overlapping_pairs(), [])
+
+    def test_overlapping_pairs_matches_brute_force(self):
+        import random
+        rand = random.Random(3)
+        def rand_boxes(count):
+            return self.BoxArray([self.BoundingBox([
+                (rand.uniform(0, 100), rand.uniform(0, 100)),
+                (rand.uniform(0, 100), rand.uniform(0, 100))])
+                for i in range(count)])
+        boxes = rand_boxes(60)
+        others = rand_boxes(40)
+        self.assertEqual(boxes.overlapping_pairs(), [(i, j)
+            for i in range(len(boxes)) for j in range(i + 1, len(boxes))
+            if boxes[i:i + 1].intersects(boxes[j])[0]])
+        self.assertEqual(boxes.overlapping_pairs(others), [(i, j)
+            for i in range(len(boxes)) for j in range(len(others))
+            if boxes[i:i + 1].intersects(others[j])[0]])
+
+    def test_equals(self):
+        self.assertEqual(self.boxes(), self.boxes())
+        self.assertNotEqual(self.boxes(), self.boxes()[1:])
+        with self.assertRaises(TypeError):
+            hash(self.boxes())
+
+    def test_float32(self):
+        boxes = self.BoxArray([self.BoundingBox([(0.1, -0.1), (1.1, 0.3)]),
+            self.BoundingBox([(-1e-50, 0), (1e-50, 3)])], typecode='f')
+        self.assertEqual(boxes.typecode, 'f')
+        self.assertEqual(boxes._min_x.itemsize, 4)
+        # Rounded outward to enclose the original boxes
+        self.assertTrue(boxes._min_x[0] <= 0.1 and boxes._min_y[0] <= -0.1)
+        self.assertTrue(boxes._max_x[0] >= 1.1 and boxes._max_y[0] >= 0.3)
+        self.assertTrue(boxes._min_x[1] < 0.0 < boxes._max_x[1])
+        self.assertAlmostEqual(boxes[0].min_point.x, 0.1)
+        self.assertEqual(boxes[:1].typecode, 'f')
+        self.assertEqual(boxes.union(boxes).typecode, 'f')
+        self.assertEqual(boxes.intersects(
+            self.BoundingBox([(0, 0), (0.1, 0.1)])), [True, True])
+        exact = self.BoxArray.from_arrays([1], [2], [3], [4], typecode='f')
+        self.assertEqual(list(exact._min_x), [1.0])
+        self.assertEqual(list(exact._max_y), [4.0])
+        with self.assertRaises(ValueError):
+            self.BoxArray([], typecode='q')
+
+    def test_str_and_repr(self):
+        boxes = self.boxes()[:1]
+        self.assertEqual(repr(boxes),
+            'BoxArray([BoundingBox([(0.0, 0.0), (2.0, 2.0)])])')
+        self.assertEqual(str(boxes), repr(boxes))
+
+
+class PyBoxArrayTestCase(BoxArrayBaseTestCase, unittest.TestCase):
+    from pygonal.vector import Vec2, Vec2Array
+    from pygonal.box import BoundingBox, BoxArray
+
+
 if __name__ == '__main__':
     unittest.main()
 
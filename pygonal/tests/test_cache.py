@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import unittest
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""PropertyCache class unit tests"""
+
+
+class PropertyCacheBaseTestCase(object):
+
+    def setUp(self):
+        self.cache = self.PropertyCache(maxsize=3)
+
+    def tearDown(self):
+        self.Polygon.property_cache = None
+
+    def test_get_put(self):
+        cache = self.cache
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', {'x': 1})
+        self.assertEqual(cache.get('a'), {'x': 1})
+        cache.put('a', {'y': 2})
+        self.assertEqual(cache.get('a'), {'x': 1, 'y': 2})
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        assert 'a' in cache
+        self.assertEqual(len(cache), 1)
+
+    def test_get_returns_copy(self):
+        self.cache.put('a', {'x': 1})
+        self.cache.get('a')['x'] = 2
+        self.assertEqual(self.cache.get('a'), {'x': 1})
+
+    def test_lru_eviction(self):
+        cache = self.cache
+        for key in 'abc':
+            cache.put(key, {})
+        cache.get('a')
+        cache.put('d', {})
+        self.assertEqual(len(cache), 3)
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'd' in cache
+
+    def test_clear(self):
+        self.cache.put('a', {})
+        self.cache.get('a')
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            self.PropertyCache(0)
+
+    def test_repr(self):
+        self.assertEqual(repr(self.cache),
+            "PropertyCache(maxsize=3) <0 entries, 0 hits, 0 misses>")
+
+    def test_polygon_cache_disabled(self):
+        self.assertIsNone(self.Polygon.property_cache)
+
+    def test_polygon_repopulated(self):
+        self.Polygon.property_cache = cache = self.PropertyCache()
+        verts = [(0,0), (2,0), (3,1), (2,2), (0,2)]
+        poly = self.Polygon(verts)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        assert poly.is_convex
+        centroid = poly.centroid
+        # Same shape with a different start vertex and winding
+        other = self.Polygon(list(reversed(verts[2:] + verts[:2])))
+        self.assertEqual(cache.hits, 1)
+        assert other.is_convex_known
+        assert other.is_simple_known
+        assert other.is_centroid_known
+        assert other.centroid.almost_equals(centroid)
+        assert other.contains_point((1, 1))
+        assert not other.contains_point((2.9, 1.9))
+
+    def test_polygon_non_simple(self):
+        self.Polygon.property_cache = self.PropertyCache()
+        verts = [(0,0), (1,1), (1,0), (0,1)]
+        assert not self.Polygon(verts).is_simple
+        poly = self.Polygon(verts)
+        assert poly.is_simple_known
+        assert not poly.is_simple
+        assert poly.is_convex_known
+        assert not poly.is_convex
+
+    def test_polygon_from_ragged(self):
+        self.Polygon.property_cache = self.PropertyCache()
+        assert not self.Polygon([(0,0), (1,1), (1,0), (0,1)]).is_simple
+        polys = self.Polygon.from_ragged([0,0, 1,1, 1,0, 0,1, 1,1, 0,1, 0,0],
+            [0, 4, 7], is_convex=[None, True])
+        assert polys[0].is_simple_known
+        assert not polys[0].is_simple
+        assert polys[1].is_convex_known
+
+    def test_polygon_mutated(self):
+        self.Polygon.property_cache = self.PropertyCache()
+        poly = self.Polygon([(0,0), (1,1), (1,0), (0,1)])
+        assert not poly.is_simple
+        poly[1] = (1, 0.5)
+        poly[2] = (0.5, 1)
+        assert poly.is_convex
+        poly = self.Polygon([(0,0), (1,0.5), (0.5,1), (0,1)])
+        assert poly.is_convex_known
+        assert poly.is_convex
+
+
+class PyPropertyCacheTestCase(PropertyCacheBaseTestCase, unittest.TestCase):
+    from pygonal.polygon import Polygon
+    from pygonal.cache import PropertyCache
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import unittest
+from pygonal.vector import Vec2
+from pygonal.transform import Affine
+from pygonal.box import BoundingBox
+from pygonal.polygon import Polygon
+from pygonal.calipers import (diameter, width, min_area_rect,
+    min_perimeter_rect)
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""Rotating calipers unit tests"""
+
+POINTS = [(55,27), (53,95), (57,15), (55,24), (54,0), (3,28), (21,93),
+    (10,86), (17,74), (51,44), (7,4), (5,93), (25,86), (20,55), (27,24),
+    (47,52), (55,62), (57,85), (71,71), (75,46), (90,10), (25,42), (62,72),
+    (36,38), (27,52), (69,17), (93,40), (70,51), (77,80), (43,88), (88,74)]
+
+
+class CalipersTestCase(unittest.TestCase):
+
+    def brute_force_rects(self, points):
+        hull = list(Polygon.convex_hull(points))
+        for i in range(len(hull)):
+            u = (hull[i] - hull[i - 1]).normalized()
+            v = u.perpendicular()
+            xs = [u.dot(p) for p in points]
+            ys = [v.dot(p) for p in points]
+            yield max(xs) - min(xs), max(ys) - min(ys)
+
+    def test_diameter(self):
+        dist, a, b = diameter(POINTS)
+        expected = max(Vec2(*p).distance_to(q)
+            for p in POINTS for q in POINTS)
+        self.assertAlmostEqual(dist, expected)
+        self.assertAlmostEqual(a.distance_to(b), expected)
+        assert a in POINTS and b in POINTS
+
+    def test_diameter_polygon(self):
+        dist, a, b = diameter(Polygon.regular(100, 3, center=(1, 1)))
+        self.assertAlmostEqual(dist, 6, places=3)
+        dist, a, b = diameter(Polygon([(0,0), (4,0), (4,3), (0,3)]))
+        self.assertEqual(dist, 5)
+
+    def test_diameter_degenerate(self):
+        self.assertEqual(diameter([(2,3)]), (0.0, Vec2(2,3), Vec2(2,3)))
+        self.assertEqual(diameter(iter([(0,0), (0,2)]))[0], 2)
+        with self.assertRaises(ValueError):
+            diameter([])
+
+    def brute_force_diameter(self, points):
+        return max(Vec2(*p).distance_to(q) for p in points for q in points)
+
+    def assert_encloses(self, box, transform, points):
+        inverse = ~transform
+        for p in points:
+            x, y = inverse * p
+            assert (box.min_point.x - 1e-9 <= x <= box.max_point.x + 1e-9
+                and box.min_point.y - 1e-9 <= y <= box.max_point.y + 1e-9)
+
+    def test_collinear(self):
+        for points in ([(0,0), (0,1), (0,5), (0,2)],
+                [(2,3), (2,4), (2,3), (2,-1)],
+                [(1,1), (3,3), (0,0), (2,2)],
+                [(4,-2), (0,0), (2,-1), (-6,3)]):
+            expected = self.brute_force_diameter(points)
+            dist, a, b = diameter(points)
+            self.assertAlmostEqual(dist, expected)
+            self.assertAlmostEqual(a.distance_to(b), expected)
+            w, normal = width(points)
+            self.assertEqual(w, 0)
+            self.assertAlmostEqual(normal.length, 1)
+            for rect in (min_area_rect, min_perimeter_rect):
+                box, transform = rect(points)
+                self.assertAlmostEqual(box.width * box.height, 0)
+                self.assertAlmostEqual(box.width + box.height, expected)
+                self.assert_encloses(box, transform, points)
+
+    def test_duplicate_points(self):
+        for points in ([(0,0), (0,0), (1,1)],
+                [(5,5), (5,5), (5,5)],
+                POINTS + POINTS[::-1]):
+            expected = self.brute_force_diameter(points)
+            self.assertAlmostEqual(diameter(points)[0], expected)
+            box, transform = min_area_rect(points)
+            self.assert_encloses(box, transform, points)
+        self.assertEqual(width([(5,5), (5,5), (5,5)])[0], 0)
+        self.assertAlmostEqual(width(POINTS + POINTS)[0], width(POINTS)[0])
+
+    def test_width(self):
+        w, normal = width(POINTS)
+        self.assertAlmostEqual(w,
+            min(h for _, h in self.brute_force_rects(POINTS)))
+        self.assertAlmostEqual(normal.length, 1)
+        extents = [normal.dot(p) for p in POINTS]
+        self.assertAlmostEqual(max(extents) - min(extents), w)
+
+    def test_width_rectangle(self):
+        w, normal = width(Polygon([(0,0), (0,1), (5,1), (5,0)]))
+        self.assertEqual(w, 1)
+        self.assertEqual(abs(normal.y), 1)
+
+    def test_min_area_rect(self):
+        box, transform = min_area_rect(POINTS)
+        assert isinstance(box, BoundingBox)
+        assert isinstance(transform, Affine)
+        assert transform.is_orthonormal
+        self.assertAlmostEqual(box.width * box.height,
+            min(w * h for w, h in self.brute_force_rects(POINTS)))
+        self.assert_encloses(box, transform, POINTS)
+
+    def test_min_area_rect_rotated_square(self):
+        square = Polygon.regular(4, 2 ** 0.5, angle=15)
+        box, transform = min_area_rect(square)
+        self.assertAlmostEqual(box.width, 2)
+        self.assertAlmostEqual(box.height, 2)
+        rect = box.to_polygon() * transform
+        assert isinstance(rect, Polygon)
+        for vert in rect:
+            assert any(vert.almost_equals(v) for v in square), vert
+
+    def test_min_area_rect_fit(self):
+        box, transform = min_area_rect(Polygon.regular(4, 2 ** 0.5, angle=30))
+        rect = box.to_polygon() * transform
+        fitted = BoundingBox([(0,0), (10,10)]).fit(rect)
+        self.assertAlmostEqual(fitted.bounding_box.width, 10)
+
+    def test_min_perimeter_rect(self):
+        box, transform = min_perimeter_rect(POINTS)
+        self.assertAlmostEqual(box.width + box.height,
+            min(w + h for w, h in self.brute_force_rects(POINTS)))
+
+    def test_min_rect_degenerate(self):
+        box, transform = min_area_rect([(1,1)])
+        self.assertEqual(box, BoundingBox([(1,1)]))
+        box, transform = min_perimeter_rect([(0,0), (3,4)])
+        self.assertAlmostEqual(box.width, 5)
+        self.assertAlmostEqual(box.height, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import math
+import random
+import unittest
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""Circle class unit tests"""
+
+
+class CircleBaseTestCase(object):
+
+    def test_init(self):
+        circle = self.Circle((1, 2), 3)
+        self.assertEqual(circle.center, self.Vec2(1, 2))
+        self.assertEqual(circle.radius, 3)
+        self.assertAlmostEqual(circle.area, math.pi * 9)
+
+    def test_negative_radius(self):
+        with self.assertRaises(ValueError):
+            self.Circle((0, 0), -1)
+
+    def test_bounding_box(self):
+        circle = self.Circle((1, 2), 3)
+        self.assertEqual(circle.bounding_box,
+            self.BoundingBox([(-2, -1), (4, 5)]))
+
+    def test_contains_point(self):
+        circle = self.Circle((1, 1), 2)
+        assert circle.contains_point((1, 1))
+        assert circle.contains_point((2, 2))
+        assert circle.contains_point((3, 1))
+        assert not circle.contains_point((2.5, 2.5))
+        assert not circle.contains_point((-1.1, 1))
+
+    def test_contains_points(self):
+        circle = self.Circle((0, 0), 1)
+        points = [(0, 0), (1, 1), (0, -1), (0.5, 0.5)]
+        self.assertEqual(circle.contains_points(points),
+            [True, False, True, True])
+        self.assertEqual(circle.contains_points(self.Vec2Array(points)),
+            [True, False, True, True])
+
+    def test_from_points_one_point(self):
+        circle = self.Circle.from_points([(3, 4)])
+        self.assertEqual(circle, self.Circle((3, 4), 0))
+
+    def test_from_points_no_points(self):
+        with self.assertRaises(ValueError):
+            self.Circle.from_points([])
+
+    def test_from_points_diameter(self):
+        circle = self.Circle.from_points([(0, 0), (4, 0), (2, 1)])
+        assert circle.almost_equals(self.Circle((2, 0), 2))
+
+    def test_from_points_circumcircle(self):
+        circle = self.Circle.from_points([(0, 0), (4, 0), (2, 3), (2, 1)])
+        self.assertAlmostEqual(circle.center.x, 2)
+        self.assertAlmostEqual(circle.center.distance_to((0, 0)),
+            circle.radius)
+        self.assertAlmostEqual(circle.center.distance_to((2, 3)),
+            circle.radius)
+
+    def test_from_points_collinear(self):
+        circle = self.Circle.from_points([(0, 0), (1, 1), (3, 3), (2, 2)])
+        assert circle.almost_equals(self.Circle((1.5, 1.5), 18 ** 0.5 / 2))
+
+    def test_from_points_random(self):
+        rand = random.Random(42)
+        for i in range(20):
+            points = [(rand.uniform(-5, 5), rand.uniform(-5, 5))
+                for j in range(rand.randint(2, 200))]
+            circle = self.Circle.from_points(iter(points))
+            for p in points:
+                assert circle.center.distance_to(p) <= circle.radius + 1e-9
+            # At least two points lie on the circumference
+            on_circle = [p for p in points
+                if abs(circle.center.distance_to(p) - circle.radius) < 1e-7]
+            assert len(on_circle) >= 2
+
+    def test_eq(self):
+        assert self.Circle((0, 1), 2) == self.Circle((0, 1), 2)
+        assert self.Circle((0, 1), 2) != self.Circle((0, 1), 3)
+        assert self.Circle((0, 1), 2) != self.Circle((1, 1), 2)
+        assert self.Circle((0, 1), 2) != None
+
+    def test_hash(self):
+        self.assertEqual(hash(self.Circle((0, 1), 2)),
+            hash(self.Circle((0.0, 1.0), 2.0)))
+        circles = {self.Circle((0, 1), 2), self.Circle((0, 1), 2),
+            self.Circle((0, 1), 3)}
+        self.assertEqual(len(circles), 2)
+        assert self.Circle((0, 1), 3) in circles
+
+    def test_mul(self):
+        circle = self.Circle((1, 0), 2)
+        moved = circle * (self.Affine.translation((1, 1))
+            * self.Affine.rotation(90) * self.Affine.scale(3))
+        assert moved.almost_equals(self.Circle((1, 4), 6))
+        assert (self.Affine.scale(2) * circle).almost_equals(
+            self.Circle((2, 0), 4))
+        with self.assertRaises(TypeError):
+            circle * self.Affine.scale((1, 2))
+
+    def test_str_and_repr(self):
+        circle = self.Circle((1.5, 0.25), 2)
+        self.assertEqual(repr(circle), "Circle((1.5, 0.25), 2.0)")
+        self.assertEqual(str(circle), repr(circle))
+
+
+class PyCircleTestCase(CircleBaseTestCase, unittest.TestCase):
+    from pygonal.vector import Vec2, Vec2Array
+    from pygonal.transform import Affine
+    from pygonal.box import BoundingBox
+    from pygonal.circle import Circle
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import random
+import unittest
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""PolygonCollection class unit tests"""
+
+
+class PolygonCollectionBaseTestCase(object):
+
+    def polygons(self):
+        return [
+            self.Polygon.regular(6, 2, center=(1, 1)),
+            self.Polygon([(0, 0), (4, 0), (4, 4), (2, 1), (0, 4)]),
+            self.Polygon([(0, 0), (1, 0), (0, 1)]),
+            self.Polygon([(0, 0), (2, 2), (2, 0), (0, 2)]),
+            ]
+
+    def rand_polygons(self, count, seed=3):
+        rand = random.Random(seed)
+        polys = []
+        for i in range(count):
+            verts = [(rand.uniform(-5, 5), rand.uniform(-5, 5))
+                for j in range(rand.randint(3, 8))]
+            polys.append(self.Polygon(verts))
+        for i in range(count):
+            polys.append(self.Polygon.regular(rand.randint(3, 12),
+                rand.uniform(1, 5), angle=rand.uniform(0, 360)))
+        return polys
+
+    def test_init(self):
+        polys = self.polygons()
+        coll = self.PolygonCollection(polys)
+        self.assertEqual(len(coll), 4)
+        self.assertEqual(list(coll), polys)
+        self.assertEqual(coll[-1], polys[-1])
+        self.assertEqual(coll.vertex_counts(), [6, 5, 3, 4])
+        self.assertEqual(len(self.PolygonCollection()), 0)
+
+    def test_init_from_vertices(self):
+        coll = self.PolygonCollection([[(0, 0), (1, 0), (0, 1)]])
+        self.assertEqual(coll[0], self.Polygon([(0, 0), (1, 0), (0, 1)]))
+        with self.assertRaises(ValueError):
+            self.PolygonCollection([[(0, 0), (1, 0)]])
+
+    def test_index_errors(self):
+        coll = self.PolygonCollection(self.polygons())
+        with self.assertRaises(IndexError):
+            coll[4]
+        with self.assertRaises(IndexError):
+            coll[-5]
+
+    def test_slice(self):
+        polys = self.polygons()
+        coll = self.PolygonCollection(polys)
+        self.assertEqual(list(coll[1:3]), polys[1:3])
+        self.assertIsInstance(coll[1:3], self.PolygonCollection)
+
+    def test_views_keep_known_flags(self):
+        coll = self.PolygonCollection(self.polygons())
+        self.assertTrue(coll[0].is_convex_known)
+        self.assertTrue(coll[0].is_convex)
+        self.assertTrue(coll[0].contains_point((1, 1)))
+        self.assertFalse(coll[1].is_convex_known)
+        coll.classify()
+        self.assertTrue(coll[1].is_convex_known)
+        self.assertFalse(coll[1].is_convex)
+        self.assertFalse(coll[1].is_simple_known)
+
+    def test_views_are_independent(self):
+        coll = self.PolygonCollection(self.polygons())
+        poly = coll[2]
+        poly[0] = (-1, -1)
+        self.assertEqual(coll[2], self.Polygon([(0, 0), (1, 0), (0, 1)]))
+
+    def test_from_buffers(self):
+        from array import array
+        coords = array('d', [0, 0, 1, 0, 0, 1, 0, 0, 2, 0, 2, 2, 0, 2])
+        offsets = array('l', [0, 3, 7])
+        coll = self.PolygonCollection.from_buffers(
+            memoryview(coords), offsets)
+        self.assertEqual(coll[1], self.Polygon([(0, 0), (2, 0), (2, 2), (0, 2)]))
+        self.assertEqual(list(coll.areas()), [0.5, 4])
+        self.assertEqual(coll.classify(), [True, True])
+        with self.assertRaises(ValueError):
+            self.PolygonCollection.from_buffers(coords, [0, 3, 6])
+        with self.assertRaises(ValueError):
+            self.PolygonCollection.from_buffers(coords, [1, 7])
+        with self.assertRaises(ValueError):
+            self.PolygonCollection.from_buffers(coords, offsets, bytearray(1))
+
+    def test_bounding_boxes(self):
+        polys = self.rand_polygons(20)
+        boxes = self.PolygonCollection(polys).bounding_boxes()
+        self.assertIsInstance(boxes, self.BoxArray)
+        self.assertEqual(list(boxes), [p.bounding_box for p in polys])
+
+    def test_areas(self):
+        coll = self.PolygonCollection(self.polygons())
+        areas = coll.areas()
+        self.assertAlmostEqual(areas[0], 6 * 3 ** 0.5)
+        self.assertEqual(list(areas[1:3]), [10, 0.5])
+        self.assertEqual(areas[3], 0)
+        coll = self.PolygonCollection(
+            [[(0, 0), (0, 1), (1, 0)], [(0, 0), (1, 0), (0, 1)]])
+        self.assertEqual(list(coll.areas(signed=True)), [-0.5, 0.5])
+
+    def test_centroids(self):
+        polys = self.polygons()[:3]
+        polys.append(self.Polygon([(0, 0), (1, 0), (1, 1), (0, 1), (2, 2)],
+            is_simple=False))
+        centroids = self.PolygonCollection(polys).centroids()
+        for poly, centroid in zip(polys, centroids):
+            if poly.centroid is None:
+                self.assertIsNone(centroid)
+            else:
+                self.assertTrue(centroid.almost_equals(poly.centroid))
+        coll = self.PolygonCollection([[(0, 0), (1, 1), (2, 2)]])
+        self.assertEqual(coll.centroids(), [None])
+
+    def test_classify_matches_polygon(self):
+        polys = self.rand_polygons(100)
+        coll = self.PolygonCollection(
+            self.Polygon(p) for p in polys)
+        self.assertEqual(coll.classify(),
+            [self.Polygon(p).is_convex for p in polys])
+        self.assertEqual([p.is_convex_known for p in coll], [True] * 200)
+
+    def test_transform(self):
+        polys = self.polygons()
+        coll = self.PolygonCollection(polys)
+        coll.classify()
+        xform = self.Affine.rotation(30) * self.Affine.translation((2, -1))
+        moved = coll.transform(xform)
+        self.assertEqual(len(moved), len(coll))
+        for poly, moved_poly in zip(polys, moved):
+            self.assertTrue(moved_poly.almost_equals(poly * xform))
+            self.assertTrue(moved_poly.is_convex_known)
+        self.assertEqual(list(coll), polys)
+        flat = coll.transform(self.Affine.scale((1, 0)))
+        self.assertFalse(flat[1].is_convex_known)
+
+    def test_equals(self):
+        self.assertEqual(self.PolygonCollection(self.polygons()),
+            self.PolygonCollection(self.polygons()))
+        self.assertNotEqual(self.PolygonCollection(self.polygons()),
+            self.PolygonCollection(self.polygons()[1:]))
+        with self.assertRaises(TypeError):
+            hash(self.PolygonCollection())
+
+    def test_float32(self):
+        polys = self.polygons()
+        coll = self.PolygonCollection(polys, typecode='f')
+        self.assertEqual(coll.typecode, 'f')
+        self.assertEqual(coll._coords.itemsize, 4)
+        self.assertEqual(self.PolygonCollection(polys).typecode, 'd')
+        for poly, stored in zip(polys, coll):
+            for v1, v2 in zip(poly, stored):
+                assert v1.almost_equals(v2)
+        # Only the classification of triangles is retained
+        self.assertEqual([p.is_convex_known for p in coll],
+            [False, False, True, False])
+        self.assertEqual(coll.classify(), [True, False, True, False])
+        self.assertEqual(coll[1:].typecode, 'f')
+        moved = coll.transform(self.Affine.translation((1, 1)))
+        self.assertEqual(moved.typecode, 'f')
+        self.assertEqual([p.is_convex_known for p in moved],
+            [False, False, True, False])
+        self.assertEqual(coll.bounding_boxes().typecode, 'f')
+        for a1, a2 in zip(coll.areas(), self.PolygonCollection(polys).areas()):
+            self.assertAlmostEqual(a1, a2, 5)
+        with self.assertRaises(ValueError):
+            self.PolygonCollection(polys, typecode='i')
+
+    def test_str_and_repr(self):
+        coll = self.PolygonCollection([[(0, 0), (1, 0), (0, 1)]])
+        self.assertEqual(repr(coll),
+            'PolygonCollection([Polygon([(0.0, 0.0), (1.0, 0.0), '
+            '(0.0, 1.0)], is_convex=True)])')
+        self.assertEqual(str(coll), repr(coll))
+
+
+class PyPolygonCollectionTestCase(PolygonCollectionBaseTestCase,
+    unittest.TestCase):
+    from pygonal.transform import Affine
+    from pygonal.box import BoxArray
+    from pygonal.polygon import Polygon
+    from pygonal.collection import PolygonCollection
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import io
+import json
+import unittest
+from pygonal import (Vec2, Vec2Array, LineSegment, BoundingBox, Polygon,
+    PolygonCollection, PolygonWithHoles, MultiPolygon)
+from pygonal.io import geojson, MultiPoint, MultiLineString, Empty
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""GeoJSON reader and writer unit tests"""
+
+
+class GeoJSONTestCase(unittest.TestCase):
+
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+
+    def test_geometries(self):
+        self.assertEqual(geojson.loads(
+            '{"type": "Point", "coordinates": [1.5, -2, 7]}'), Vec2(1.5, -2))
+        self.assertEqual(geojson.loads(
+            '{"type": "LineString", "coordinates": [[0, 0], [1, 2]]}'),
+            Vec2Array([(0, 0), (1, 2)]))
+        self.assertEqual(geojson.loads(
+            '{"type": "MultiPoint", "coordinates": [[0, 0], [1, 2]]}'),
+            MultiPoint([(0, 0), (1, 2)]))
+        self.assertEqual(geojson.loads('{"type": "Polygon", "coordinates": '
+            '[[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]]}'),
+            Polygon(self.square))
+        self.assertEqual(geojson.loads('{"type": "MultiLineString", '
+            '"coordinates": [[[0, 0], [1, 1]], [[2, 2], [3, 3]]]}'),
+            MultiLineString([Vec2Array([(0, 0), (1, 1)]),
+                Vec2Array([(2, 2), (3, 3)])]))
+        self.assertEqual(geojson.loads('{"type": "MultiPolygon", '
+            '"coordinates": [[[[0, 0], [1, 0], [0, 1], [0, 0]]]]}'),
+            PolygonCollection([[(0, 0), (1, 0), (0, 1)]]))
+        self.assertIsNone(geojson.loads('null'))
+
+    def test_empty(self):
+        for kind in ('Point', 'Polygon'):
+            obj = {'type': kind, 'coordinates': []}
+            self.assertEqual(geojson.from_dict(obj), Empty(kind))
+            self.assertEqual(geojson.to_dict(Empty(kind)), obj)
+
+    def test_invalid(self):
+        for text in ['{"type": "Circle", "coordinates": [0, 0]}',
+            '{"type": "Point"}',
+            '{"type": "Polygon", "coordinates": [[[0, 0], [1, 1], [0, 0]]]}',
+            ]:
+            with self.assertRaises(ValueError):
+                geojson.loads(text)
+        with self.assertRaises(TypeError):
+            geojson.dumps(object())
+
+    def test_round_trip(self):
+        geoms = [
+            Vec2(0.1, 1 / 3),
+            Vec2Array([(0, 0), (1, 2), (3, 1)]),
+            Polygon.regular(7, 3),
+            PolygonCollection([Polygon(self.square),
+                Polygon([(0, 0), (1, 0), (0, 1)])]),
+            [Vec2(1, 2), Polygon(self.square)],
+            MultiPoint([(0, 0), (1, 2)]),
+            MultiLineString([Vec2Array([(0, 0), (1, 1)])]),
+            None,
+            ]
+        for geom in geoms:
+            self.assertEqual(geojson.loads(geojson.dumps(geom)), geom)
+            self.assertIs(type(geojson.loads(geojson.dumps(geom))),
+                type(geom))
+
+    def test_to_dict(self):
+        self.assertEqual(geojson.to_dict(Polygon(self.square)), {
+            'type': 'Polygon',
+            'coordinates': [[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]]})
+        self.assertEqual(geojson.to_dict(Vec2(1 / 3, 2), precision=2),
+            {'type': 'Point', 'coordinates': [0.33, 2]})
+        self.assertEqual(geojson.to_dict(
+            LineSegment.from_points([(0, 0), (3, 4)])),
+            {'type': 'LineString', 'coordinates': [[0, 0], [3, 4]]})
+        self.assertEqual(geojson.to_dict(BoundingBox(self.square)),
+            geojson.to_dict(BoundingBox(self.square).to_polygon()))
+
+    def test_holes(self):
+        rings = [[[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+            [[1, 1], [1, 2], [2, 2], [2, 1], [1, 1]]]
+        poly = geojson.from_dict({'type': 'Polygon', 'coordinates': rings})
+        self.assertEqual(poly, PolygonWithHoles(
+            [(0, 0), (4, 0), (4, 4), (0, 4)],
+            [[(1, 1), (1, 2), (2, 2), (2, 1)]]))
+        self.assertEqual(geojson.to_dict(poly),
+            {'type': 'Polygon', 'coordinates': rings})
+        multi = geojson.from_dict(
+            {'type': 'MultiPolygon', 'coordinates': [rings, rings[:1]]})
+        self.assertIsInstance(multi, MultiPolygon)
+        self.assertEqual(len(multi), 2)
+        self.assertEqual(geojson.to_dict(multi),
+            {'type': 'MultiPolygon', 'coordinates': [rings, rings[:1]]})
+
+    def features(self):
+        return [(Polygon.regular(n, n), {'name': 'poly %d' % n, 'n': n})
+            for n in range(3, 20)]
+
+    def test_stream_round_trip(self):
+        features = self.features()
+        fp = io.StringIO()
+        geojson.dump(iter(features), fp)
+        text = fp.getvalue()
+        self.assertEqual(json.loads(text)['type'], 'FeatureCollection')
+        for chunk_size in (1, 7, 100, 65536):
+            self.assertEqual(list(geojson.iter_load(
+                io.StringIO(text), chunk_size)), features)
+            self.assertEqual(list(geojson.iter_load(
+                io.BytesIO(text.encode('utf-8')), chunk_size)), features)
+
+    def test_stream_other_members(self):
+        text = json.dumps({'type': 'FeatureCollection', 'name': u'\xe9t\xe9',
+            'bbox': [0, 0, 2, 2], 'features': [{'type': 'Feature',
+                'properties': {'value': 12345678}, 'geometry': {
+                    'type': 'Point', 'coordinates': [1, 2]}}],
+            'count': 1234567}, ensure_ascii=False)
+        for chunk_size in (1, 3, 1000):
+            self.assertEqual(list(geojson.iter_load(
+                io.BytesIO(text.encode('utf-8')), chunk_size)),
+                [(Vec2(1, 2), {'value': 12345678})])
+
+    def test_stream_single_feature_or_geometry(self):
+        text = ('{"type": "Feature", "properties": null, "geometry": '
+            '{"type": "Point", "coordinates": [1, 2]}}')
+        self.assertEqual(list(geojson.iter_load(io.StringIO(text), 4)),
+            [(Vec2(1, 2), None)])
+        text = '{"type": "Point", "coordinates": [1, 2]}'
+        self.assertEqual(list(geojson.iter_load(io.StringIO(text), 4)),
+            [(Vec2(1, 2), None)])
+        text = '{"type": "FeatureCollection", "features": []}'
+        self.assertEqual(list(geojson.iter_load(io.StringIO(text))), [])
+
+    def test_stream_invalid(self):
+        for text in ['', '[]', '{"features": [1, 2}',
+            '{"type": "FeatureCollection", "features": [{"geometry": null}']:
+            with self.assertRaises(ValueError):
+                list(geojson.iter_load(io.StringIO(text), 4))
+
+    def test_dump_geometries(self):
+        fp = io.StringIO()
+        geojson.dump([Vec2(1, 2), Polygon(self.square)], fp, precision=3)
+        self.assertEqual(list(geojson.iter_load(io.StringIO(fp.getvalue()))),
+            [(Vec2(1, 2), None), (Polygon(self.square), None)])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import unittest
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""Integer grid coordinate unit tests"""
+
+
+class GridVec2ArrayBaseTestCase(object):
+
+    def test_snap(self):
+        a = self.GridVec2Array([(0.004, 0.005), (1.2349, -0.015)], 0.01)
+        self.assertEqual(a.grid_points(), [(0, 1), (123, -1)])
+        self.assertEqual(len(a), 2)
+        self.assertEqual(a.scale, 0.01)
+        self.assertEqual(a.typecode, 'q')
+        self.assertEqual(a.snap((0.126, 0)), (13, 0))
+
+    def test_world_points(self):
+        a = self.GridVec2Array([(1.2, 3.6), (-2, 0.4)], 0.5)
+        self.assertEqual(list(a), [self.Vec2(1, 3.5), self.Vec2(-2, 0.5)])
+        self.assertEqual(a[1], self.Vec2(-2, 0.5))
+        self.assertEqual(a[-2], self.Vec2(1, 3.5))
+        self.assertEqual(a.to_vec2_array(),
+            self.Vec2Array([(1, 3.5), (-2, 0.5)]))
+        with self.assertRaises(IndexError):
+            a[2]
+
+    def test_slice(self):
+        a = self.GridVec2Array([(0, 0), (1, 1), (2, 2)], typecode='i')
+        b = a[1:]
+        self.assertEqual(b.grid_points(), [(1, 1), (2, 2)])
+        self.assertEqual(b.typecode, 'i')
+
+    def test_from_grid(self):
+        a = self.GridVec2Array.from_grid([1, 2, 3, 4], 0.25)
+        self.assertEqual(list(a), [self.Vec2(0.25, 0.5), self.Vec2(0.75, 1)])
+        with self.assertRaises(ValueError):
+            self.GridVec2Array.from_grid([1, 2, 3])
+
+    def test_int32(self):
+        a = self.GridVec2Array([(1, 2)], typecode='i')
+        self.assertEqual(a._coords.itemsize, 4)
+        with self.assertRaises(OverflowError):
+            self.GridVec2Array([(2.0**40, 0)], typecode='i')
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.GridVec2Array([], scale=0)
+        with self.assertRaises(ValueError):
+            self.GridVec2Array([], typecode='d')
+
+    def test_eq(self):
+        a = self.GridVec2Array([(1, 2)], 0.5)
+        self.assertEqual(a, self.GridVec2Array([(1.1, 2)], 0.5))
+        self.assertNotEqual(a, self.GridVec2Array([(1, 2)], 0.25))
+        self.assertNotEqual(a, self.GridVec2Array([(1, 3)], 0.5))
+
+    def test_bounding_box(self):
+        a = self.GridVec2Array([(0, 0.2), (3, -1)], 0.5)
+        self.assertEqual(a.bounding_box,
+            self.BoundingBox([(0, -1), (3, 0)]))
+
+    def test_repr(self):
+        self.assertEqual(repr(self.GridVec2Array([(1, 2)], 0.5)),
+            "GridVec2Array([(1.0, 2.0)], scale=0.5)")
+        self.assertEqual(repr(self.GridVec2Array([(1, 2)], typecode='i')),
+            "GridVec2Array([(1.0, 2.0)], scale=1.0, typecode='i')")
+
+
+class GridPolygonBaseTestCase(object):
+
+    def test_merges_snapped_duplicates(self):
+        poly = self.GridPolygon([(0, 0), (0.001, 0), (1, 0), (1, 1),
+            (0.004, 1), (0, 1), (0.002, 0.001)], 0.01)
+        self.assertEqual(poly.grid_points(),
+            [(0, 0), (100, 0), (100, 100), (0, 100)])
+        with self.assertRaises(ValueError):
+            self.GridPolygon([(0, 0), (0.001, 0), (1, 1)], 0.01)
+
+    def test_area(self):
+        poly = self.GridPolygon([(0, 0), (4, 0), (4, 3)], 0.5)
+        self.assertEqual(poly.signed_area2, 8 * 6)
+        self.assertEqual(poly.area, 6)
+        poly = self.GridPolygon([(4, 3), (4, 0), (0, 0)], 0.5)
+        self.assertEqual(poly.signed_area2, -8 * 6)
+
+    def test_is_convex(self):
+        assert self.GridPolygon([(0,0), (2,0), (3,1), (2,2), (0,2)]).is_convex
+        poly = self.GridPolygon([(0,0), (2,0), (1,1), (2,2), (0,2)])
+        assert not poly.is_convex
+        assert poly.is_simple
+
+    def test_is_convex_nearly_collinear(self):
+        # The middle vertex is a tiny bit inward of the edge; exact
+        # integer predicates detect the reflex vertex at any magnitude
+        big = 10**15
+        poly = self.GridPolygon.from_grid(
+            [0, 0, big, 1, 2 * big, 1, 2 * big, big, 0, big])
+        assert not poly.is_convex
+
+    def test_is_simple(self):
+        assert not self.GridPolygon([(0,0), (1,1), (1,0), (0,1)]).is_simple
+        # Touching a vertex to an edge is an intersection
+        poly = self.GridPolygon([(0,0), (4,0), (4,4), (2,0), (0,4)])
+        assert not poly.is_simple
+
+    def test_contains_point(self):
+        poly = self.GridPolygon([(0,0), (4,0), (4,4), (2,1), (0,4)], 0.5)
+        assert poly.contains_point((1, 1))
+        assert not poly.contains_point((2, 3))
+        assert not poly.contains_point((5, 1))
+        points = [(1, 1), (2, 3), (3.5, 3), (-1, 0)]
+        self.assertEqual(poly.contains_points(points),
+            [poly.contains_point(p) for p in points])
+        self.assertEqual(poly.contains_points(points),
+            poly.to_polygon().contains_points(points))
+
+    def test_to_polygon(self):
+        poly = self.GridPolygon([(0,0), (2,0), (3,1), (2,2), (0,2)], 0.5)
+        converted = poly.to_polygon()
+        assert converted.is_convex_known
+        assert converted.is_convex
+        self.assertEqual(list(converted), list(poly))
+        poly = self.GridPolygon([(0,0), (1,1), (1,0), (0,1)])
+        assert not poly.is_simple
+        converted = poly.to_polygon()
+        assert converted.is_simple_known
+        assert not converted.is_simple
+
+    def test_to_polygon_degenerate(self):
+        converted = self.GridPolygon([(0,0), (1,0), (2,0), (1,0.01)],
+            0.1).to_polygon()
+        assert not converted.is_convex_known
+
+
+class PyGridVec2ArrayTestCase(GridVec2ArrayBaseTestCase, unittest.TestCase):
+    from pygonal.vector import Vec2, Vec2Array
+    from pygonal.box import BoundingBox
+    from pygonal.grid import GridVec2Array
+
+
+class PyGridPolygonTestCase(GridPolygonBaseTestCase, unittest.TestCase):
+    from pygonal.grid import GridPolygon
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
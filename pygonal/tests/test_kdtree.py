@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import random
+import unittest
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""KDTree class unit tests"""
+
+
+class KDTreeBaseTestCase(object):
+
+    def rand_points(self, count, seed=5):
+        rand = random.Random(seed)
+        return self.Vec2Array(
+            (rand.uniform(-10, 10), rand.uniform(-5, 5))
+            for i in range(count))
+
+    def brute_knn(self, points, point, k):
+        point = self.Vec2(*point)
+        return sorted((point.distance_to(p), i)
+            for i, p in enumerate(points))[:k]
+
+    def test_empty(self):
+        tree = self.KDTree([])
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.knn((0, 0), 3), [])
+        self.assertEqual(tree.query_radius((0, 0), 10), [])
+        with self.assertRaises(ValueError):
+            tree.nearest((0, 0))
+
+    def test_len(self):
+        self.assertEqual(len(self.KDTree(self.rand_points(50))), 50)
+
+    def test_knn_small(self):
+        tree = self.KDTree([(0, 0), (3, 0), (0, 2), (5, 5)])
+        self.assertEqual(tree.knn((1, 0), 2), [(1, 0), (2, 1)])
+        self.assertEqual(tree.nearest((4, 4)), (2 ** 0.5, 3))
+
+    def test_knn_more_than_count(self):
+        tree = self.KDTree([(0, 0), (1, 0)])
+        self.assertEqual(tree.knn((3, 0), 5), [(2, 1), (3, 0)])
+
+    def test_knn_invalid_k(self):
+        tree = self.KDTree([(0, 0), (1, 0)])
+        for k in (0, -1):
+            with self.assertRaises(ValueError):
+                tree.knn((3, 0), k)
+            with self.assertRaises(ValueError):
+                tree.knn_many([], k)
+
+    def test_knn_matches_brute_force(self):
+        points = self.rand_points(500)
+        rand = random.Random(7)
+        for leaf_size in (1, 4, 16, 1000):
+            tree = self.KDTree(points, leaf_size)
+            for i in range(30):
+                q = (rand.uniform(-12, 12), rand.uniform(-7, 7))
+                for k in (1, 5):
+                    found = tree.knn(q, k)
+                    expected = self.brute_knn(points, q, k)
+                    self.assertEqual([i for d, i in found],
+                        [i for d, i in expected])
+                    for (d1, i1), (d2, i2) in zip(found, expected):
+                        self.assertAlmostEqual(d1, d2)
+
+    def test_knn_duplicate_points(self):
+        tree = self.KDTree([(1, 1)] * 40 + [(2, 2)], leaf_size=2)
+        found = tree.knn((2, 2), 3)
+        self.assertEqual(found[0], (0, 40))
+        self.assertEqual(len(found), 3)
+
+    def test_query_radius_matches_brute_force(self):
+        points = self.rand_points(500)
+        rand = random.Random(11)
+        tree = self.KDTree(points, 8)
+        for i in range(30):
+            q = self.Vec2(rand.uniform(-12, 12), rand.uniform(-7, 7))
+            r = rand.uniform(0, 4)
+            expected = [i for i, p in enumerate(points)
+                if q.distance_to(p) <= r]
+            self.assertEqual(tree.query_radius(q, r), expected)
+
+    def test_query_radius_inclusive(self):
+        tree = self.KDTree([(0, 0), (2, 0), (0, 3)], leaf_size=1)
+        self.assertEqual(tree.query_radius((0, 0), 2), [0, 1])
+        self.assertEqual(tree.query_radius((0, 0), 0), [0])
+
+    def test_batch_queries(self):
+        points = self.rand_points(100)
+        tree = self.KDTree(points)
+        queries = [(0, 0), (5, 1), (-3, -2)]
+        self.assertEqual(tree.knn_many(queries, 3),
+            [tree.knn(q, 3) for q in queries])
+        self.assertEqual(tree.query_radius_many(queries, 2),
+            [tree.query_radius(q, 2) for q in queries])
+
+    def test_float32(self):
+        points = self.rand_points(300)
+        tree = self.KDTree(points, 8, typecode='f')
+        self.assertEqual(tree._xs.itemsize, 4)
+        exact = self.KDTree(points, 8)
+        for q in [(0, 0), (3, -2), (-7, 4)]:
+            found = tree.knn(q, 5)
+            self.assertEqual([i for d, i in found],
+                [i for d, i in exact.knn(q, 5)])
+            for (d1, i1), (d2, i2) in zip(found, exact.knn(q, 5)):
+                self.assertAlmostEqual(d1, d2, 5)
+        with self.assertRaises(ValueError):
+            self.KDTree(points, typecode='i')
+
+    def test_from_iterable(self):
+        points = list(self.rand_points(20))
+        tree = self.KDTree(iter(points))
+        self.assertEqual(tree.nearest(points[3])[1], 3)
+
+
+class PyKDTreeTestCase(KDTreeBaseTestCase, unittest.TestCase):
+    from pygonal.vector import Vec2, Vec2Array
+    from pygonal.kdtree import KDTree
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
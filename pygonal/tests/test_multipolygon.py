@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import copy
+import pickle
+import random
+import unittest
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""PolygonWithHoles and MultiPolygon class unit tests"""
+
+
+class MultiPolygonBaseTestCase(object):
+
+    exterior = [(0, 0), (6, 0), (6, 6), (0, 6)]
+    holes = [[(1, 1), (1, 2), (2, 2), (2, 1)], [(3, 3), (3, 5), (5, 5)]]
+
+    def polygon(self):
+        return self.PolygonWithHoles(self.exterior, self.holes)
+
+    def rand_points(self, count, seed=5):
+        rand = random.Random(seed)
+        return [(rand.uniform(-1, 13), rand.uniform(-1, 7))
+            for i in range(count)]
+
+    def test_rings(self):
+        poly = self.polygon()
+        self.assertEqual(len(poly.rings), 3)
+        self.assertEqual(poly.exterior, self.Polygon(self.exterior))
+        self.assertEqual(poly.interiors,
+            [self.Polygon(hole) for hole in self.holes])
+        self.assertEqual(self.PolygonWithHoles(self.exterior).interiors, [])
+
+    def test_no_exterior(self):
+        from array import array
+        with self.assertRaises(ValueError):
+            self.PolygonWithHoles.from_buffers(array('d'), array('l', [0]))
+
+    def test_from_buffers(self):
+        from array import array
+        coords = array('d', [0, 0, 6, 0, 6, 6, 0, 6, 1, 1, 1, 2, 2, 2, 2, 1])
+        poly = self.PolygonWithHoles.from_buffers(coords,
+            array('l', [0, 4, 8]))
+        self.assertEqual(poly,
+            self.PolygonWithHoles(self.exterior, self.holes[:1]))
+
+    def test_area_and_bounding_box(self):
+        poly = self.polygon()
+        self.assertAlmostEqual(poly.area, 36 - 1 - 2)
+        self.assertEqual(poly.bounding_box,
+            self.BoundingBox([(0, 0), (6, 6)]))
+
+    def test_contains_point(self):
+        poly = self.polygon()
+        self.assertTrue(poly.contains_point((0.5, 0.5)))
+        self.assertTrue(poly.contains_point((4.5, 3.5)))
+        self.assertFalse(poly.contains_point((1.5, 1.5)))
+        self.assertFalse(poly.contains_point((3.5, 4)))
+        self.assertFalse(poly.contains_point((7, 3)))
+        self.assertFalse(poly.contains_point((-1, -1)))
+
+    def test_contains_points(self):
+        poly = self.polygon()
+        points = self.rand_points(200)
+        exterior = self.Polygon(self.exterior)
+        holes = [self.Polygon(hole) for hole in self.holes]
+        expected = [exterior.contains_point(p)
+            and not any(h.contains_point(p) for h in holes) for p in points]
+        self.assertEqual(poly.contains_points(points), expected)
+        self.assertEqual(poly.contains_points(self.Vec2Array(points)),
+            expected)
+
+    def test_polygon_eq(self):
+        self.assertEqual(self.polygon(), self.polygon())
+        self.assertNotEqual(self.polygon(),
+            self.PolygonWithHoles(self.exterior))
+        self.assertNotEqual(self.polygon(), self.Polygon(self.exterior))
+        with self.assertRaises(TypeError):
+            hash(self.polygon())
+
+    def test_polygon_repr(self):
+        verts = [(0, 0), (1, 0), (0, 1)]
+        self.assertEqual(repr(self.PolygonWithHoles(verts)),
+            'PolygonWithHoles(%r, [])' % self.Polygon(verts))
+
+    def multipolygon(self):
+        return self.MultiPolygon([self.polygon(),
+            self.Polygon([(7, 0), (12, 0), (12, 6), (7, 6)])])
+
+    def test_multi_init(self):
+        multi = self.multipolygon()
+        self.assertEqual(len(multi), 2)
+        self.assertEqual(len(multi.rings), 4)
+        self.assertEqual(multi[0], self.polygon())
+        self.assertEqual(multi[1], self.PolygonWithHoles(
+            [(7, 0), (12, 0), (12, 6), (7, 6)]))
+        self.assertEqual(list(multi), [multi[0], multi[1]])
+        self.assertEqual(len(self.MultiPolygon()), 0)
+
+    def test_multi_shares_buffer(self):
+        multi = self.multipolygon()
+        part = multi[1]
+        self.assertIsInstance(part.rings._coords, memoryview)
+        self.assertEqual(part.bounding_box,
+            self.BoundingBox([(7, 0), (12, 6)]))
+        self.assertTrue(part.exterior.is_convex)
+
+    def test_multi_slice(self):
+        multi = self.multipolygon()
+        self.assertEqual(multi[1:], self.MultiPolygon([multi[1]]))
+        self.assertEqual(multi[:1][0], self.polygon())
+
+    def test_multi_from_buffers(self):
+        from array import array
+        coords = array('d', [0, 0, 6, 0, 6, 6, 0, 6, 1, 1, 1, 2, 2, 2, 2, 1,
+            7, 0, 8, 0, 8, 1])
+        multi = self.MultiPolygon.from_buffers(coords,
+            array('l', [0, 4, 8, 11]), array('l', [0, 2, 3]))
+        self.assertEqual(list(multi), [
+            self.PolygonWithHoles(self.exterior, self.holes[:1]),
+            self.PolygonWithHoles([(7, 0), (8, 0), (8, 1)])])
+        for parts in ([0, 2], [0, 3, 3], [1, 3], []):
+            with self.assertRaises(ValueError):
+                self.MultiPolygon.from_buffers(coords,
+                    array('l', [0, 4, 8, 11]), array('l', parts))
+
+    def test_multi_area_and_bounding_box(self):
+        multi = self.multipolygon()
+        self.assertAlmostEqual(multi.area, 33 + 30)
+        self.assertEqual(multi.bounding_box,
+            self.BoundingBox([(0, 0), (12, 6)]))
+
+    def test_multi_contains_points(self):
+        multi = self.multipolygon()
+        points = self.rand_points(200)
+        poly = self.polygon()
+        other = self.Polygon([(7, 0), (12, 0), (12, 6), (7, 6)])
+        expected = [poly.contains_point(p) or other.contains_point(p)
+            for p in points]
+        self.assertEqual(multi.contains_points(points), expected)
+        self.assertTrue(multi.contains_point((10, 3)))
+        self.assertFalse(multi.contains_point((1.5, 1.5)))
+        self.assertFalse(multi.contains_point((6.5, 3)))
+
+    def test_pickle_after_query(self):
+        multi = self.multipolygon()
+        assert multi.contains_point((10, 3))
+        part = multi[0]
+        assert not part.contains_point((1.5, 1.5))
+        for obj in (multi, part, self.polygon()):
+            restored = pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+            self.assertEqual(restored, obj)
+            self.assertEqual(copy.deepcopy(obj), obj)
+        restored = pickle.loads(pickle.dumps(part))
+        self.assertIsInstance(restored.rings._coords, type(
+            self.polygon().rings._coords))
+        restored = pickle.loads(pickle.dumps(multi))
+        assert restored.contains_point((10, 3))
+        assert not restored.contains_point((1.5, 1.5))
+
+    def test_multi_eq(self):
+        self.assertEqual(self.multipolygon(), self.multipolygon())
+        self.assertNotEqual(self.multipolygon(), self.multipolygon()[:1])
+        with self.assertRaises(TypeError):
+            hash(self.multipolygon())
+
+
+class PyMultiPolygonTestCase(MultiPolygonBaseTestCase, unittest.TestCase):
+    from pygonal.vector import Vec2Array
+    from pygonal.box import BoundingBox
+    from pygonal.polygon import Polygon
+    from pygonal.multipolygon import PolygonWithHoles, MultiPolygon
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
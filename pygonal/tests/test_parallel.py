@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import random
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pygonal import Vec2Array, BoundingBox, Circle, Polygon
+from pygonal import parallel
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""Parallel batch query unit tests"""
+
+
+def rand_points(count, seed=3):
+    rand = random.Random(seed)
+    return Vec2Array((rand.uniform(-3, 3), rand.uniform(-3, 3))
+        for i in range(count))
+
+
+class ContainsPointsTestCase(unittest.TestCase):
+
+    shapes = [
+        Polygon([(-1,-1), (2,-1), (0,2)]),
+        Polygon.regular(9, 2),
+        Polygon([(-2,-2), (2,-2), (2,2), (0,0.5), (-2,2)]),
+        BoundingBox([(-1,-1), (1,2)]),
+        Circle((0.5, 0), 1.5),
+    ]
+
+    def test_matches_serial(self):
+        points = rand_points(1000)
+        for shape in self.shapes:
+            expected = shape.contains_points(points)
+            self.assertEqual(parallel.contains_points(shape, points,
+                workers=3, chunk_size=37), expected)
+            self.assertEqual(parallel.contains_points(shape, list(points),
+                workers=2), expected)
+
+    def test_executor(self):
+        points = rand_points(500)
+        poly = Polygon.star(5, 1, 2.5)
+        with ThreadPoolExecutor(4) as executor:
+            self.assertEqual(parallel.contains_points(poly, points,
+                executor=executor, chunk_size=50),
+                poly.contains_points(points))
+
+    def test_iterable_and_empty(self):
+        poly = Polygon.regular(5, 1)
+        self.assertEqual(parallel.contains_points(poly, iter([(0, 0)])),
+            [True])
+        self.assertEqual(parallel.contains_points(poly, []), [])
+
+    def test_invalid_arguments(self):
+        poly = Polygon.regular(5, 1)
+        with self.assertRaises(ValueError):
+            parallel.contains_points(poly, [(0, 0)], workers=0)
+        with self.assertRaises(ValueError):
+            parallel.contains_points(poly, [(0, 0)], chunk_size=0)
+
+    def test_prewarm(self):
+        poly = Polygon([(0,0), (2,0), (3,1), (2,2), (0,2)])
+        parallel.prewarm(poly)
+        assert poly.is_convex_known
+        assert poly._y_polylines is not None
+        assert poly._bbox is not None
+        triangle = Polygon([(0,0), (1,0), (0,1)])
+        parallel.prewarm(triangle, (0.1, 0.1))
+        assert '_pnp_triangle_test' in triangle.__dict__
+
+    def test_shared_polygons_not_prewarmed(self):
+        # Threads racing to compute the lazy caches of the same polygons
+        # must all observe complete results
+        points = list(rand_points(200))
+        verts = [Polygon.regular(12, 2, angle=i)._vectors for i in range(20)]
+        expected = [Polygon(v).contains_points(points) for v in verts]
+        polys = [Polygon(v) for v in verts]
+        barrier = threading.Barrier(4)
+        errors = []
+        def query():
+            barrier.wait()
+            for poly, mask in zip(polys, expected):
+                if poly.contains_points(points) != mask:
+                    errors.append(poly)
+        threads = [threading.Thread(target=query) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
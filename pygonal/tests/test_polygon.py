@@ -193,6 +193,74 @@ class PolygonBaseTestCase(object):
         assert poly.is_convex_known
         assert poly.is_simple_known
 
+    def test_from_ragged(self):
+        from array import array
+        verts = [
+            [(0,0), (1,0), (0,1)],
+            [(0,0), (2,0), (2,2), (0,2)],
+            [(0,0), (4,0), (4,4), (2,1), (0,4)],
+            [(0,0), (1,1), (1,0), (0,1)],
+            ]
+        coords = array('d')
+        offsets = [0]
+        for v in verts:
+            for x, y in v:
+                coords.extend((x, y))
+            offsets.append(len(coords) // 2)
+        polys = self.Polygon.from_ragged(coords, offsets)
+        self.assertEqual(polys, [self.Polygon(v) for v in verts])
+        for poly in polys:
+            assert isinstance(poly, self.Polygon)
+            assert isinstance(poly[0], self.Vec2)
+        self.assertEqual([p.is_convex_known for p in polys],
+            [True, False, False, False])
+        self.assertEqual([p.is_convex for p in polys],
+            [True, True, False, False])
+        self.assertEqual([p.is_simple for p in polys],
+            [True, True, True, False])
+        self.assertEqual(self.Polygon.from_ragged(list(coords), offsets),
+            polys)
+        self.assertEqual(self.Polygon.from_ragged([], [0]), [])
+
+    def test_from_ragged_declared(self):
+        coords = [0,0, 2,0, 2,2, 0,2, 0,0, 4,0, 4,4, 2,1, 0,4, 0,0, 1,0, 0,1]
+        polys = self.Polygon.from_ragged(coords, [0, 4, 9, 12],
+            is_convex=[True, False, False], is_simple=[None, True, None])
+        self.assertEqual([p.is_convex_known for p in polys],
+            [True, True, True])
+        self.assertEqual([p.is_simple_known for p in polys],
+            [True, True, True])
+        self.assertEqual([p.is_convex for p in polys], [True, False, True])
+        self.assertEqual(polys[0]._y_polylines,
+            self.Polygon(polys[0], is_convex=True)._y_polylines)
+        assert polys[0].contains_point((1, 1))
+        assert polys[1].is_simple
+        polys = self.Polygon.from_ragged(coords, [0, 4, 9, 12],
+            is_simple=[None, False, None])
+        assert not polys[0].is_convex_known
+        assert polys[1].is_simple_known
+        assert not polys[1].is_simple
+
+    def test_from_ragged_int_coords(self):
+        verts = [(0,0), (2,0), (2,2), (0,2)]
+        poly, = self.Polygon.from_ragged([0,0, 2,0, 2,2, 0,2], [0, 4])
+        self.assertEqual(poly, self.Polygon(verts))
+        self.assertEqual(repr(poly), repr(self.Polygon(verts)))
+        for vert in poly:
+            self.assertEqual([type(c) for c in vert], [float, float])
+
+    def test_from_ragged_invalid(self):
+        coords = [0,0, 2,0, 2,2, 0,2]
+        for offsets in ([], [1, 4], [0, 3], [0, 4, 5]):
+            with self.assertRaises(ValueError):
+                self.Polygon.from_ragged(coords, offsets)
+        with self.assertRaises(ValueError):
+            self.Polygon.from_ragged(coords, [0, 2, 4])
+        with self.assertRaises(ValueError):
+            self.Polygon.from_ragged(coords, [0, 4], is_convex=[True, True])
+        with self.assertRaises(ValueError):
+            self.Polygon.from_ragged(coords, [0, 4], is_simple=[])
+
     def test_regular(self):
         import pygonal
         poly = self.Polygon.regular(5, 1.5)
@@ -404,6 +472,47 @@ class PolygonBaseTestCase(object):
         assert poly1 == poly3
         assert not poly2 == poly3
 
+    def test_eq_signed_zero(self):
+        poly1 = self.Polygon([(-0.0,0), (1,0), (0,1)])
+        poly2 = self.Polygon([(1,0), (0,1), (0,-0.0)])
+        assert poly1 == poly2
+        self.assertEqual(poly1.fingerprint, poly2.fingerprint)
+
+    def test_eq_after_mutation(self):
+        poly1 = self.Polygon([(0,0), (1,0), (1,1), (0,1)])
+        poly2 = self.Polygon([(1,0), (1,1), (0,1), (0,0)])
+        assert poly1 == poly2
+        poly2[0] = (2, 0)
+        assert poly1 != poly2
+        poly2[0] = (1, 0)
+        assert poly1 == poly2
+
+    def test_fingerprint(self):
+        verts = [(-3,3), (-1,-2), (1,-2), (3,3), (1,-1), (-1,-1)]
+        poly = self.Polygon(verts)
+        fingerprint = poly.fingerprint
+        self.assertEqual(len(fingerprint), 32)
+        self.assertEqual(poly.fingerprint, fingerprint)
+        for i in range(len(verts)):
+            rotated = verts[i:] + verts[:i]
+            self.assertEqual(self.Polygon(rotated).fingerprint, fingerprint)
+            self.assertEqual(
+                self.Polygon(reversed(rotated)).fingerprint, fingerprint)
+        verts[0] = (-3, 3.5)
+        self.assertNotEqual(self.Polygon(verts).fingerprint, fingerprint)
+        poly[0] = (-3, 3.5)
+        self.assertEqual(poly.fingerprint, self.Polygon(verts).fingerprint)
+
+    def test_fingerprint_dedup(self):
+        polys = [self.Polygon.regular(n, 1) for n in (3, 4, 5)]
+        polys += [self.Polygon(reversed(list(p))) for p in polys]
+        unique = {}
+        for poly in polys:
+            unique.setdefault(poly.fingerprint, poly)
+        self.assertEqual(len(unique), 3)
+        with self.assertRaises(TypeError):
+            hash(polys[0])
+
     def test_contains_point_triangle(self):
         poly = self.Polygon([(0,1), (1, -1), (-0.5,-0.5)])
         assert poly.contains_point((0, 0))
@@ -598,6 +707,29 @@ class PolygonBaseTestCase(object):
         assert not poly.contains_point((-2.1,1))
         assert not poly.contains_point((2.1,4))
 
+    def test_contains_points(self):
+        points = [(0,0), (0.5,0.5), (1.5,0.5), (3,3), (-1,0)]
+        for poly in (self.Polygon([(-1,-1), (2,-1), (0,2)]),
+            self.Polygon.regular(7, 2),
+            self.Polygon([(-2,-2), (2,-2), (2,2), (0,0.5), (-2,2)])):
+            self.assertEqual(poly.contains_points(points),
+                [poly.contains_point(p) for p in points])
+        self.assertEqual(poly.contains_points(self.Seq2(points)),
+            [True, True, True, False, True])
+        self.assertEqual(poly.contains_points([]), [])
+
+    def test_contains_points_batch(self):
+        points = [(x / 4.0, y / 4.0) for x in range(-12, 13)
+            for y in range(-12, 13)]
+        for verts in ([(-1,-1), (2,-1), (2,2), (-1,2)],
+            [(-2,-2), (2,-2), (2,2), (0,0.5), (-2,2)]):
+            poly = self.Polygon(verts)
+            assert not poly.is_convex_known
+            mask = poly.contains_points(iter(points))
+            assert poly.is_convex_known
+            self.assertEqual(mask,
+                [self.Polygon(verts).contains_point(p) for p in points])
+
     def test_contains_point_exclusive_triangles(self):
         tris = [
             self.Polygon([(0,0), (0,3), (3,3)]),
@@ -818,6 +950,172 @@ class PolygonBaseTestCase(object):
             assert pt[1] == 1, pt
             assert 0 <= pt[0] <= 12, pt
 
+    def test_bounding_circle(self):
+        poly = self.Polygon([(0,0), (4,0), (4,3), (0,3)])
+        circle = poly.bounding_circle
+        assert circle.center.almost_equals((2, 1.5))
+        self.assertAlmostEqual(circle.radius, 2.5)
+        assert poly.bounding_circle is circle
+        poly[0] = (-4, 0)
+        assert poly.bounding_circle is not circle
+
+    def test_bounding_circle_regular_and_star(self):
+        import pygonal
+        poly = self.Polygon.regular(7, 3, center=(1, 2))
+        self.assertEqual(poly.bounding_circle, pygonal.Circle((1, 2), 3))
+        poly = self.Polygon.star(5, 1, 4, center=(-1, 0))
+        self.assertEqual(poly.bounding_circle, pygonal.Circle((-1, 0), 4))
+
+    def test_simplified_drops_collinear_verts(self):
+        poly = self.Polygon([(0,0), (1,0), (2,0), (2,1), (2,2), (0,2)])
+        simple = poly.simplified(0.01)
+        self.assertEqual(simple, self.Polygon([(0,0), (2,0), (2,2), (0,2)]))
+        simple = poly.simplified(0.01, method='visvalingam-whyatt')
+        self.assertEqual(simple, self.Polygon([(0,0), (2,0), (2,2), (0,2)]))
+
+    def test_simplified_keeps_min_verts(self):
+        poly = self.Polygon.regular(50, 1)
+        for method in ('douglas-peucker', 'visvalingam-whyatt'):
+            simple = poly.simplified(100, method=method)
+            self.assertEqual(len(simple), 3)
+            for vert in simple:
+                assert vert in poly, vert
+
+    def test_simplified_convex_is_known_convex(self):
+        poly = self.Polygon.regular(100, 10)
+        assert poly.is_convex_known
+        simple = poly.simplified(0.1)
+        assert 3 < len(simple) < len(poly)
+        assert simple.is_convex_known
+        assert simple.is_convex
+        simple._y_polylines = None
+        simple._classify()
+        assert simple.is_convex
+
+    def test_simplified_tolerance(self):
+        poly = self.Polygon.star(40, 5, 5.2)
+        self.assertEqual(len(poly.simplified(0.05)), len(poly))
+        assert len(poly.simplified(0.5)) < len(poly) // 2
+
+    def test_simplified_preserve_simple(self):
+        poly = self.Polygon([(0,0), (5,1), (10,0), (10,-5), (5.5,-5),
+            (5.5,0.5), (4.5,0.5), (4.5,-5), (0,-5)])
+        assert poly.is_simple
+        assert not poly.simplified(1.2).is_simple
+        simple = poly.simplified(1.2, preserve_simple=True)
+        assert simple.is_simple
+
+    def test_simplified_bad_method(self):
+        poly = self.Polygon.regular(5, 1)
+        with self.assertRaises(ValueError):
+            poly.simplified(1, method='nope')
+
+    def test_contains_point_convex_horizontal_edges(self):
+        poly = self.Polygon([(0,0), (4,0), (4,4), (0,4)])
+        assert poly.is_convex
+        assert poly.contains_point((1.5, 1.5))
+        assert not poly.contains_point((4.5, 1.5))
+        poly = self.Polygon([(0,0), (0,4), (4,4), (4,0)])
+        assert poly.is_convex
+        assert poly.contains_point((1.5, 1.5))
+        assert not poly.contains_point((-0.5, 1.5))
+
+    def assert_same_area(self, poly, area):
+        x0, y0 = poly[-1]
+        poly_area = 0.0
+        for x1, y1 in poly:
+            poly_area += (x0 * y1 - x1 * y0) * 0.5
+            x0, y0 = x1, y1
+        self.assertAlmostEqual(abs(poly_area), area)
+
+    def test_convex_intersection(self):
+        a = self.Polygon([(0,0), (4,0), (4,4), (0,4)])
+        b = self.Polygon([(2,-1), (6,-1), (6,3), (2,3)])
+        for p, q in ((a, b), (b, a)):
+            isect = p.convex_intersection(q)
+            assert isect.is_convex_known
+            assert isect.is_convex
+            self.assertEqual(isect,
+                self.Polygon([(2,0), (4,0), (4,3), (2,3)]))
+
+    def test_convex_intersection_opposite_winding(self):
+        a = self.Polygon.regular(30, 2)
+        b = self.Polygon(list(self.Polygon.regular(5, 2, center=(2,0)))[::-1])
+        isect = a.convex_intersection(b)
+        assert isect.is_convex
+        for vert in isect:
+            assert (vert.length <= 2 + 1e-9
+                and vert.distance_to((2,0)) <= 2 + 1e-9), vert
+        other = b.convex_intersection(a)
+        self.assertEqual(len(isect), len(other))
+        for vert in other:
+            assert any(vert.almost_equals(v) for v in isect), vert
+
+    def test_convex_intersection_star_of_david(self):
+        a = self.Polygon.regular(3, 1, angle=90)
+        b = self.Polygon.regular(3, 1, angle=-90)
+        isect = a.convex_intersection(b)
+        self.assertEqual(len(isect), 6)
+        self.assert_same_area(isect, 3 * 3 ** 0.5 / 8 * 4 / 3)
+
+    def test_convex_intersection_contained(self):
+        a = self.Polygon([(0,0), (4,0), (4,4), (0,4)])
+        b = self.Polygon([(1,1), (2,1), (2,2), (1,2)])
+        self.assertEqual(a.convex_intersection(b), b)
+        self.assertEqual(b.convex_intersection(a), b)
+        self.assertEqual(a.convex_intersection(a), a)
+
+    def test_convex_intersection_disjoint(self):
+        a = self.Polygon([(0,0), (4,0), (4,4), (0,4)])
+        assert a.convex_intersection(
+            self.Polygon([(5,5), (6,5), (6,6)])) is None
+        # Touching along an edge
+        assert a.convex_intersection(
+            self.Polygon([(4,0), (8,0), (8,4), (4,4)])) is None
+
+    def test_convex_intersection_degenerate(self):
+        a = self.Polygon([(0,0), (10,0), (10,10), (0,10)])
+        for verts in ([(8,9), (8,9), (8,0)], [(1,1), (2,2), (3,3)],
+                [(0,0), (4,0), (2,0)], [(20,20), (21,21), (22,22)]):
+            flat = self.Polygon(verts)
+            assert flat.convex_intersection(a) is None, verts
+            assert a.convex_intersection(flat) is None, verts
+            assert flat.convex_intersection(flat) is None, verts
+
+    def test_convex_intersection_requires_convex(self):
+        a = self.Polygon([(0,0), (4,0), (4,4), (0,4)])
+        star = self.Polygon.star(5, 1, 2)
+        with self.assertRaises(ValueError):
+            a.convex_intersection(star)
+        with self.assertRaises(ValueError):
+            star.convex_intersection(a)
+        with self.assertRaises(TypeError):
+            a.convex_intersection([(0,0), (1,0), (1,1)])
+
+    def test_minkowski_sum(self):
+        a = self.Polygon([(0,0), (2,0), (2,2), (0,2)])
+        b = self.Polygon([(0,0), (1,0), (0,1)])
+        mink = a.minkowski_sum(b)
+        assert mink.is_convex_known
+        assert mink.is_convex
+        self.assertEqual(mink, self.Polygon(
+            [(0,0), (3,0), (3,2), (2,3), (0,3)]))
+        self.assertEqual(b.minkowski_sum(a), mink)
+
+    def test_minkowski_sum_opposite_winding(self):
+        a = self.Polygon.regular(7, 1)
+        b = self.Polygon(list(self.Polygon.regular(5, 2, center=(3,1)))[::-1])
+        mink = a.minkowski_sum(b)
+        hull = self.Polygon.convex_hull([p + q for p in a for q in b])
+        assert mink.is_convex
+        for vert in hull:
+            assert any(vert.almost_equals(v) for v in mink), vert
+
+    def test_minkowski_sum_requires_convex(self):
+        a = self.Polygon([(0,0), (4,0), (4,4), (0,4)])
+        with self.assertRaises(ValueError):
+            a.minkowski_sum(self.Polygon.star(5, 1, 2))
+
     def test_str_and_repr(self):
         poly = self.Polygon([(0.25,3.5), (1.3,4.25), (0.16,2.25), (-0.5,0.16)])
         self.assertEqual(repr(poly),
@@ -897,6 +1195,61 @@ class PolygonBaseTestCase(object):
         assert c[0] != p[0]
         assert c.bounding_box is not bbox
 
+    def test_pickle(self):
+        import pickle
+        p = self.Polygon([(0,0), (1,0), (1,1), (0,1)])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            c = pickle.loads(pickle.dumps(p, protocol))
+            assert isinstance(c, self.Polygon)
+            self.assertEqual(tuple(c), tuple(p))
+            assert not c.is_convex_known
+            assert not c.is_centroid_known
+            assert c.contains_point((0.5, 0.5))
+
+    def test_pickle_caches(self):
+        import pickle
+        p = self.Polygon.regular(8, 2, center=(1, 1))
+        p.bounding_box
+        c = pickle.loads(pickle.dumps(p, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(c, p)
+        assert c.is_convex_known and c.is_convex
+        assert c.is_simple_known and c.is_simple
+        assert c.is_centroid_known
+        self.assertEqual(c.centroid, p.centroid)
+        self.assertEqual(c._y_polylines, p._y_polylines)
+        self.assertEqual(c._max_r2, p._max_r2)
+        self.assertEqual(c._min_r2, p._min_r2)
+        self.assertEqual(c.bounding_box, p.bounding_box)
+        self.assertEqual(c.bounding_circle, p.bounding_circle)
+
+        p = self.Polygon([(0,0), (1,1), (1,0), (0,1)])
+        assert not p.is_simple
+        assert p.centroid is None
+        c = pickle.loads(pickle.dumps(p))
+        assert c.is_simple_known and not c.is_simple
+        assert c.is_centroid_known and c.centroid is None
+
+    def test_pickle_triangle(self):
+        import pickle
+        p = self.Polygon([(0,0), (2,0), (0,2)])
+        assert p.contains_point((0.5, 0.5))
+        c = pickle.loads(pickle.dumps(p))
+        self.assertEqual(tuple(c), tuple(p))
+        assert c.contains_point((0.5, 0.5))
+        assert not c.contains_point((1.5, 1.5))
+
+    def test_pickle_out_of_band(self):
+        import pickle
+        if pickle.HIGHEST_PROTOCOL < 5:
+            return
+        p = self.Polygon.regular(100, 5)
+        buffers = []
+        data = pickle.dumps(p, 5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        c = pickle.loads(data, buffers=buffers)
+        self.assertEqual(tuple(c), tuple(p))
+        assert c.is_convex_known
+
     def test_imul_by_transform(self):
         b = a = self.Polygon([(1,2), (3,4), (5,6)])
         a *= self.Affine.translation((5, -4))
@@ -938,20 +1291,46 @@ class PyPolygonWhiteBoxTestCase(unittest.TestCase):
             (0.5,1.5), (0.5,-1), (-0.8, -0.5)])
         assert poly._y_polylines is None
         assert poly.is_convex
-        self.assertEqual(poly._y_polylines, (
+        self.assertEqual(self.y_polylines(poly), (
             [(-1,0.5), (-0.5,-0.8), (0,-1), (1,-1), (2,-0.5)],
             [(-1,0.5), (1.5,0.5), (2,0), (2,-0.5)]))
 
+    def y_polylines(self, poly):
+        left_y, left_x, right_y, right_x = poly._y_polylines
+        for coords in poly._y_polylines:
+            self.assertEqual(set(map(type, coords)), set([float]))
+        return list(zip(left_y, left_x)), list(zip(right_y, right_x))
+
     def test_split_y_polylines_straight_edge(self):
         poly = self.Polygon([(0,0), (0,3), (1,2), (1,1)], is_convex=True)
-        self.assertEqual(poly._y_polylines, (
+        self.assertEqual(self.y_polylines(poly), (
             [(0,0), (3,0)],
             [(0,0), (1,1), (2,1), (3,0)]))
         poly = self.Polygon([(2,0), (2,3), (1,2), (1,1)], is_convex=True)
-        self.assertEqual(poly._y_polylines, (
+        self.assertEqual(self.y_polylines(poly), (
             [(0,2), (1,1), (2,1), (3,2)],
             [(0,2), (3,2)]))
 
+    def test_y_monotone_points(self):
+        import random
+        rand = random.Random(11)
+        polys = [self.Polygon.regular(n, 3, angle=rand.uniform(0, 90))
+            for n in (4, 5, 12, 50)]
+        polys.append(self.Polygon([(0,0), (0,3), (1,2), (1,1)],
+            is_convex=True))
+        polys.append(self.Polygon([(0,0), (2,0), (2,2), (0,2)],
+            is_convex=True))
+        points = [(rand.uniform(-4, 4), rand.uniform(-4, 4))
+            for i in range(300)]
+        # Points on vertices and horizontal edges
+        points.extend([(0, 0), (1, 0), (0, 2), (1, 2), (2, 1), (0, 3),
+            (0, -3), (3, 0), (0.5, 1), (float('nan'), 1), (1, float('nan'))])
+        for poly in polys:
+            assert poly.is_convex
+            self.assertEqual(poly._pnp_y_monotone_points(points),
+                [poly._pnp_y_monotone_test(p) for p in points])
+            self.assertEqual(poly._pnp_y_monotone_points([]), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import math
+import pickle
+import random
+import unittest
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""Polyline class unit tests"""
+
+
+class PolylineBaseTestCase(object):
+
+    verts = [(0, 0), (3, 0), (3, 4), (3, 4), (6, 4)]
+
+    def polyline(self):
+        return self.Polyline(self.verts)
+
+    def test_init(self):
+        line = self.polyline()
+        self.assertEqual(len(line), 5)
+        self.assertEqual(list(line), [self.Vec2(*v) for v in self.verts])
+        self.assertEqual(self.Polyline(self.Vec2Array(self.verts)), line)
+        with self.assertRaises(ValueError):
+            self.Polyline([(0, 0)])
+
+    def test_length(self):
+        line = self.polyline()
+        self.assertEqual(line.length, 10)
+        self.assertEqual(list(line.lengths), [0, 3, 7, 7, 10])
+        self.assertEqual(self.Polyline([(1, 1), (1, 1)]).length, 0)
+
+    def test_point_at(self):
+        line = self.polyline()
+        self.assertEqual(line.point_at(0), self.Vec2(0, 0))
+        self.assertEqual(line.point_at(1.5), self.Vec2(1.5, 0))
+        self.assertEqual(line.point_at(3), self.Vec2(3, 0))
+        self.assertEqual(line.point_at(4), self.Vec2(3, 1))
+        self.assertEqual(line.point_at(7), self.Vec2(3, 4))
+        self.assertEqual(line.point_at(8), self.Vec2(4, 4))
+        self.assertEqual(line.point_at(10), self.Vec2(6, 4))
+        self.assertEqual(line.point_at(-1), self.Vec2(0, 0))
+        self.assertEqual(line.point_at(11), self.Vec2(6, 4))
+
+    def test_points_at(self):
+        line = self.polyline()
+        distances = [0, 1, 3, 5, 7, 9.5, 12, 2, -1, 6]
+        points = line.points_at(distances)
+        self.assertIsInstance(points, self.Vec2Array)
+        self.assertEqual(list(points), [line.point_at(d) for d in distances])
+        self.assertEqual(len(line.points_at([])), 0)
+
+    def test_point_at_random(self):
+        rand = random.Random(4)
+        verts = [(rand.uniform(-10, 10), rand.uniform(-10, 10))
+            for i in range(100)]
+        line = self.Polyline(verts)
+        for i in range(50):
+            distance = rand.uniform(0, line.length)
+            total = 0.0
+            for a, b in zip(line, line[1:]):
+                seg = a.distance_to(b)
+                if total + seg >= distance:
+                    expected = a.lerp(b, (distance - total) / seg)
+                    break
+                total += seg
+            assert line.point_at(distance).almost_equals(expected)
+
+    def test_locate(self):
+        line = self.polyline()
+        self.assertEqual(line.locate((1, 1)), 1)
+        self.assertEqual(line.locate((4, 2)), 5)
+        self.assertEqual(line.locate((-2, -2)), 0)
+        self.assertEqual(line.locate((7, 7)), 10)
+        self.assertEqual(line.locate((4.5, 5)), 8.5)
+        self.assertEqual(list(line.locate_points([(1, 1), (4, 2)])), [1, 5])
+        self.assertEqual(
+            list(line.locate_points(self.Vec2Array([(7, 7)]))), [10])
+
+    def test_locate_point_at(self):
+        rand = random.Random(7)
+        line = self.Polyline([(math.cos(a / 10.0) * 5, math.sin(a / 10.0) * 5)
+            for a in range(30)])
+        for i in range(20):
+            distance = rand.uniform(0, line.length)
+            self.assertAlmostEqual(
+                line.locate(line.point_at(distance)), distance)
+
+    def test_substring(self):
+        line = self.polyline()
+        self.assertEqual(line.substring(1, 8), self.Polyline(
+            [(1, 0), (3, 0), (3, 4), (3, 4), (4, 4)]))
+        self.assertEqual(line.substring(3, 7),
+            self.Polyline([(3, 0), (3, 4)]))
+        self.assertEqual(line.substring(8, 1), self.Polyline(
+            [(4, 4), (3, 4), (3, 4), (3, 0), (1, 0)]))
+        self.assertEqual(line.substring(-5, 20), line)
+        self.assertEqual(line.substring(2, 2).length, 0)
+        self.assertAlmostEqual(line.substring(0.5, 9.25).length, 8.75)
+
+    def test_bounding_box(self):
+        self.assertEqual(self.polyline().bounding_box,
+            self.BoundingBox([(0, 0), (6, 4)]))
+
+    def test_mutation_clears_lengths(self):
+        line = self.polyline()
+        self.assertEqual(line.length, 10)
+        line[-1] = (9, 4)
+        self.assertEqual(line.length, 13)
+        self.assertEqual(line.bounding_box,
+            self.BoundingBox([(0, 0), (9, 4)]))
+        line *= self.Affine.scale(2)
+        self.assertEqual(line.length, 26)
+
+    def test_pickle(self):
+        line = self.polyline()
+        line.length
+        copy = pickle.loads(pickle.dumps(line))
+        self.assertEqual(copy, line)
+        self.assertEqual(copy.length, 10)
+
+    def test_repr(self):
+        self.assertEqual(repr(self.Polyline([(0, 0), (1, 2)])),
+            'Polyline([(0.0, 0.0), (1.0, 2.0)])')
+
+
+class PyPolylineTestCase(PolylineBaseTestCase, unittest.TestCase):
+    from pygonal.vector import Vec2, Vec2Array
+    from pygonal.transform import Affine
+    from pygonal.box import BoundingBox
+    from pygonal.polyline import Polyline
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -48,6 +48,37 @@ def test_set_epsilon():
     assert not pygonal.Vec2(0,0).almost_equals((0.01, 0))
 
 def test_direct_imports():
-	from pygonal import (Vec2, Point, Vec2Array, Seq2,
-		Affine, BoundingBox, Polygon)
+	from pygonal import (Vec2, Point, Vec2Array, Seq2, Polyline,
+		Affine, BoundingBox, BoxArray, Circle, Polygon, PolygonCollection,
+		PolygonWithHoles, MultiPolygon, KDTree, PropertyCache, GridVec2Array,
+		GridPolygon)
+
+def _imported_modules(statement):
+    import subprocess, sys
+    code = ('import sys\n%s\n'
+        'print(" ".join(m for m in sys.modules if m.startswith("pygonal")))'
+        % statement)
+    output = subprocess.check_output([sys.executable, '-c', code])
+    return set(output.decode('ascii').split())
+
+def test_lazy_imports():
+    import sys
+    if sys.version_info < (3, 7):
+        return
+    assert_equal(_imported_modules('import pygonal'), set(['pygonal']))
+    assert_equal(_imported_modules('from pygonal import Vec2'),
+        set(['pygonal', 'pygonal.vector', 'pygonal.util']))
+    assert 'pygonal.polygon' in _imported_modules('from pygonal import Polygon')
+
+def test_lazy_attributes():
+    import pygonal
+    assert pygonal.Point is pygonal.Vec2
+    for name in pygonal.__all__:
+        assert name in dir(pygonal)
+        getattr(pygonal, name)
+
+@raises(AttributeError)
+def test_missing_attribute():
+    import pygonal
+    pygonal.NoSuchName
 
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import math
+import unittest
+from pygonal.vector import Vec2
+from pygonal.simplify import (douglas_peucker, visvalingam_whyatt,
+    simplify, simplify_ring)
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""Line simplification unit tests"""
+
+
+class SimplifyTestCase(unittest.TestCase):
+    def test_douglas_peucker_endpoints(self):
+        self.assertEqual(douglas_peucker([], 1), [])
+        self.assertEqual(douglas_peucker([(0,0), (4,4)], 1),
+            [Vec2(0,0), Vec2(4,4)])
+        self.assertEqual(douglas_peucker([(0,0), (2,1), (4,0)], 2),
+            [Vec2(0,0), Vec2(4,0)])
+
+    def test_douglas_peucker_tolerance(self):
+        points = [(0,0), (1,0.5), (2,-0.5), (3,3), (4,0)]
+        self.assertEqual(douglas_peucker(points, 0.4), points)
+        self.assertEqual(douglas_peucker(points, 2),
+            [(0,0), (3,3), (4,0)])
+        self.assertEqual(douglas_peucker(points, 5), [(0,0), (4,0)])
+
+    def test_douglas_peucker_distance_to_segment(self):
+        # The point is beyond the end of the segment, not near it
+        points = [(0,0), (5,0.5), (-3,0), (1,0)]
+        self.assertEqual(douglas_peucker(points, 1), points)
+
+    def test_douglas_peucker_long_polyline(self):
+        points = [(i, math.sin(i / 10.0)) for i in range(20000)]
+        simple = douglas_peucker(iter(points), 0.01)
+        assert 3 < len(simple) < len(points)
+        self.assertEqual(simple[0], points[0])
+        self.assertEqual(simple[-1], points[-1])
+
+    def test_douglas_peucker_reuses_vec2(self):
+        points = [Vec2(0,0), Vec2(1,1), Vec2(3,0)]
+        simple = douglas_peucker(points, 0.1)
+        assert all(a is b for a, b in zip(points, simple))
+
+    def test_visvalingam_whyatt(self):
+        points = [(0,0), (1,0.1), (2,0), (3,2), (4,0)]
+        self.assertEqual(visvalingam_whyatt(points, 0.05), points)
+        self.assertEqual(visvalingam_whyatt(points, 1),
+            [(0,0), (2,0), (3,2), (4,0)])
+        self.assertEqual(visvalingam_whyatt(points, 100), [(0,0), (4,0)])
+
+    def test_visvalingam_whyatt_closed(self):
+        points = [(0,0), (1,0.1), (2,0), (2,2), (0,2)]
+        self.assertEqual(visvalingam_whyatt(points, 1, closed=True),
+            [(0,0), (2,0), (2,2), (0,2)])
+        self.assertEqual(len(visvalingam_whyatt(points, 100, True)), 3)
+
+    def test_simplify_method(self):
+        points = [(0,0), (1,0.1), (2,0)]
+        self.assertEqual(simplify(points, 1), [(0,0), (2,0)])
+        self.assertEqual(simplify(points, 1, 'visvalingam-whyatt'),
+            [(0,0), (2,0)])
+        with self.assertRaises(ValueError):
+            simplify(points, 1, 'bogus')
+        with self.assertRaises(ValueError):
+            simplify_ring(points, 1, 'bogus')
+
+    def test_simplify_ring_retains_split_vertex(self):
+        points = [(0,0), (1,0), (2,0), (2,1), (2,2), (1,2), (0,2), (0,1)]
+        self.assertEqual(simplify_ring(points, 0.1),
+            [(0,0), (2,0), (2,2), (0,2)])
+
+
+    def test_simplify_ring_collinear(self):
+        for points in ([(0,0), (1,1), (2,2), (3,3), (1.5,1.5)],
+                [(0,0), (0,0), (3,0), (1,0), (0,0)],
+                iter([(0,0), (2,0), (3,0), (1,0)])):
+            ring = simplify_ring(points, 0.5)
+            self.assertEqual(len(ring), 3)
+            self.assertEqual(len(set(ring)), 3)
+        with self.assertRaises(ValueError):
+            simplify_ring([(0,0), (1,1), (0,0), (1,1)], 0.5)
+        with self.assertRaises(ValueError):
+            simplify_ring([(2,2)] * 5, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
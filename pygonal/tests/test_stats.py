@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import unittest
+from pygonal import Polygon, stats
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""Algorithm statistics unit tests"""
+
+
+class StatsTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        stats.disable()
+        stats.reset()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(stats.enabled)
+        Polygon([(0,0), (1,0), (0,1)]).contains_point((0.1, 0.1))
+        self.assertEqual(stats.snapshot(), {'counts': {}, 'times': {}})
+
+    def test_enable_disable_reset(self):
+        stats.enable()
+        self.assertTrue(stats.enabled)
+        stats.count('a')
+        stats.count('a', 2)
+        stats.disable()
+        self.assertEqual(stats.snapshot()['counts'], {'a': 3})
+        stats.reset()
+        self.assertEqual(stats.snapshot()['counts'], {})
+
+    def test_timed(self):
+        @stats.timed('thing')
+        def thing(x):
+            return x * 2
+        self.assertEqual(thing(2), 4)
+        self.assertEqual(stats.snapshot()['times'], {})
+        stats.enable()
+        thing(1)
+        thing(2)
+        calls, seconds = stats.snapshot()['times']['thing']
+        self.assertEqual(calls, 2)
+        self.assertTrue(seconds >= 0.0)
+
+    def test_collecting(self):
+        stats.count('old')
+        with stats.collecting() as result:
+            self.assertTrue(stats.enabled)
+            self.assertEqual(result, {})
+        self.assertFalse(stats.enabled)
+        self.assertEqual(result, {'counts': {}, 'times': {}})
+
+    def test_contains_point_paths(self):
+        triangle = Polygon([(0,0), (1,0), (0,1)])
+        square = Polygon([(0,0), (1,0), (1,1), (0,1)])
+        concave = Polygon([(0,0), (4,0), (4,4), (2,1), (0,4)])
+        hexagon = Polygon.regular(6, 1)
+        with stats.collecting() as result:
+            triangle.contains_point((0.1, 0.1))
+            square.contains_point((0.5, 0.5))
+            concave.contains_point((1, 1))
+            concave.contains_point((5, 5))
+            hexagon.contains_point((0, 0))
+            hexagon.contains_point((3, 3))
+            assert square.is_convex
+            square.contains_point((0.5, 0.5))
+        self.assertEqual(result['counts'], {
+            'contains_point.triangle': 1,
+            'contains_point.winding': 2,
+            'contains_point.bbox_reject': 1,
+            'contains_point.radial_inside': 1,
+            'contains_point.radial_outside': 1,
+            'contains_point.y_monotone': 1,
+        })
+
+    def test_contains_points_batch(self):
+        poly = Polygon([(0, 0), (2, 0), (3, 1), (2, 2), (0, 2)])
+        with stats.collecting() as result:
+            poly.contains_points([(1, 1)] * 40)
+        self.assertEqual(result['counts'], {'contains_points.y_monotone': 40})
+        self.assertEqual(result['times']['classify'][0], 1)
+
+    def test_classify_cached(self):
+        poly = Polygon([(0,0), (2,0), (1,1), (2,2), (0,2)])
+        with stats.collecting() as result:
+            poly.is_convex
+            poly.is_convex
+            poly.is_simple
+            poly.is_simple
+        self.assertEqual(result['counts'],
+            {'is_convex.cached': 1, 'is_simple.cached': 1})
+        self.assertEqual(result['times']['classify'][0], 1)
+        self.assertEqual(result['times']['check_is_simple'][0], 1)
+
+    def test_tangents_and_hull(self):
+        circle = Polygon.regular(30, 10)
+        with stats.collecting() as result:
+            circle.tangents_to_point((20, 0))
+            Polygon([(0,0), (1,0), (1,1), (0,1), (0.5, 0.5)]).tangents_to_point(
+                (2, 2))
+            Polygon.convex_hull([(0,0), (1,0), (1,1), (0,1), (0.5, 0.5)])
+        counts = result['counts']
+        self.assertEqual(counts['tangents_to_point.convex'], 1)
+        self.assertEqual(counts['tangents_to_point.general'], 1)
+        self.assertTrue(counts['convex_hull.partition'] >= 1)
+        self.assertEqual(result['times']['convex_hull'][0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
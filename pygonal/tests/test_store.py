@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from pygonal import Affine, Polygon, PolygonCollection
+from pygonal.io import store
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""Polygon store unit tests"""
+
+
+class StoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'polygons.pyg')
+        self.polygons = [Polygon.regular(n, n, center=(n, 0))
+            for n in range(3, 12)]
+        self.polygons.append(Polygon([(0, 0), (4, 0), (4, 4), (2, 1), (0, 4)]))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_round_trip(self):
+        store.dump(self.polygons, self.path)
+        coll = store.load(self.path)
+        self.assertIsInstance(coll, PolygonCollection)
+        self.assertEqual(list(coll), self.polygons)
+        self.assertEqual(coll[4], self.polygons[4])
+
+    def test_zero_copy(self):
+        store.dump(self.polygons, self.path)
+        coll = store.load(self.path)
+        self.assertIsInstance(coll._coords, memoryview)
+        self.assertTrue(coll._coords.readonly)
+
+    def test_classified(self):
+        store.dump(PolygonCollection(self.polygons), self.path)
+        coll = store.load(self.path)
+        self.assertEqual([p.is_convex_known for p in coll],
+            [True] * len(self.polygons))
+        self.assertEqual([p.is_convex for p in coll], [True] * 9 + [False])
+        store.dump(self.polygons[-1:], self.path, classify=False)
+        coll = store.load(self.path)
+        self.assertFalse(coll[0].is_convex_known)
+        self.assertEqual(coll.classify(), [False])
+        self.assertTrue(coll[0].is_convex_known)
+
+    def test_batch_operations(self):
+        store.dump(self.polygons, self.path)
+        coll = store.load(self.path)
+        expected = PolygonCollection(self.polygons)
+        self.assertEqual(coll.bounding_boxes(), expected.bounding_boxes())
+        self.assertEqual(coll.areas(), expected.areas())
+        moved = coll.transform(Affine.translation((1, 2)))
+        self.assertEqual(list(moved),
+            list(expected.transform(Affine.translation((1, 2)))))
+
+    def test_float32(self):
+        store.dump(self.polygons, self.path, typecode='f')
+        size = os.path.getsize(self.path)
+        coll = store.load(self.path)
+        self.assertEqual(coll.typecode, 'f')
+        self.assertEqual(coll.classify(), [True] * 9 + [False])
+        for poly, stored in zip(self.polygons, coll):
+            for v1, v2 in zip(poly, stored):
+                assert v1.almost_equals(v2)
+        # Writing a loaded collection keeps its precision
+        path = os.path.join(self.dir, 'copy.pyg')
+        store.dump(coll, path)
+        self.assertEqual(os.path.getsize(path), size)
+        store.dump(coll, path, typecode='d')
+        self.assertEqual(store.load(path).typecode, 'd')
+        self.assertTrue(os.path.getsize(path) > size)
+
+    def test_file_objects(self):
+        fp = io.BytesIO()
+        store.dump(self.polygons, fp)
+        with open(self.path, 'wb') as f:
+            f.write(fp.getvalue())
+        with open(self.path, 'rb') as f:
+            coll = store.load(f)
+        self.assertEqual(list(coll), self.polygons)
+
+    def test_empty(self):
+        store.dump([], self.path)
+        self.assertEqual(len(store.load(self.path)), 0)
+
+    def test_invalid(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'PYG')
+        with self.assertRaises(ValueError):
+            store.load(self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b'NOTAPYGS' + bytes(16))
+        with self.assertRaises(ValueError):
+            store.load(self.path)
+        store.dump(self.polygons, self.path)
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        with open(self.path, 'wb') as f:
+            f.write(data[:-5])
+        with self.assertRaises(ValueError):
+            store.load(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
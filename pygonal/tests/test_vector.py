@@ -99,6 +99,12 @@ class Vec2BaseTestCase(object):
     def test_str(self):
         self.assertEqual(str(self.Vec2(-3.5, 4.446)), 'Vec2(-3.50, 4.45)')
 
+    def test_pickle(self):
+        import pickle
+        v = self.Vec2(1.5, -2)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(v, protocol)), v)
+
     def test_repr(self):
         self.assertEqual(repr(self.Vec2(-3.5, 4.444)), 'Vec2(-3.5, 4.444)')
 
@@ -597,6 +603,29 @@ class VectorSeqBaseTestCase(object):
         c[0] = (0,0.1)
         assert c[0] != p[0]
 
+    def test_pickle(self):
+        import pickle
+        a = self.VecSeq([(0,0), (1.5,0), (1,1), (0,-1)])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            b = pickle.loads(pickle.dumps(a, protocol))
+            assert isinstance(b, self.VecSeq)
+            self.assertEqual(b, a)
+            assert isinstance(b[0], self.Vec2)
+        self.assertEqual(pickle.loads(pickle.dumps(self.VecSeq([]))),
+            self.VecSeq([]))
+
+    def test_pickle_out_of_band(self):
+        import pickle
+        if pickle.HIGHEST_PROTOCOL < 5:
+            return
+        a = self.VecSeq([(x, -x) for x in range(100)])
+        buffers = []
+        data = pickle.dumps(a, 5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        assert len(data) < 200
+        b = pickle.loads(data, buffers=buffers)
+        self.assertEqual(b, a)
+
     def test_unhashable(self):
         with self.assertRaises(TypeError):
             hash(self.VecSeq([(3,2), (6,0)]))
@@ -856,6 +885,30 @@ class Vec2ArrayBaseTestCase(object):
         va.insert(1, (0,0))
         self.assertEqual(va.shortest(), self.Vec2(0,0))
 
+    def test_bounding_circle(self):
+        va = self.Vec2Array([(0,0), (2,0), (1,0.5)])
+        circle = va.bounding_circle()
+        assert circle.center.almost_equals((1, 0))
+        self.assertAlmostEqual(circle.radius, 1)
+
+    def test_simplified(self):
+        va = self.Vec2Array([(0,0), (1,0.01), (2,0), (3,5), (4,6), (5,7)])
+        for method in ('douglas-peucker', 'visvalingam-whyatt'):
+            simple = va.simplified(0.1, method=method)
+            assert isinstance(simple, self.Vec2Array)
+            self.assertEqual(tuple(simple), (self.Vec2(0,0), self.Vec2(2,0),
+                self.Vec2(3,5), self.Vec2(5,7)))
+        self.assertEqual(len(va), 6)
+
+    def test_simplified_short(self):
+        self.assertEqual(len(self.Vec2Array().simplified(1)), 0)
+        va = self.Vec2Array([(0,0), (1,1)])
+        self.assertEqual(tuple(va.simplified(10)), tuple(va))
+
+    def test_simplified_bad_method(self):
+        with self.assertRaises(ValueError):
+            self.Vec2Array([(0,0), (1,1), (2,0)]).simplified(1, method='x')
+
     def test_normalized(self):
         va1 = self.Vec2Array()
         va2 = va1.normalized()
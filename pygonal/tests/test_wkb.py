@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import io
+import struct
+import unittest
+from pygonal import (Vec2, Vec2Array, LineSegment, BoundingBox, Polygon,
+    PolygonCollection, PolygonWithHoles, MultiPolygon)
+from pygonal.io import wkb, MultiPoint, MultiLineString, Empty
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""WKB reader and writer unit tests"""
+
+
+def point_wkb(x, y, order='<'):
+    return (b'\x01' if order == '<' else b'\x00') + struct.pack(
+        order + 'Idd', wkb.POINT, x, y)
+
+def polygon_wkb(points, code=wkb.POLYGON, order='<', srid=None, extra=()):
+    dims = 2 + len(extra)
+    if srid is not None:
+        header = struct.pack(order + 'II', code | 0x20000000, srid)
+    else:
+        header = struct.pack(order + 'I', code)
+    ring = list(points) + [points[0]]
+    coords = []
+    for x, y in ring:
+        coords.extend((x, y) + tuple(extra))
+    return ((b'\x01' if order == '<' else b'\x00') + header
+        + struct.pack(order + 'II', 1, len(ring))
+        + struct.pack(order + '%dd' % (dims * len(ring)), *coords))
+
+
+class WKBTestCase(unittest.TestCase):
+
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+
+    def test_point(self):
+        self.assertEqual(wkb.loads(point_wkb(1.5, -2)), Vec2(1.5, -2))
+        self.assertEqual(wkb.loads(point_wkb(1.5, -2, '>')), Vec2(1.5, -2))
+        self.assertEqual(wkb.dumps(Vec2(1.5, -2)), point_wkb(1.5, -2))
+
+    def test_polygon(self):
+        poly = wkb.loads(polygon_wkb(self.square))
+        self.assertIsInstance(poly, Polygon)
+        self.assertEqual(list(poly), self.square)
+        self.assertEqual(wkb.dumps(Polygon(self.square)),
+            polygon_wkb(self.square))
+
+    def test_big_endian(self):
+        self.assertEqual(wkb.loads(polygon_wkb(self.square, order='>')),
+            Polygon(self.square))
+
+    def test_ewkb(self):
+        data = polygon_wkb(self.square, srid=4326)
+        self.assertEqual(wkb.loads(data), Polygon(self.square))
+        data = polygon_wkb(self.square, code=wkb.POLYGON | 0x80000000,
+            extra=(7,))
+        self.assertEqual(wkb.loads(data), Polygon(self.square))
+        data = polygon_wkb(self.square, code=wkb.POLYGON | 0xc0000000,
+            extra=(7, 8), srid=3857)
+        self.assertEqual(wkb.loads(data), Polygon(self.square))
+
+    def test_iso_dimensions(self):
+        for code, extra in [(1003, (1,)), (2003, (1,)), (3003, (1, 2))]:
+            data = polygon_wkb(self.square, code=code, extra=extra)
+            self.assertEqual(wkb.loads(data), Polygon(self.square))
+
+    def test_hex(self):
+        poly = Polygon(self.square)
+        text = wkb.dumps(poly, hex=True)
+        self.assertEqual(text, polygon_wkb(self.square).hex().upper())
+        self.assertEqual(wkb.loads(text), poly)
+
+    def test_round_trip(self):
+        geoms = [
+            Vec2Array([(0, 0), (1, 2), (3, 1)]),
+            Polygon.regular(7, 3),
+            PolygonCollection([Polygon(self.square),
+                Polygon([(0, 0), (1, 0), (0, 1)])]),
+            [Vec2(1, 2), Polygon(self.square)],
+            ]
+        for geom in geoms:
+            self.assertEqual(wkb.loads(wkb.dumps(geom)), geom)
+
+    def test_round_trip_float32(self):
+        polys = [Polygon([(0.1, 0.2), (1.3, 0.2), (0.1, 1.7)]),
+            Polygon.regular(6, 2.5)]
+        coll = PolygonCollection(polys, typecode='f')
+        data = wkb.dumps(coll)
+        self.assertEqual(len(data), len(wkb.dumps(PolygonCollection(polys))))
+        loaded = wkb.loads(data)
+        self.assertEqual(loaded.typecode, 'd')
+        self.assertEqual(list(loaded), list(coll))
+
+    def test_dump_other_shapes(self):
+        segment = LineSegment.from_points([(0, 0), (3, 4)])
+        self.assertEqual(wkb.loads(wkb.dumps(segment)),
+            Vec2Array([(0, 0), (3, 4)]))
+        box = BoundingBox([(0, 0), (2, 2)])
+        self.assertEqual(wkb.loads(wkb.dumps(box)), box.to_polygon())
+        with self.assertRaises(TypeError):
+            wkb.dumps(None)
+
+    def test_holes(self):
+        poly = PolygonWithHoles([(0, 0), (4, 0), (4, 4), (0, 4)],
+            [[(1, 1), (1, 2), (2, 2), (2, 1)], [(3, 3), (3, 3.5), (3.5, 3)]])
+        data = wkb.dumps(poly)
+        self.assertEqual(struct.unpack('<BII', data[:9]), (1, wkb.POLYGON, 3))
+        self.assertEqual(wkb.loads(data), poly)
+        multi = MultiPolygon([poly, Polygon(self.square)])
+        self.assertEqual(wkb.loads(wkb.dumps(multi)), multi)
+        # Without holes, multipolygons still load as collections
+        self.assertIsInstance(wkb.loads(wkb.dumps(
+            MultiPolygon([Polygon(self.square)]))), PolygonCollection)
+        with self.assertRaises(ValueError):
+            wkb.load_collection(data)
+
+    def test_multipoint(self):
+        data = (b'\x01' + struct.pack('<II', wkb.MULTIPOINT, 2)
+            + point_wkb(0, 1) + point_wkb(2, 3))
+        points = wkb.loads(data)
+        self.assertIsInstance(points, MultiPoint)
+        self.assertEqual(list(points), [(0, 1), (2, 3)])
+        self.assertEqual(wkb.dumps(points), data)
+
+    def test_multilinestring(self):
+        line = (b'\x01' + struct.pack('<IIdddd', wkb.LINESTRING, 2,
+            0, 0, 1, 1))
+        data = (b'\x01' + struct.pack('<II', wkb.MULTILINESTRING, 2)
+            + line + line)
+        lines = wkb.loads(data)
+        self.assertIsInstance(lines, MultiLineString)
+        self.assertEqual(lines, [Vec2Array([(0, 0), (1, 1)])] * 2)
+        self.assertEqual(wkb.dumps(lines), data)
+        self.assertEqual(wkb.dumps(MultiLineString()),
+            b'\x01' + struct.pack('<II', wkb.MULTILINESTRING, 0))
+
+    def test_empty(self):
+        # As written by PostGIS
+        point = '0101000000000000000000F87F000000000000F87F'
+        polygon = '010300000000000000'
+        self.assertEqual(wkb.loads(point), Empty('Point'))
+        self.assertEqual(wkb.loads(polygon), Empty('Polygon'))
+        self.assertEqual(wkb.dumps(Empty('Point'), hex=True), point)
+        self.assertEqual(wkb.dumps(Empty('Polygon'), hex=True), polygon)
+        self.assertEqual(wkb.loads(wkb.dumps(MultiPoint())), MultiPoint())
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            wkb.loads(b'\x02' + point_wkb(0, 0)[1:])
+        with self.assertRaises(ValueError):
+            wkb.loads(point_wkb(0, 0)[:-3])
+        with self.assertRaises(ValueError):
+            wkb.loads(b'\x01' + struct.pack('<I', 17))
+        with self.assertRaises(ValueError):
+            wkb.loads(polygon_wkb([(0, 0), (1, 1)]))
+        with self.assertRaises(ValueError):
+            wkb.loads(b'\x01' + struct.pack('<II', wkb.MULTIPOLYGON, 1)
+                + b'\x01' + struct.pack('<II', wkb.POLYGON, 0))
+        with self.assertRaises(ValueError):
+            wkb.loads(b'')
+
+    def test_stream(self):
+        polys = [Polygon.regular(n, n) for n in range(3, 10)]
+        fp = io.BytesIO()
+        for poly in polys:
+            wkb.dump(poly, fp)
+        fp.seek(0)
+        self.assertEqual(wkb.load(fp), polys[0])
+        self.assertEqual(list(wkb.iter_load(fp)), polys[1:])
+
+    def test_load_collection(self):
+        polys = [Polygon.regular(n, n) for n in range(3, 10)]
+        data = b''.join(wkb.dumps(p) for p in polys[:3]) + wkb.dumps(
+            PolygonCollection(polys[3:]))
+        coll = wkb.load_collection(io.BytesIO(data))
+        self.assertIsInstance(coll, PolygonCollection)
+        self.assertEqual(list(coll), polys)
+        self.assertEqual(wkb.load_collection(data), coll)
+        with self.assertRaises(ValueError):
+            wkb.load_collection(point_wkb(0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
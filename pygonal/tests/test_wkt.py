@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+import io
+import unittest
+from pygonal import (Vec2, Vec2Array, LineSegment, BoundingBox, Polygon,
+    PolygonCollection, PolygonWithHoles, MultiPolygon)
+from pygonal.io import wkt, MultiPoint, MultiLineString, Empty
+'''
+    Pygonal
+
+    (c) 2016 Copyright Rezart Qelibari <qelibarr@informatik.uni-freiburg.de>
+    Portions copyright (c) 2010 by Casey Duncan
+    Portions copyright (c) 2009 The Super Effective Team
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    See LICENSE.txt and CREDITS.txt
+'''
+"""WKT reader and writer unit tests"""
+
+
+class WKTTestCase(unittest.TestCase):
+
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+
+    def test_point(self):
+        self.assertEqual(wkt.loads('POINT (1.5 -2)'), Vec2(1.5, -2))
+        self.assertEqual(wkt.loads('point(1e3 .5)'), Vec2(1000, 0.5))
+        self.assertEqual(wkt.loads('POINT Z (1 2 3)'), Vec2(1, 2))
+        self.assertEqual(wkt.loads('POINT (1 2 3)'), Vec2(1, 2))
+        self.assertEqual(wkt.dumps(Vec2(1.5, -2)), 'POINT (1.5 -2.0)')
+
+    def test_linestring(self):
+        self.assertEqual(wkt.loads('LINESTRING (0 0, 1 2,3 1)'),
+            Vec2Array([(0, 0), (1, 2), (3, 1)]))
+        self.assertEqual(wkt.loads('LINESTRING ZM (0 0 5 6, 1 2 7 8)'),
+            Vec2Array([(0, 0), (1, 2)]))
+        self.assertEqual(wkt.loads('LINESTRING EMPTY'), Vec2Array())
+        segment = LineSegment.from_points([(0, 0), (3, 4)])
+        self.assertEqual(wkt.dumps(segment), 'LINESTRING (0.0 0.0, 3.0 4.0)')
+
+    def test_polygon(self):
+        text = 'POLYGON ((0 0, 2 0, 2 2, 0 2, 0 0))'
+        self.assertEqual(wkt.loads(text), Polygon(self.square))
+        self.assertEqual(wkt.loads('SRID=4326;' + text), Polygon(self.square))
+        self.assertEqual(wkt.loads(' polygon(( 0 0,2 0,2 2,0 2 )) '),
+            Polygon(self.square))
+        self.assertEqual(wkt.dumps(Polygon(self.square), 0), text)
+        box = BoundingBox([(0, 0), (2, 2)])
+        self.assertEqual(wkt.loads(wkt.dumps(box)), box.to_polygon())
+
+    def test_multi(self):
+        self.assertEqual(wkt.loads('MULTIPOINT ((1 2), (3 4))'),
+            MultiPoint([(1, 2), (3, 4)]))
+        self.assertEqual(wkt.loads('MULTIPOINT (1 2, 3 4)'),
+            MultiPoint([(1, 2), (3, 4)]))
+        self.assertEqual(wkt.dumps(MultiPoint([(1, 2), (3, 4)]), 0),
+            'MULTIPOINT ((1 2), (3 4))')
+        text = 'MULTILINESTRING ((0 0, 1 1), (2 2, 3 3))'
+        lines = wkt.loads(text)
+        self.assertIsInstance(lines, MultiLineString)
+        self.assertEqual(lines,
+            [Vec2Array([(0, 0), (1, 1)]), Vec2Array([(2, 2), (3, 3)])])
+        self.assertEqual(wkt.dumps(lines, 0), text)
+        coll = wkt.loads('MULTIPOLYGON (((0 0, 2 0, 2 2, 0 2, 0 0)), '
+            '((5 5, 6 5, 6 6, 5 5)))')
+        self.assertEqual(coll, PolygonCollection([Polygon(self.square),
+            Polygon([(5, 5), (6, 5), (6, 6)])]))
+        self.assertEqual(wkt.loads('MULTIPOLYGON EMPTY'), PolygonCollection())
+
+    def test_empty(self):
+        for text, geom in [
+                ('POINT EMPTY', Empty('Point')),
+                ('LINESTRING EMPTY', Vec2Array()),
+                ('POLYGON EMPTY', Empty('Polygon')),
+                ('MULTIPOINT EMPTY', MultiPoint()),
+                ('MULTILINESTRING EMPTY', MultiLineString()),
+                ('MULTIPOLYGON EMPTY', PolygonCollection()),
+                ('GEOMETRYCOLLECTION EMPTY', [])]:
+            self.assertEqual(wkt.loads(text), geom)
+            self.assertIs(type(wkt.loads(text)), type(geom))
+            self.assertEqual(wkt.dumps(geom), text)
+        self.assertEqual(wkt.loads('POINT Z EMPTY'), Empty('Point'))
+        self.assertEqual(wkt.loads('GEOMETRYCOLLECTION (POINT EMPTY, '
+            'POINT (1 2))'), [Empty('Point'), Vec2(1, 2)])
+
+    def test_holes(self):
+        text = ('POLYGON ((0 0, 4 0, 4 4, 0 4, 0 0), '
+            '(1 1, 1 2, 2 2, 2 1, 1 1))')
+        poly = wkt.loads(text)
+        self.assertEqual(poly, PolygonWithHoles(
+            [(0, 0), (4, 0), (4, 4), (0, 4)],
+            [[(1, 1), (1, 2), (2, 2), (2, 1)]]))
+        self.assertEqual(wkt.dumps(poly, 0), text)
+        multi = wkt.loads('MULTIPOLYGON (%s, ((5 5, 6 5, 6 6, 5 5)))'
+            % text[8:])
+        self.assertIsInstance(multi, MultiPolygon)
+        self.assertEqual(list(multi), [poly,
+            PolygonWithHoles([(5, 5), (6, 5), (6, 6)])])
+        self.assertEqual(wkt.loads(wkt.dumps(multi)), multi)
+        self.assertEqual(wkt.dumps(MultiPolygon()), 'MULTIPOLYGON EMPTY')
+
+    def test_geometry_collection(self):
+        geom = wkt.loads(
+            'GEOMETRYCOLLECTION (POINT (1 2), LINESTRING (0 0, 1 1))')
+        self.assertEqual(geom, [Vec2(1, 2), Vec2Array([(0, 0), (1, 1)])])
+        self.assertEqual(wkt.dumps(geom, 1),
+            'GEOMETRYCOLLECTION (POINT (1 2), LINESTRING (0 0, 1 1))')
+
+    def test_precision(self):
+        poly = Polygon([(0.123456, 10), (100.5, 0), (1, 1e-9)])
+        self.assertEqual(wkt.dumps(poly, 3), 'POLYGON ((0.123 10, '
+            '100.5 0, 1 0, 0.123 10))')
+        self.assertEqual(wkt.dumps(Vec2(100, 2.5), 0), 'POINT (100 2)')
+
+    def test_round_trip(self):
+        geoms = [
+            Vec2(0.1, 1 / 3),
+            Vec2Array([(0, 0), (1, 2), (3, 1)]),
+            Polygon.regular(7, 3),
+            PolygonCollection([Polygon(self.square),
+                Polygon([(0, 0), (1, 0), (0, 1)])]),
+            [Vec2(1, 2), Polygon(self.square)],
+            MultiPoint([(0, 0), (1, 2)]),
+            MultiLineString([Vec2Array([(0, 0), (1, 1)])]),
+            ]
+        for geom in geoms:
+            self.assertEqual(wkt.loads(wkt.dumps(geom)), geom)
+            self.assertIs(type(wkt.loads(wkt.dumps(geom))), type(geom))
+
+    def test_file(self):
+        fp = io.StringIO()
+        wkt.dump(Polygon(self.square), fp, precision=2)
+        fp.seek(0)
+        self.assertEqual(wkt.load(fp), Polygon(self.square))
+
+    def test_invalid(self):
+        for text in ['', 'POINT', 'POINT (1)', 'POINT (1 2', 'POINT (1 2) x',
+            'CIRCLE (1 2)', 'POLYGON ((0 0, 1 1, 0 0))', 'CIRCLE EMPTY',
+            'POLYGON ((0 0, 1 0, 0 1), (0 0, 1 1, 0 0))',
+            'LINESTRING (0 0, 1 1 1)', 'POINT (a b)', 'LINESTRING (0 0; 1 1)']:
+            with self.assertRaises(ValueError):
+                wkt.loads(text)
+        with self.assertRaises(TypeError):
+            wkt.dumps(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -23,6 +23,7 @@
 '''
 from __future__ import division
 import math
+from array import array
 import pygonal
 from pygonal.util import cached_property, assert_unorderable, cos_sin_deg
 
@@ -39,6 +40,9 @@ class Vec2(tuple):
     def __new__(self, x, y):
         return tuple.__new__(Vec2, ((x * 1.0, y * 1.0)))
 
+    def __reduce__(self):
+        return (Vec2, tuple(self))
+
     @classmethod
     def polar(cls, angle, length=1.0):
         """Create a vector from polar coordinates.
@@ -543,6 +547,45 @@ class Seq2(object):
     def __hash__(self):
         raise TypeError("unhashable type: %s" % self.__class__.__name__)
 
+    def __reduce_ex__(self, protocol):
+        return (_unpickle_seq2,
+            (self.__class__, _pack_vectors(self._vectors, protocol)))
+
+
+def _pack_vectors(vectors, protocol):
+    """Pack vectors into a single buffer of interleaved coordinates for
+    pickling. With pickle protocol 5 or higher, the buffer can be
+    transferred out-of-band.
+    """
+    coords = array('d')
+    for x, y in vectors:
+        coords.append(x)
+        coords.append(y)
+    if protocol >= 5:
+        # Imported here, pickle is expensive to import and is already
+        # loaded whenever this is called
+        import pickle
+        if hasattr(pickle, 'PickleBuffer'):
+            return pickle.PickleBuffer(coords)
+    return coords
+
+
+def _unpack_vectors(data):
+    """Return a list of vectors from a buffer created by _pack_vectors()
+    """
+    if not isinstance(data, array):
+        coords = array('d')
+        coords.frombytes(memoryview(data).cast('B'))
+        data = coords
+    new = tuple.__new__
+    return [new(Vec2, (data[i], data[i + 1])) for i in range(0, len(data), 2)]
+
+
+def _unpickle_seq2(cls, data):
+    seq = cls.__new__(cls)
+    seq._vectors = _unpack_vectors(data)
+    return seq
+
 
 class Vec2Array(Seq2):
     """Sequence of 2D vectors for batch operations"""
@@ -614,6 +657,29 @@ class Vec2Array(Seq2):
                     min_len = len
         return shortest
 
+    def simplified(self, tolerance, method='douglas-peucker'):
+        """Create a new array containing a simplified polyline with a
+        subset of the vectors in this array. The first and last vectors
+        are always retained.
+
+        :param tolerance: Distance tolerance for ``'douglas-peucker'``,
+            or minimum effective triangle area for ``'visvalingam-whyatt'``.
+        :type tolerance: float
+        :param method: The simplification algorithm, either
+            ``'douglas-peucker'`` or ``'visvalingam-whyatt'``.
+        :rtype: Vec2Array
+        """
+        from pygonal.simplify import simplify
+        return self.from_points(simplify(self._vectors, tolerance, method))
+
+    def bounding_circle(self):
+        """Compute the minimum enclosing circle of the vectors in the
+        array, treated as points. The expected runtime complexity is O(n).
+
+        :rtype: :class:`~pygonal.Circle`
+        """
+        return pygonal.Circle.from_points(self._vectors)
+
     def normalized(self):
         """Create a new array containing normalized vectors calculated
         from this array.
@@ -28,7 +28,8 @@ setup(
     packages=find_packages(),
     keywords='2d planar geometry',
     install_requires=[],
-    extras_require={'dev': ['pep8>=1.7.0']},
+    extras_require={'dev': ['pep8>=1.7.0', 'nose>=1.3.7']},
+    tests_require=['nose>=1.3.7'],
     test_suite="pygonal.tests",
     # See https://pypi.python.org/pypi?%3Aaction=list_classifiers
     classifiers=[